@@ -0,0 +1,13 @@
+"""Benchmarks do sistema PetroBahia.
+
+Execute a partir de repo_petrobahia/:
+    python -m benchmarks --help
+"""
+
+import sys
+from pathlib import Path
+
+# Os benchmarks importam os módulos de src/ da mesma forma que os testes
+src_path = Path(__file__).resolve().parent.parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
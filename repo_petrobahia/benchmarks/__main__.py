@@ -0,0 +1,44 @@
+"""Executa a suíte de benchmarks e grava os resultados em JSON.
+
+Exemplos:
+    python -m benchmarks
+    python -m benchmarks --suite pricing --sizes 1000 100000 --output base.json
+    python -m benchmarks --compare base.json
+"""
+
+import argparse
+import importlib
+
+from benchmarks.data import DEFAULT_SEED
+from benchmarks.harness import format_table, load_results, save_results
+
+SUITES = ("pricing", "orders", "repository")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmarks do PetroBahia."
+    )
+    parser.add_argument("--suite", choices=SUITES, action="append", dest="suites")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="arquivo JSON para gravar os resultados")
+    parser.add_argument("--compare", help="JSON de uma execução anterior")
+    args = parser.parse_args(argv)
+
+    results = []
+    for suite in args.suites or SUITES:
+        module = importlib.import_module(f"benchmarks.{suite}")
+        results.extend(module.run(args.sizes, args.repeat, args.seed))
+
+    baseline = load_results(args.compare) if args.compare else []
+    print(format_table(results, baseline))
+
+    if args.output:
+        save_results(args.output, results, args.seed)
+        print(f"\nResultados gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
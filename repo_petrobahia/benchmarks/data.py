@@ -0,0 +1,52 @@
+"""Geradores determinísticos de dados sintéticos para os benchmarks."""
+
+import random
+from typing import List
+
+from domain.entities import Client, OrderItem
+
+DEFAULT_SEED = 20240601
+TIERS = ("gold", "silver", "bronze", "standard")
+DOMAINS = ("petrobahia.com", "email.com", "empresa.com.br")
+
+
+def make_clients(count: int, seed: int = DEFAULT_SEED) -> List[Client]:
+    """Gera clientes com emails únicos e níveis variados."""
+    rng = random.Random(seed)
+    return [
+        Client(
+            name=f"Cliente {i}",
+            email=f"cliente{i}@{rng.choice(DOMAINS)}",
+            tier=rng.choice(TIERS),
+        )
+        for i in range(count)
+    ]
+
+
+def make_items(count: int, seed: int = DEFAULT_SEED) -> List[OrderItem]:
+    """Gera itens com preços de duas casas decimais."""
+    rng = random.Random(seed)
+    return [
+        OrderItem(name=f"Produto {i}", price=round(rng.uniform(1, 500), 2))
+        for i in range(count)
+    ]
+
+
+def make_carts(
+    count: int, max_items: int = 15, seed: int = DEFAULT_SEED
+) -> List[List[OrderItem]]:
+    """Gera carrinhos com entre 1 e max_items itens."""
+    rng = random.Random(seed)
+    return [
+        make_items(rng.randint(1, max_items), seed=rng.randrange(2**32))
+        for _ in range(count)
+    ]
+
+
+def write_clients_file(path: str, count: int, seed: int = DEFAULT_SEED) -> None:
+    """Grava um arquivo no formato de clientes.txt com count clientes."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(
+            f"{client.name},{client.email},{client.tier}\n"
+            for client in make_clients(count, seed)
+        )
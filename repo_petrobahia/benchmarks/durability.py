@@ -0,0 +1,50 @@
+"""Mede gravações por segundo do FileClientRepository em cada política.
+
+Uso:
+    python -m benchmarks.durability --writes 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.data import make_clients
+from infrastructure.repositories import DurabilityPolicy, FileClientRepository
+
+MODES = (
+    ("sem buffer, sem fsync", False, DurabilityPolicy.NONE),
+    ("sem buffer, fsync por gravação", False, DurabilityPolicy.WRITE),
+    ("buffer, sem fsync", True, DurabilityPolicy.NONE),
+    ("buffer, fsync por lote", True, DurabilityPolicy.BATCH),
+    ("buffer, fsync por gravação", True, DurabilityPolicy.WRITE),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=5000)
+    parser.add_argument("--flush-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    clients = make_clients(args.writes)
+    print(f"{args.writes} gravações (flush_size={args.flush_size} bytes):")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (label, buffered, durability) in enumerate(MODES):
+            path = os.path.join(directory, f"clientes_{index}.txt")
+            start = time.perf_counter()
+            with FileClientRepository(
+                path,
+                buffered=buffered,
+                durability=durability,
+                flush_size=args.flush_size,
+            ) as repo:
+                for client in clients:
+                    repo.save(client)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<32} {args.writes / elapsed:>12,.0f} gravações/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Medição de tempo e memória dos benchmarks."""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, List
+
+
+@dataclass
+class BenchmarkResult:
+    """Resultado de um benchmark para um tamanho de entrada."""
+
+    suite: str
+    name: str
+    size: int
+    operations: int
+    best_seconds: float
+    ops_per_second: float
+    peak_memory_bytes: int
+
+
+def measure(
+    suite: str,
+    name: str,
+    size: int,
+    func: Callable[[], object],
+    operations: int,
+    repeat: int = 5,
+) -> BenchmarkResult:
+    """
+    Mede func: o melhor tempo entre repeat execuções e o pico de memória.
+
+    A memória é medida em uma execução separada, pois o tracemalloc deixa o
+    código bem mais lento e distorceria os tempos.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return BenchmarkResult(
+        suite=suite,
+        name=name,
+        size=size,
+        operations=operations,
+        best_seconds=best,
+        ops_per_second=operations / best if best > 0 else float("inf"),
+        peak_memory_bytes=peak,
+    )
+
+
+def save_results(path: str, results: List[BenchmarkResult], seed: int) -> None:
+    """Grava os resultados e o ambiente de execução em JSON."""
+    payload = {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    """Lê resultados gravados por save_results."""
+    with open(path, "r", encoding="utf-8") as file:
+        payload = json.load(file)
+    return [BenchmarkResult(**result) for result in payload["results"]]
+
+
+def format_table(
+    results: List[BenchmarkResult], baseline: List[BenchmarkResult] = ()
+) -> str:
+    """Formata os resultados, com a razão de velocidade frente a uma base."""
+    reference = {(r.suite, r.name, r.size): r for r in baseline}
+    lines = [
+        f"{'suite':<12} {'benchmark':<48} {'tamanho':>9} {'ops/s':>14} "
+        f"{'pico (KiB)':>11} {'vs base':>8}"
+    ]
+    for result in results:
+        previous = reference.get((result.suite, result.name, result.size))
+        ratio = (
+            f"{result.ops_per_second / previous.ops_per_second:7.2f}x"
+            if previous
+            else ""
+        )
+        lines.append(
+            f"{result.suite:<12} {result.name:<48} {result.size:>9} "
+            f"{result.ops_per_second:>14,.0f} "
+            f"{result.peak_memory_bytes / 1024:>11,.1f} {ratio:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,53 @@
+"""Mede a memória por linha de diferentes representações de clientes.
+
+Uso:
+    python -m benchmarks.memory_per_row --rows 1000000
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import make_dataclass
+
+from domain.entities import Client
+from infrastructure.client_table import ClientTable
+
+TIERS = ("gold", "silver", "bronze")
+
+# Equivalente ao Client sem __slots__, como referência
+DictClient = make_dataclass("DictClient", ["name", "email", "tier"])
+
+
+def _rows(count: int):
+    for i in range(count):
+        yield f"Cliente {i}", f"cliente{i}@petrobahia.com", TIERS[i % len(TIERS)]
+
+
+def _measure(build, count: int) -> float:
+    """Retorna os bytes alocados por linha pela estrutura construída."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    container = build(count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    layouts = {
+        "dataclass com __dict__": lambda n: [DictClient(*row) for row in _rows(n)],
+        "Client com __slots__": lambda n: [Client(*row) for row in _rows(n)],
+        "ClientTable": lambda n: ClientTable(Client(*row) for row in _rows(n)),
+    }
+
+    print(f"Memória por linha ({args.rows} clientes):")
+    for label, build in layouts.items():
+        print(f"  {label:<24} {_measure(build, args.rows):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
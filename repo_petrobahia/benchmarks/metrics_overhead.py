@@ -0,0 +1,44 @@
+"""Mede o custo da instrumentação com métricas em ProcessOrderUseCase.execute.
+
+Uso:
+    python -m benchmarks.metrics_overhead --calls 200000
+"""
+
+import argparse
+import time
+
+from benchmarks.data import make_carts, make_clients
+from services.discount import TierDiscountCalculator
+from services.metrics import METRICS
+from use_cases.order_processing import ProcessOrderUseCase
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    use_case = ProcessOrderUseCase(TierDiscountCalculator())
+    orders = list(zip(make_clients(1000), make_carts(1000, max_items=3)))
+
+    def run():
+        start = time.perf_counter()
+        for index in range(args.calls):
+            client, items = orders[index % len(orders)]
+            use_case.execute(client, items)
+        return (time.perf_counter() - start) / args.calls * 1e9
+
+    # Desabilitadas, a classe usa a função original, sem nenhum invólucro
+    METRICS.disable()
+    disabled = run()
+    METRICS.enable()
+    enabled = run()
+    METRICS.disable()
+
+    print(f"{args.calls} chamadas de ProcessOrderUseCase.execute (ns por chamada):")
+    print(f"  {'métricas desabilitadas':<24} {disabled:>8.0f}")
+    print(f"  {'métricas ativas':<24} {enabled:>8.0f}  (+{enabled - disabled:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmarks do processamento e resumo de pedidos: legado e casos de uso."""
+
+import os
+import tempfile
+from functools import partial
+from typing import List
+
+from benchmarks.data import make_carts, make_clients
+from benchmarks.harness import BenchmarkResult, measure
+from legacy.order_service import OrderService
+from services.discount import TierDiscountCalculator
+from use_cases.order_processing import GenerateOrderSummaryUseCase, ProcessOrderUseCase
+
+SUITE = "orders"
+
+
+def run(sizes: List[int], repeat: int, seed: int) -> List[BenchmarkResult]:
+    """Mede o processamento, o resumo e a exportação de `size` pedidos."""
+    legacy_service = OrderService()
+    process_order = ProcessOrderUseCase(TierDiscountCalculator())
+    generate_summary = GenerateOrderSummaryUseCase()
+    results = []
+
+    def run_legacy(legacy_orders):
+        for client, items in legacy_orders:
+            order = legacy_service.process_order(client, items)
+            legacy_service.generate_order_summary(order)
+
+    def run_use_cases(orders):
+        for client, items in orders:
+            generate_summary.execute(process_order.execute(client, items))
+
+    def run_export(orders, path):
+        # Pedidos gerados sob demanda: o pico de memória não deve crescer
+        generate_summary.write_many(
+            (process_order.execute(client, items) for client, items in orders),
+            path,
+        )
+
+    def run_parallel(orders):
+        process_order.execute_parallel(orders, min_parallel_size=0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            clients = make_clients(size, seed=seed)
+            carts = make_carts(size, seed=seed)
+            legacy_orders = [
+                (
+                    {"name": client.name, "tier": client.tier},
+                    [{"name": item.name, "price": item.price} for item in cart],
+                )
+                for client, cart in zip(clients, carts)
+            ]
+            orders = list(zip(clients, carts))
+            export_path = os.path.join(directory, f"resumos_{size}.txt")
+
+            for name, func in (
+                ("legacy.OrderService", partial(run_legacy, legacy_orders)),
+                ("ProcessOrder+GenerateSummary", partial(run_use_cases, orders)),
+                (
+                    "GenerateOrderSummary.write_many",
+                    partial(run_export, orders, export_path),
+                ),
+                ("ProcessOrderUseCase.execute_parallel", partial(run_parallel, orders)),
+            ):
+                results.append(
+                    measure(SUITE, name, size, func, operations=size, repeat=repeat)
+                )
+
+    return results
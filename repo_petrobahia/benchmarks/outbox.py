@@ -0,0 +1,84 @@
+"""Mede o registro de clientes com envio de email na hora versus caixa de saída.
+
+Registra os mesmos clientes, um a um com execute, enviando as boas-vindas
+por SMTP na hora (a um LocalSmtpServer com a latência de --latency-ms) ou
+guardando-as na caixa de saída em SQLite. Depois mede o despachante
+drenando a caixa em lotes pelo mesmo SMTP.
+
+Uso:
+    python -m benchmarks.outbox --clients 500 --latency-ms 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.data import make_clients
+from infrastructure.local_smtp import LocalSmtpServer
+from infrastructure.outbox import OutboxDispatcher, SqliteEmailOutbox
+from infrastructure.repositories import FileClientRepository
+from infrastructure.smtp import SmtpEmailSender
+from services.validation import ClientValidator, EmailValidator
+from use_cases.client_management import RegisterClientUseCase
+
+FROM_ADDRESS = "naoresponda@petrobahia.com"
+
+
+def _register(use_case: RegisterClientUseCase, clients) -> float:
+    """Registra os clientes um a um e retorna os segundos gastos."""
+    start = time.perf_counter()
+    for client in clients:
+        use_case.execute(client)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    clients = make_clients(args.clients)
+    validator = ClientValidator(EmailValidator())
+    print(
+        f"{args.clients:,} registros, latência simulada de "
+        f"{args.latency_ms:g} ms por ida e volta do SMTP:"
+    )
+
+    with tempfile.TemporaryDirectory() as directory, LocalSmtpServer(
+        latency=args.latency_ms / 1000
+    ) as server, SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+        use_case = RegisterClientUseCase(
+            FileClientRepository(os.path.join(directory, "inline.txt")),
+            validator,
+            email_sender=sender,
+        )
+        seconds = _register(use_case, clients)
+        print(f"  {'envio na hora':<28} {args.clients / seconds:>9,.0f} registros/s")
+
+        with SqliteEmailOutbox(os.path.join(directory, "outbox.db")) as outbox:
+            use_case = RegisterClientUseCase(
+                FileClientRepository(os.path.join(directory, "outbox.txt")),
+                validator,
+                outbox=outbox,
+            )
+            seconds = _register(use_case, clients)
+            print(
+                f"  {'caixa de saída':<28} {args.clients / seconds:>9,.0f} registros/s"
+            )
+
+            dispatcher = OutboxDispatcher(outbox, sender, batch_size=args.batch_size)
+            start = time.perf_counter()
+            while dispatcher.dispatch_once():
+                pass
+            seconds = time.perf_counter() - start
+            print(
+                f"  {'despachante (em lotes)':<28} "
+                f"{args.clients / seconds:>9,.0f} emails/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
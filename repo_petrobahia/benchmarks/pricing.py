@@ -0,0 +1,127 @@
+"""Benchmarks do cálculo de preço final: legado, caso de uso e lote.
+
+Compara o cálculo em float com o exato em centavos (Money) e com uma
+implementação de referência em Decimal, como a usada na conciliação.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import List
+
+from benchmarks.data import make_carts
+from benchmarks.harness import BenchmarkResult, measure
+from legacy.price_calculator import calculate_final_price
+from services.discount import QuantityDiscountCalculator
+from services.tax import TaxCalculator
+from use_cases.price_calculation import CalculateFinalPriceUseCase
+
+SUITE = "pricing"
+
+_CENT = Decimal("0.01")
+
+
+def decimal_final_price(prices: List[float], tax_rate: Decimal) -> Decimal:
+    """Preço final calculado inteiramente em Decimal (referência exata)."""
+    subtotal = sum(Decimal(repr(price)) for price in prices)
+    quantity = len(prices)
+    if quantity >= 10:
+        subtotal *= Decimal("0.8")
+    elif quantity >= 5:
+        subtotal *= Decimal("0.9")
+    return (subtotal * (1 + tax_rate)).quantize(_CENT, rounding=ROUND_HALF_EVEN)
+
+
+def run(sizes: List[int], repeat: int, seed: int) -> List[BenchmarkResult]:
+    """Mede o preço final de `size` carrinhos por cada implementação."""
+    use_case = CalculateFinalPriceUseCase(
+        QuantityDiscountCalculator(), TaxCalculator(tax_rate=0.10)
+    )
+    results = []
+
+    for size in sizes:
+        carts = make_carts(size, seed=seed)
+        legacy_carts = [
+            [{"name": item.name, "price": item.price} for item in cart]
+            for cart in carts
+        ]
+        prices = [item.price for cart in carts for item in cart]
+        offsets = [0]
+        for cart in carts:
+            offsets.append(offsets[-1] + len(cart))
+        cart_prices = [[item.price for item in cart] for cart in carts]
+        tax_rate = Decimal("0.10")
+
+        results.append(
+            measure(
+                SUITE,
+                "legacy.calculate_final_price",
+                size,
+                lambda carts=legacy_carts: [
+                    calculate_final_price(cart) for cart in carts
+                ],
+                operations=size,
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "CalculateFinalPriceUseCase.execute",
+                size,
+                lambda carts=carts: [use_case.execute(cart) for cart in carts],
+                operations=size,
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "CalculateFinalPriceUseCase.execute_exact",
+                size,
+                lambda carts=carts: [use_case.execute_exact(cart) for cart in carts],
+                operations=size,
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "Decimal (referência)",
+                size,
+                lambda carts=cart_prices, rate=tax_rate: [
+                    decimal_final_price(p, rate) for p in carts
+                ],
+                operations=size,
+                repeat=repeat,
+            )
+        )
+
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError:
+            continue
+        results.append(
+            measure(
+                SUITE,
+                "CalculateFinalPriceUseCase.execute_batch",
+                size,
+                lambda prices=prices, offsets=offsets: (
+                    use_case.execute_batch(prices, offsets)
+                ),
+                operations=size,
+                repeat=repeat,
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "CalculateFinalPriceUseCase.execute_exact_batch",
+                size,
+                lambda prices=prices, offsets=offsets: (
+                    use_case.execute_exact_batch(prices, offsets)
+                ),
+                operations=size,
+                repeat=repeat,
+            )
+        )
+
+    return results
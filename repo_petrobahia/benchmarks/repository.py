@@ -0,0 +1,130 @@
+"""Benchmarks do repositório de clientes em arquivo conforme o tamanho."""
+
+import itertools
+import os
+import tempfile
+from typing import List
+
+from benchmarks.data import write_clients_file
+from benchmarks.harness import BenchmarkResult, measure
+from domain.entities import Client
+from infrastructure.repositories import FileClientRepository
+from legacy.clients import load_clients
+
+SUITE = "repository"
+PAGE_SIZE = 100
+
+
+def run(sizes: List[int], repeat: int, seed: int) -> List[BenchmarkResult]:
+    """Mede leitura, verificação e gravação em arquivos de `size` linhas."""
+    results = []
+    unique = itertools.count()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"clientes_{size}.txt")
+            write_clients_file(path, size, seed=seed)
+
+            def save_new_client(path=path):
+                # Repositório novo a cada execução: inclui a montagem do índice
+                email = f"novo{next(unique)}@petrobahia.com"
+                FileClientRepository(path).save(Client("Novo", email, "gold"))
+
+            results.append(
+                measure(
+                    SUITE,
+                    "legacy.load_clients",
+                    size,
+                    lambda path=path: load_clients(path),
+                    operations=size,
+                    repeat=repeat,
+                )
+            )
+            results.append(
+                measure(
+                    SUITE,
+                    "FileClientRepository.load_all",
+                    size,
+                    lambda path=path: FileClientRepository(path).load_all(),
+                    operations=size,
+                    repeat=repeat,
+                )
+            )
+            # Mesmo repositório entre execuções: mede o acerto do cache
+            warm_repository = FileClientRepository(path)
+            warm_repository.load_all()
+            results.append(
+                measure(
+                    SUITE,
+                    "FileClientRepository.load_all (cache)",
+                    size,
+                    warm_repository.load_all,
+                    operations=size,
+                    repeat=repeat,
+                )
+            )
+            # Segmento de um nível: varredura completa versus índice secundário
+            results.append(
+                measure(
+                    SUITE,
+                    "load_all + filtro por nível (cache)",
+                    size,
+                    lambda repo=warm_repository: [
+                        c for c in repo.load_all() if c.tier == "gold"
+                    ],
+                    operations=size,
+                    repeat=repeat,
+                )
+            )
+            warm_repository.find_by_tier("gold")
+            results.append(
+                measure(
+                    SUITE,
+                    "FileClientRepository.find_by_tier (cache)",
+                    size,
+                    lambda repo=warm_repository: repo.find_by_tier("gold"),
+                    operations=size,
+                    repeat=repeat,
+                )
+            )
+            # Página do meio do arquivo, em repositório novo: o índice de
+            # páginas gravado no disco versus ler o arquivo inteiro
+            middle = size // 2
+            with FileClientRepository(path) as indexer:
+                indexer.count()
+            results.append(
+                measure(
+                    SUITE,
+                    "load_all + página do meio (frio)",
+                    size,
+                    lambda path=path, middle=middle: FileClientRepository(
+                        path
+                    ).load_all()[middle : middle + PAGE_SIZE],
+                    operations=PAGE_SIZE,
+                    repeat=repeat,
+                )
+            )
+            results.append(
+                measure(
+                    SUITE,
+                    "FileClientRepository.load_page (frio)",
+                    size,
+                    lambda path=path, middle=middle: FileClientRepository(
+                        path
+                    ).load_page(middle, PAGE_SIZE),
+                    operations=PAGE_SIZE,
+                    repeat=repeat,
+                )
+            )
+            results.append(
+                measure(
+                    SUITE,
+                    "FileClientRepository.save (frio)",
+                    size,
+                    save_new_client,
+                    operations=1,
+                    repeat=repeat,
+                )
+            )
+
+    return results
@@ -0,0 +1,99 @@
+"""Mede a vazão do SmtpEmailSender: conexão por mensagem versus pool.
+
+Cada cenário envia as mesmas mensagens a um LocalSmtpServer que simula a
+latência da rede (cada leva de respostas espera --latency-ms). Os cenários
+vão de uma conexão nova por mensagem, sem pipelining, até o pool com
+pipelining alimentado por um QueuedEmailSender com vários workers.
+
+Uso:
+    python -m benchmarks.smtp --messages 2000 --latency-ms 1
+"""
+
+import argparse
+import time
+
+from domain.entities import EmailMessage
+from infrastructure.local_smtp import LocalSmtpServer
+from infrastructure.smtp import SmtpEmailSender
+from services.email import QueuedEmailSender
+
+FROM_ADDRESS = "naoresponda@petrobahia.com"
+
+
+def _messages(count: int) -> list[EmailMessage]:
+    """Mensagens de boas-vindas sintéticas."""
+    return [
+        EmailMessage(
+            to=f"cliente{i}@petrobahia.com",
+            subject="Bem-vindo à PetroBahia!",
+            body=f"Olá Cliente {i},\n\nObrigado por se registrar!",
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    messages = _messages(args.messages)
+    batches = [
+        messages[start : start + args.batch_size]
+        for start in range(0, len(messages), args.batch_size)
+    ]
+
+    def per_message(sender):
+        for message in messages:
+            sender.send(message.to, message.subject, message.body)
+
+    def in_batches(sender):
+        for batch in batches:
+            sender.send_many(batch)
+
+    def queued(sender):
+        with QueuedEmailSender(
+            sender, workers=args.workers, batch_size=args.batch_size
+        ) as queue:
+            queue.send_many(messages)
+
+    scenarios = (
+        (
+            "conexão por mensagem",
+            {"pool_size": 1, "max_messages_per_session": 1, "pipelining": False},
+            per_message,
+        ),
+        ("pool, sem pipelining", {"pool_size": 1, "pipelining": False}, in_batches),
+        ("pool, com pipelining", {"pool_size": 1}, in_batches),
+        (
+            f"pool + fila ({args.workers} workers)",
+            {"pool_size": args.workers},
+            queued,
+        ),
+    )
+
+    print(
+        f"{args.messages:,} mensagens, latência simulada de "
+        f"{args.latency_ms:g} ms por ida e volta:"
+    )
+    for label, options, send in scenarios:
+        with LocalSmtpServer(latency=args.latency_ms / 1000) as server:
+            with SmtpEmailSender(
+                server.host, server.port, FROM_ADDRESS, **options
+            ) as sender:
+                start = time.perf_counter()
+                send(sender)
+                seconds = time.perf_counter() - start
+            assert len(server.messages) == args.messages
+            print(
+                f"  {label:<28} {args.messages / seconds:>9,.0f} msg/s  "
+                f"{server.connections:>5} conexões  "
+                f"{server.round_trips:>6} idas e voltas"
+            )
+
+
+if __name__ == "__main__":
+    main()
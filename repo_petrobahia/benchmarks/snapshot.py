@@ -0,0 +1,88 @@
+"""Mede o início a frio do arquivo de clientes: CSV completo versus snapshot.
+
+Para cada tamanho, grava um CSV sintético, mede load_all sobre ele, grava o
+snapshot binário, acrescenta uma cauda de linhas ao CSV e mede load_table
+(snapshot via mmap mais a cauda reaplicada) e o acesso aleatório por linha.
+
+Uso:
+    python -m benchmarks.snapshot --rows 1000000 10000000
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+
+from infrastructure.repositories import FileClientRepository
+
+TIERS = ("gold", "silver", "bronze", "standard")
+
+
+def _write_rows(path: str, start: int, count: int) -> None:
+    """Acrescenta count clientes sintéticos ao CSV, sem criar entidades."""
+    with open(path, "a", encoding="utf-8") as file:
+        file.writelines(
+            f"Cliente {i},cliente{i}@petrobahia.com,{TIERS[i % len(TIERS)]}\n"
+            for i in range(start, start + count)
+        )
+
+
+def _timed(func):
+    """Executa func e retorna (resultado, segundos)."""
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument(
+        "--tail", type=float, default=0.01, help="fração de linhas após o snapshot"
+    )
+    parser.add_argument(
+        "--load-all-limit",
+        type=int,
+        default=2_000_000,
+        help="acima disso load_all não é medido (memória)",
+    )
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            path = os.path.join(directory, f"clientes_{rows}.txt")
+            _write_rows(path, 0, rows)
+            size_mb = os.path.getsize(path) / 1e6
+            print(f"{rows:,} linhas ({size_mb:,.0f} MB de CSV):")
+
+            if rows <= args.load_all_limit:
+                clients, seconds = _timed(FileClientRepository(path).load_all)
+                print(f"  {'load_all (CSV inteiro)':<32} {seconds:>9.2f} s")
+                del clients
+            else:
+                print(f"  {'load_all (CSV inteiro)':<32} {'pulado':>11}")
+
+            snapshot_path, seconds = _timed(FileClientRepository(path).snapshot)
+            snapshot_mb = os.path.getsize(snapshot_path) / 1e6
+            print(f"  {'snapshot()':<32} {seconds:>9.2f} s  ({snapshot_mb:,.0f} MB)")
+
+            tail = int(rows * args.tail)
+            _write_rows(path, rows, tail)
+            table, seconds = _timed(FileClientRepository(path).load_table)
+            label = f"load_table (+{tail:,} na cauda)"
+            print(f"  {label:<32} {seconds:>9.2f} s")
+
+            indexes = [rng.randrange(len(table)) for _ in range(args.lookups)]
+            _, seconds = _timed(lambda: [table.client_at(i) for i in indexes])
+            per_row = seconds / args.lookups * 1e6
+            print(f"  {'client_at aleatório':<32} {per_row:>9.2f} µs por linha")
+            table.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Mede o tempo de início de cada comando de main.py com -X importtime.
+
+Cada comando roda em um processo novo, como nas chamadas de cron e de
+pipelines. O tempo de importação conta só os módulos que o comando traz além
+dos que o próprio interpretador já importa (site, encodings...). O benchmark
+falha (código 1) se a mediana de algum comando passar do orçamento.
+
+Uso:
+    python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "main.py")
+
+# Orçamento de importação por comando, em milissegundos, na mediana das
+# execuções. Referência: cerca de 16 ms para --help, 40 ms para price e 46 ms
+# para load, register e orders, contra 90 ms quando main.py importava tudo
+# antecipadamente. Uns 18 ms disso são da biblioteca padrão que todo comando
+# usa (argparse e re, dataclasses e inspect), e esse piso cresce junto com a
+# máquina; a folga de cerca de 30% acomoda máquinas mais lentas
+IMPORT_BUDGET_MS = 60.0
+
+COMMANDS = (
+    ("--help", ["--help"]),
+    ("load", ["load", "--store", "clientes.txt"]),
+    ("price", ["price", "carrinhos.txt"]),
+    ("register", ["register", "novos.csv", "--store", "clientes.txt"]),
+    ("orders", ["orders", "pedidos.txt", "--store", "clientes.txt"]),
+)
+
+FILES = {
+    "clientes.txt": "Ana Paula,ana@petrobahia.com,gold\n",
+    "novos.csv": "Carlos Silva,carlos@petrobahia.com,silver\n",
+    "carrinhos.txt": "10.5,20\n",
+    "pedidos.txt": "ana@petrobahia.com,Gasolina:100\n",
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Tempo cumulativo (µs) de cada importação de nível superior."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # O nome vem indentado pela profundidade da importação
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def import_time(args: list[str], cwd: str) -> dict[str, int]:
+    """Executa python -X importtime com os argumentos e lê as importações."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, content in FILES.items():
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as file:
+                file.write(content)
+
+        interpreter = set(import_time(["-c", "pass"], directory))
+        print(
+            f"Início de main.py em {args.runs} execuções "
+            f"(mediana; orçamento de importação: {args.budget_ms:.0f} ms):"
+        )
+        over_budget = []
+        for label, command in COMMANDS:
+            imports, walls, heaviest = [], [], {}
+            for _ in range(args.runs):
+                modules = import_time([MAIN_PATH, *command], directory)
+                own = {m: us for m, us in modules.items() if m not in interpreter}
+                imports.append(sum(own.values()) / 1000)
+                heaviest = own
+
+                start = time.perf_counter()
+                subprocess.run(
+                    [sys.executable, MAIN_PATH, *command],
+                    cwd=directory,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                )
+                walls.append((time.perf_counter() - start) * 1000)
+
+            median = statistics.median(imports)
+            top = sorted(heaviest, key=heaviest.get, reverse=True)[:3]
+            status = "ok" if median <= args.budget_ms else "ACIMA"
+            print(
+                f"  {label:<10} importação {median:>6.1f} ms  "
+                f"processo {statistics.median(walls):>6.1f} ms  {status:<5}  "
+                f"({', '.join(top)})"
+            )
+            if median > args.budget_ms:
+                over_budget.append(label)
+
+    if over_budget:
+        print(f"Acima do orçamento: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compara a vazão da validação por linha com validate_many.
+
+Uso:
+    python -m benchmarks.validation_throughput --rows 1000000 --workers 8
+"""
+
+import argparse
+import os
+import time
+
+from domain.entities import Client
+from services.validation import ClientValidator, EmailValidator
+
+
+def _clients(count: int, invalid_ratio: float):
+    invalid_every = int(1 / invalid_ratio) if invalid_ratio else 0
+    clients = []
+    for i in range(count):
+        domain = "invalido" if invalid_every and i % invalid_every == 0 else "pb.com"
+        clients.append(Client(f"Cliente {i}", f"cliente{i}@{domain}", "gold"))
+    return clients
+
+
+def _per_row(validator, clients):
+    errors = []
+    for client in clients:
+        try:
+            validator.validate(client)
+            errors.append([])
+        except ValueError as exc:
+            errors.append([str(exc)])
+    return errors
+
+
+def _report(label: str, rows: int, seconds: float):
+    print(f"  {label:<28} {rows / seconds:>12,.0f} linhas/s ({seconds:.3f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    validator = ClientValidator(EmailValidator())
+    clients = _clients(args.rows, args.invalid_ratio)
+    print(f"Validação de {args.rows} clientes ({args.invalid_ratio:.0%} inválidos):")
+
+    start = time.perf_counter()
+    _per_row(validator, clients)
+    _report("validate por linha", args.rows, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    validator.validate_many(clients)
+    _report("validate_many", args.rows, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    validator.validate_many(clients, workers=args.workers, chunk_size=args.chunk_size)
+    _report(
+        f"validate_many ({args.workers} processos)",
+        args.rows,
+        time.perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    main()
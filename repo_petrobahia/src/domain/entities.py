@@ -1,12 +1,23 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from typing import Optional
 
-@dataclass
+from domain.tiers import TIERS
+
+
+@dataclass(slots=True)
 class Client:
-    """Entidade de cliente com dados imutáveis."""
+    """
+    Entidade de cliente com dados imutáveis.
+
+    O nível é internado no registro TIERS: tier_code indexa as tabelas de
+    desconto e clientes do mesmo nível compartilham o mesmo texto.
+    """
 
     name: str
     email: str
     tier: str
+    tier_code: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Valida os dados do cliente após a inicialização."""
@@ -17,8 +28,15 @@ class Client:
         if not self.tier or not self.tier.strip():
             raise ValueError("O nível do cliente não pode estar vazio")
 
+        self.tier_code = TIERS.intern(self.tier)
+        self.tier = TIERS.name(self.tier_code)
+
+    def __reduce__(self):
+        """Serializa pelo texto do nível, pois os códigos valem só no processo."""
+        return (type(self), (self.name, self.email, self.tier))
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderItem:
     """Entidade de item do pedido."""
 
@@ -33,26 +51,90 @@ class OrderItem:
             raise ValueError("O preço do item não pode ser negativo")
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
-    """Entidade de pedido contendo informações do cliente e itens."""
+    """
+    Entidade de pedido contendo informações do cliente e itens.
+
+    O subtotal é uma soma compensada (Neumaier) mantida a cada item: igual à
+    de sum() no Python 3.12+, sem depender da ordem das operações. add_item
+    custa O(1); remove_item soma os itens de novo. Altere os itens apenas por
+    elas; o total segue subtotal * (1 - discount_rate).
+    """
 
     client: Client
     items: list[OrderItem]
     total: float
     discount_rate: float
+    _sum: float = field(init=False, repr=False, compare=False)
+    _compensation: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Copia os itens e calcula o subtotal inicial."""
+        self.items = list(self.items)
+        self._resum()
 
     @property
     def subtotal(self) -> float:
-        """Calcula o subtotal antes do desconto."""
-        return sum(item.price for item in self.items)
+        """Subtotal antes do desconto."""
+        # Como sum(): a compensação não transforma um infinito em NaN
+        if self._compensation and math.isfinite(self._compensation):
+            return self._sum + self._compensation
+        return self._sum
 
     @property
     def discount_amount(self) -> float:
-        """Calcula o valor do desconto."""
+        """Valor do desconto."""
         return self.subtotal * self.discount_rate
 
     @property
     def items_count(self) -> int:
         """Quantidade de itens no pedido."""
         return len(self.items)
+
+    def add_item(self, item: OrderItem) -> None:
+        """Adiciona um item, atualizando subtotal e total."""
+        self.items.append(item)
+        self._add(item.price)
+        self._update_total()
+
+    def remove_item(self, item: OrderItem) -> None:
+        """Remove um item, atualizando subtotal e total."""
+        try:
+            self.items.remove(item)
+        except ValueError as exc:
+            raise ValueError("O item não pertence ao pedido") from exc
+        # Subtrair deixaria resíduos que a soma dos itens restantes não tem
+        self._resum()
+        self._update_total()
+
+    def _resum(self) -> None:
+        """Soma todos os itens do zero."""
+        self._sum = 0.0
+        self._compensation = 0.0
+        for item in self.items:
+            self._add(item.price)
+
+    def _add(self, price: float) -> None:
+        """Passo de Neumaier: soma o preço guardando o erro de arredondamento."""
+        value = float(price)
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _update_total(self) -> None:
+        """Recalcula o total com o desconto do pedido."""
+        self.total = self.subtotal * (1 - self.discount_rate)
+
+
+@dataclass(frozen=True, slots=True)
+class EmailMessage:
+    """Mensagem de email a ser entregue por um EmailSender."""
+
+    to: str
+    subject: str
+    body: str
+    key: Optional[str] = None  # identifica a mensagem para não enviá-la duas vezes
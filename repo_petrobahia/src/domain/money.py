@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+
+class RoundingMode(Enum):
+    """Modos de arredondamento, com os mesmos nomes do módulo decimal."""
+
+    HALF_EVEN = "half_even"  # empate vai para o par (arredondamento bancário)
+    HALF_UP = "half_up"  # empate se afasta do zero
+    HALF_DOWN = "half_down"  # empate vai em direção ao zero
+    UP = "up"  # sempre se afasta do zero
+    DOWN = "down"  # sempre em direção ao zero (trunca)
+    CEILING = "ceiling"  # sempre para cima
+    FLOOR = "floor"  # sempre para baixo
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class Money:
+    """
+    Valor monetário exato em centavos inteiros.
+
+    Multiplicações por taxas usam frações exatas e arredondam uma única vez,
+    no modo escolhido, sem passar por float nem por Decimal.
+    """
+
+    cents: int
+
+    @classmethod
+    def from_float(
+        cls, amount: float, rounding: RoundingMode = RoundingMode.HALF_EVEN
+    ) -> "Money":
+        """
+        Converte um valor em reais pelo seu repr (19.99 vale 1999 centavos).
+
+        Valores com mais de duas casas decimais são arredondados no modo pedido.
+        """
+        return cls(to_cents(amount, rounding))
+
+    def scale(
+        self, factor: "Fraction", rounding: RoundingMode = RoundingMode.HALF_EVEN
+    ) -> "Money":
+        """Multiplica o valor pelo fator exato, arredondando uma única vez."""
+        return Money(
+            divide(self.cents * factor.numerator, factor.denominator, rounding)
+        )
+
+    def to_float(self) -> float:
+        """Valor em reais como float (a representação mais próxima)."""
+        return self.cents / 100
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents + other.cents)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents - other.cents)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.cents)
+
+    def __mul__(self, quantity: int) -> "Money":
+        if not isinstance(quantity, int):
+            return NotImplemented
+        return Money(self.cents * quantity)
+
+    __rmul__ = __mul__
+
+    def __str__(self) -> str:
+        sign = "-" if self.cents < 0 else ""
+        reais, cents = divmod(abs(self.cents), 100)
+        return f"{sign}{reais}.{cents:02d}"
+
+
+def to_cents(amount: float, rounding: RoundingMode = RoundingMode.HALF_EVEN) -> int:
+    """Converte um valor em reais para centavos inteiros pelo seu repr."""
+    cents = round(amount * 100)
+    if cents / 100 == amount:
+        # O valor tem no máximo duas casas decimais
+        return cents
+    ratio = exact_ratio(amount)
+    return divide(ratio.numerator * 100, ratio.denominator, rounding)
+
+
+def exact_ratio(value: float) -> "Fraction":
+    """Converte o float na fração decimal exata do seu repr (0.1 vale 1/10)."""
+    # fractions traz decimal e re: só o caminho exato paga por essa importação
+    from fractions import Fraction  # pylint: disable=import-outside-toplevel
+
+    return Fraction(repr(float(value)))
+
+
+def divide(numerator: int, denominator: int, rounding: RoundingMode) -> int:
+    """Divide inteiros (denominador positivo) arredondando no modo informado."""
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder == 0 or rounding is RoundingMode.FLOOR:
+        return quotient
+    if rounding is RoundingMode.CEILING:
+        return quotient + 1
+
+    negative = numerator < 0
+    if rounding is RoundingMode.DOWN:
+        return quotient + negative
+    if rounding is RoundingMode.UP:
+        return quotient + (not negative)
+
+    # divmod arredonda para baixo: o resto fica sempre entre 0 e o denominador
+    twice_remainder = 2 * remainder
+    if twice_remainder < denominator:
+        return quotient
+    if twice_remainder > denominator:
+        return quotient + 1
+    if rounding is RoundingMode.HALF_UP:
+        return quotient + (not negative)
+    if rounding is RoundingMode.HALF_DOWN:
+        return quotient + negative
+    return quotient + (quotient % 2)
@@ -1,8 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator, List, Optional
 
 from domain.entities import Client
 
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True, slots=True)
+class ClientPage:
+    """Página de clientes e o cursor da próxima, se houver."""
+
+    clients: List[Client]
+    next_cursor: Optional[int]  # posição do primeiro cliente da próxima página
+
+    @classmethod
+    def from_rows(cls, clients: List[Client], cursor: int, limit: int) -> "ClientPage":
+        """Página a partir de até limit + 1 clientes; o excedente indica a próxima."""
+        if len(clients) > limit:
+            return cls(clients=clients[:limit], next_cursor=cursor + limit)
+        return cls(clients=clients, next_cursor=None)
+
 
 class ClientReader(ABC):
     """Interface para leitura de dados de clientes."""
@@ -12,11 +31,59 @@ class ClientReader(ABC):
         """Carrega todos os clientes do armazenamento."""
         ...
 
+    @abstractmethod
+    def iter_clients(self) -> Iterator[Client]:
+        """Itera sobre os clientes do armazenamento sob demanda."""
+        ...
+
     @abstractmethod
     def exists(self, email: str) -> bool:
         """Verifica se um cliente com o email já existe."""
         ...
 
+    def find_by_tier(self, tier: str) -> List[Client]:
+        """Clientes do nível informado (por padrão, percorre todos)."""
+        return [client for client in self.iter_clients() if client.tier == tier]
+
+    def find_by_domain(self, domain: str) -> List[Client]:
+        """Clientes com email no domínio informado, sem diferenciar maiúsculas."""
+        domain = normalize_email(domain)
+        return [
+            client
+            for client in self.iter_clients()
+            if email_domain(client.email) == domain
+        ]
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Primeiro cliente com o email informado, sem diferenciar maiúsculas."""
+        email = normalize_email(email)
+        for client in self.iter_clients():
+            if normalize_email(client.email) == email:
+                return client
+        return None
+
+    def count_by_tier(self) -> dict[str, int]:
+        """Quantidade de clientes de cada nível."""
+        counts: dict[str, int] = {}
+        for client in self.iter_clients():
+            counts[client.tier] = counts.get(client.tier, 0) + 1
+        return counts
+
+    def count(self) -> int:
+        """Quantidade de clientes (por padrão, percorre todos)."""
+        return sum(1 for _ in self.iter_clients())
+
+    def load_page(self, cursor: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ClientPage:
+        """
+        Página de até limit clientes a partir da posição cursor.
+
+        O cursor é a posição do cliente na ordem de load_all; a página traz o
+        cursor da próxima. Por padrão, percorre os clientes até a página.
+        """
+        check_page(cursor, limit)
+        clients = list(islice(self.iter_clients(), cursor, cursor + limit + 1))
+        return ClientPage.from_rows(clients, cursor, limit)
+
 
 class ClientWriter(ABC):
     """Interface para escrita de dados de clientes."""
@@ -26,8 +93,38 @@ class ClientWriter(ABC):
         """Salva um cliente no armazenamento."""
         ...
 
+    @abstractmethod
+    def save_many(self, clients: List[Client]) -> List[bool]:
+        """
+        Salva um lote de clientes no armazenamento.
+
+        Retorna, para cada cliente, se ele foi salvo (False indica email já
+        cadastrado ou repetido no próprio lote).
+        """
+        ...
+
 
 class ClientRepository(ClientReader, ClientWriter):
     """Interface completa de repositório de clientes."""
 
     ...
+
+
+def normalize_email(email: str) -> str:
+    """Email sem espaços nas pontas e com maiúsculas desconsideradas (casefold)."""
+    normalized = email.strip().casefold()
+    # Reaproveita o texto original quando ele já está normalizado
+    return email if normalized == email else normalized
+
+
+def email_domain(email: str) -> str:
+    """Domínio normalizado do email, o trecho depois do @."""
+    return normalize_email(email).rpartition("@")[2]
+
+
+def check_page(cursor: int, limit: int) -> None:
+    """Valida o cursor e o limite de uma página de clientes."""
+    if cursor < 0:
+        raise ValueError("O cursor da página não pode ser negativo")
+    if limit <= 0:
+        raise ValueError("O limite da página deve ser positivo")
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
-from domain.entities import Client
+from domain.entities import Client, EmailMessage
+from domain.tiers import TIERS
 
 
 class EmailSender(ABC):
@@ -11,6 +13,42 @@ class EmailSender(ABC):
         """Envia um email."""
         ...
 
+    def send_many(self, messages: List[EmailMessage]) -> None:
+        """Envia um lote de emails (por padrão, um a um via send)."""
+        for message in messages:
+            self.send(message.to, message.subject, message.body)
+
+    def send_each(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        """
+        Envia um lote e informa o resultado de cada mensagem, na mesma ordem.
+
+        None indica mensagem entregue; senão, o erro que a impediu. Por
+        padrão, envia uma a uma via send.
+        """
+        results: List[Optional[Exception]] = []
+        for message in messages:
+            try:
+                self.send(message.to, message.subject, message.body)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                results.append(exc)
+            else:
+                results.append(None)
+        return results
+
+
+class EmailOutbox(ABC):
+    """Interface para a caixa de saída durável de emails."""
+
+    @abstractmethod
+    def enqueue_many(self, messages: List[EmailMessage]) -> int:
+        """
+        Guarda as mensagens para envio posterior.
+
+        Mensagens com chave já guardada são ignoradas. Retorna quantas foram
+        guardadas.
+        """
+        ...
+
 
 class ClientValidator(ABC):
     """Interface para validação de clientes."""
@@ -20,6 +58,11 @@ class ClientValidator(ABC):
         """Valida os dados do cliente."""
         ...
 
+    @abstractmethod
+    def validate_many(self, clients: List[Client]) -> List[List[str]]:
+        """Valida um lote de clientes, retornando os erros de cada um."""
+        ...
+
 
 class DiscountCalculator(ABC):
     """Interface para cálculo de descontos."""
@@ -33,3 +76,13 @@ class DiscountCalculator(ABC):
     def calculate_discounted_price(self, base_price: float, tier: str) -> float:
         """Calcula o preço com desconto aplicado."""
         ...
+
+    def get_discount_rate_by_code(self, tier_code: int) -> float:
+        """Obtém a taxa de desconto pelo código do nível no registro TIERS."""
+        return self.get_discount_rate(TIERS.name(tier_code))
+
+    def calculate_discounted_price_by_code(
+        self, base_price: float, tier_code: int
+    ) -> float:
+        """Calcula o preço com desconto pelo código do nível no registro TIERS."""
+        return self.calculate_discounted_price(base_price, TIERS.name(tier_code))
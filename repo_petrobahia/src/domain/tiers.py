@@ -0,0 +1,50 @@
+import threading
+from typing import Optional
+
+
+class TierRegistry:
+    """
+    Registro que interna os níveis de cliente como códigos inteiros pequenos.
+
+    Cada grafia de nível recebe um código na primeira vez em que aparece, e
+    todos os clientes do mesmo nível passam a compartilhar o mesmo objeto de
+    texto. Os códigos valem apenas dentro do processo: o que vai para disco
+    ou para outro processo continua sendo o texto do nível.
+    """
+
+    def __init__(self, tiers: tuple[str, ...] = ()):
+        """Inicializa o registro, opcionalmente com níveis pré-registrados."""
+        self._names: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        for tier in tiers:
+            self.intern(tier)
+
+    def __len__(self) -> int:
+        """Quantidade de níveis registrados."""
+        return len(self._names)
+
+    def intern(self, tier: str) -> int:
+        """Retorna o código do nível, registrando-o se necessário."""
+        code = self._codes.get(tier)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(tier)
+                if code is None:
+                    code = len(self._names)
+                    self._names.append(tier)
+                    self._codes[tier] = code
+        return code
+
+    def code(self, tier: str) -> Optional[int]:
+        """Retorna o código do nível, ou None se ele nunca foi registrado."""
+        return self._codes.get(tier)
+
+    def name(self, code: int) -> str:
+        """Retorna o texto do nível com o código informado."""
+        return self._names[code]
+
+
+# Registro compartilhado por todas as entidades do processo
+TIERS = TierRegistry(("gold", "silver", "bronze"))
@@ -0,0 +1,177 @@
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+
+from domain.entities import Client
+from domain.repositories import ClientReader
+from domain.tiers import TIERS
+from infrastructure.indexes import IndexedRows
+
+
+@dataclass(frozen=True, slots=True)
+class TableColumns:
+    """Buffers de uma ClientTable, compartilhados sem cópia."""
+
+    names: bytearray  # nomes em UTF-8, concatenados
+    name_ends: array  # offset do fim de cada nome em names
+    emails: bytearray  # emails em UTF-8, concatenados
+    email_ends: array  # offset do fim de cada email em emails
+    tier_codes: array  # código TIERS do nível de cada linha
+
+
+class ClientRow:
+    """Visão de uma linha da ClientTable; o Client só é criado sob demanda."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ClientTable", index: int):
+        """Inicializa a visão da linha."""
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        """Nome do cliente."""
+        return self._table.name_at(self._index)
+
+    @property
+    def email(self) -> str:
+        """Email do cliente."""
+        return self._table.email_at(self._index)
+
+    @property
+    def tier(self) -> str:
+        """Nível do cliente."""
+        return self._table.tier_at(self._index)
+
+    @property
+    def tier_code(self) -> int:
+        """Código do nível do cliente no registro TIERS."""
+        return self._table.tier_code_at(self._index)
+
+    def to_client(self) -> Client:
+        """Materializa a linha como entidade Client."""
+        return self._table.client_at(self._index)
+
+
+class ClientTable(IndexedRows, ClientReader):
+    """
+    Armazenamento colunar de clientes em memória.
+
+    Nomes e emails ficam em buffers UTF-8 contíguos indexados por arrays de
+    offsets, e os níveis são guardados pelo código do registro TIERS. Cada linha
+    custa apenas seus bytes de texto e alguns inteiros, sem objetos Python.
+    As consultas por nível, domínio e email usam índices secundários
+    montados na primeira consulta e mantidos a cada append.
+    """
+
+    def __init__(self, clients: Iterable[Client] = ()):
+        """Inicializa a tabela, opcionalmente com clientes iniciais."""
+        self._names = bytearray()
+        self._name_ends = array("Q")
+        self._emails = bytearray()
+        self._email_ends = array("Q")
+        self._tier_codes = array("H")
+
+        self.extend(clients)
+
+    def __len__(self) -> int:
+        """Quantidade de clientes na tabela."""
+        return len(self._tier_codes)
+
+    def __getitem__(self, index: int) -> ClientRow:
+        """Retorna a visão da linha no índice informado."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de cliente fora do intervalo")
+        return ClientRow(self, index)
+
+    def __iter__(self) -> Iterator[ClientRow]:
+        """Itera sobre as visões das linhas."""
+        for index in range(len(self)):
+            yield ClientRow(self, index)
+
+    def append(self, client: Client) -> None:
+        """Adiciona um cliente ao final da tabela."""
+        self._names += client.name.encode("utf-8")
+        self._name_ends.append(len(self._names))
+        self._emails += client.email.encode("utf-8")
+        self._email_ends.append(len(self._emails))
+        self._tier_codes.append(client.tier_code)
+        self._index_row(len(self) - 1, client.email, client.tier_code)
+
+    def extend(self, clients: Iterable[Client]) -> None:
+        """Adiciona vários clientes ao final da tabela."""
+        for client in clients:
+            self.append(client)
+
+    def columns(self) -> TableColumns:
+        """Buffers da tabela, para serialização; não devem ser alterados."""
+        return TableColumns(
+            names=self._names,
+            name_ends=self._name_ends,
+            emails=self._emails,
+            email_ends=self._email_ends,
+            tier_codes=self._tier_codes,
+        )
+
+    def name_at(self, index: int) -> str:
+        """Nome do cliente na linha informada."""
+        return self._decode(self._names, self._name_ends, index)
+
+    def email_at(self, index: int) -> str:
+        """Email do cliente na linha informada."""
+        return self._decode(self._emails, self._email_ends, index)
+
+    def tier_at(self, index: int) -> str:
+        """Nível do cliente na linha informada."""
+        return TIERS.name(self._tier_codes[index])
+
+    def tier_code_at(self, index: int) -> int:
+        """Código do nível do cliente na linha informada."""
+        return self._tier_codes[index]
+
+    def client_at(self, index: int) -> Client:
+        """Materializa o cliente da linha informada."""
+        return Client(
+            name=self.name_at(index),
+            email=self.email_at(index),
+            tier=self.tier_at(index),
+        )
+
+    def load_all(self) -> List[Client]:
+        """Materializa todos os clientes da tabela."""
+        return list(self.iter_clients())
+
+    def iter_clients(self) -> Iterator[Client]:
+        """Itera sobre os clientes, materializando um por vez."""
+        for index in range(len(self)):
+            yield self.client_at(index)
+
+    def exists(self, email: str) -> bool:
+        """Verifica se o email está na tabela sem materializar linhas."""
+        needle = email.encode("utf-8")
+        if not needle:
+            return False
+
+        position = self._emails.find(needle)
+        while position != -1:
+            # A ocorrência só conta se coincidir exatamente com uma linha
+            row = bisect_left(self._email_ends, position + len(needle))
+            row_start = self._email_ends[row - 1] if row else 0
+            if (
+                row < len(self._email_ends)
+                and self._email_ends[row] == position + len(needle)
+                and row_start == position
+            ):
+                return True
+            position = self._emails.find(needle, position + 1)
+        return False
+
+    @staticmethod
+    def _decode(buffer: bytearray, ends: array, index: int) -> str:
+        """Decodifica o texto da linha informada em um buffer contíguo."""
+        start = ends[index - 1] if index else 0
+        return buffer[start : ends[index]].decode("utf-8")
@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import TYPE_CHECKING, List, Optional
+
+from domain.entities import Client
+from domain.repositories import (
+    DEFAULT_PAGE_SIZE,
+    ClientPage,
+    check_page,
+    normalize_email,
+)
+from domain.tiers import TIERS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_NO_ROWS = array("Q")
+
+
+class ClientIndexes:
+    """
+    Índices secundários de clientes por número de linha.
+
+    Guarda as linhas de cada nível e de cada domínio de email, em ordem de
+    inserção, e a primeira linha de cada email normalizado. Os números de
+    linha ficam em arrays de inteiros, sem referenciar as entidades.
+    """
+
+    def __init__(self):
+        """Inicializa os índices vazios."""
+        self._by_tier: dict[int, array] = {}
+        self._by_domain: dict[str, array] = {}
+        self._by_email: dict[str, int] = {}
+
+    def add(self, row: int, email: str, tier_code: int) -> None:
+        """Indexa a linha com o email e o código de nível informados."""
+        rows = self._by_tier.get(tier_code)
+        if rows is None:
+            rows = self._by_tier[tier_code] = array("Q")
+        rows.append(row)
+
+        email = normalize_email(email)
+        self._by_email.setdefault(email, row)
+
+        domain = email.rpartition("@")[2]
+        rows = self._by_domain.get(domain)
+        if rows is None:
+            rows = self._by_domain[domain] = array("Q")
+        rows.append(row)
+
+    def tier_rows(self, tier: str) -> "Sequence[int]":
+        """Linhas do nível informado."""
+        # Um nível nunca registrado não tem linhas: não há o que internar
+        code = TIERS.code(tier)
+        return _NO_ROWS if code is None else self._by_tier.get(code, _NO_ROWS)
+
+    def domain_rows(self, domain: str) -> "Sequence[int]":
+        """Linhas com email no domínio informado."""
+        return self._by_domain.get(normalize_email(domain), _NO_ROWS)
+
+    def email_row(self, email: str) -> Optional[int]:
+        """Primeira linha com o email informado, após normalizá-lo."""
+        return self._by_email.get(normalize_email(email))
+
+    def tier_counts(self) -> dict[str, int]:
+        """Quantidade de linhas de cada nível."""
+        return {TIERS.name(code): len(rows) for code, rows in self._by_tier.items()}
+
+
+class IndexedRows(ABC):
+    """
+    Consultas por índice para tabelas com acesso às linhas por posição.
+
+    Quem herda implementa __len__, email_at, tier_code_at e client_at, e
+    chama _index_row a cada linha acrescentada. Os índices são montados na
+    primeira consulta, lendo só as colunas de email e de nível, e apenas as
+    linhas encontradas são materializadas como Client. Páginas vão direto à
+    posição do cursor.
+    """
+
+    _indexes: Optional[ClientIndexes] = None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Quantidade de linhas."""
+        ...
+
+    @abstractmethod
+    def email_at(self, index: int) -> str:
+        """Email do cliente na linha informada."""
+        ...
+
+    @abstractmethod
+    def tier_code_at(self, index: int) -> int:
+        """Código do nível do cliente na linha informada."""
+        ...
+
+    @abstractmethod
+    def client_at(self, index: int) -> Client:
+        """Materializa o cliente da linha informada."""
+        ...
+
+    def count(self) -> int:
+        """Quantidade de clientes."""
+        return len(self)
+
+    def load_page(self, cursor: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ClientPage:
+        """Página de até limit clientes a partir da posição cursor."""
+        check_page(cursor, limit)
+        end = min(len(self), cursor + limit + 1)
+        clients = [self.client_at(row) for row in range(cursor, end)]
+        return ClientPage.from_rows(clients, cursor, limit)
+
+    def find_by_tier(self, tier: str) -> List[Client]:
+        """Clientes do nível informado."""
+        return [self.client_at(row) for row in self._get_indexes().tier_rows(tier)]
+
+    def find_by_domain(self, domain: str) -> List[Client]:
+        """Clientes com email no domínio informado, sem diferenciar maiúsculas."""
+        rows = self._get_indexes().domain_rows(domain)
+        return [self.client_at(row) for row in rows]
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Primeiro cliente com o email informado, sem diferenciar maiúsculas."""
+        row = self._get_indexes().email_row(email)
+        return None if row is None else self.client_at(row)
+
+    def count_by_tier(self) -> dict[str, int]:
+        """Quantidade de clientes de cada nível."""
+        return self._get_indexes().tier_counts()
+
+    def _index_row(self, row: int, email: str, tier_code: int) -> None:
+        """Atualiza os índices com a linha acrescentada, se já foram montados."""
+        if self._indexes is not None:
+            self._indexes.add(row, email, tier_code)
+
+    def _get_indexes(self) -> ClientIndexes:
+        """Retorna os índices, montando-os na primeira consulta."""
+        if self._indexes is None:
+            indexes = ClientIndexes()
+            for row in range(len(self)):
+                indexes.add(row, self.email_at(row), self.tier_code_at(row))
+            self._indexes = indexes
+        return self._indexes
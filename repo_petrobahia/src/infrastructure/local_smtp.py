@@ -0,0 +1,272 @@
+import email
+import email.message
+import email.policy
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+_MAX_LINE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ReceivedMessage:
+    """Mensagem aceita pelo servidor local, como recebida no DATA."""
+
+    sender: str
+    recipients: tuple[str, ...]
+    data: bytes
+
+    def parsed(self) -> email.message.EmailMessage:
+        """Interpreta os bytes recebidos como mensagem de email."""
+        return email.message_from_bytes(self.data, policy=email.policy.default)
+
+
+class LocalSmtpServer:
+    """
+    Servidor SMTP mínimo em memória, para testes e benchmarks sem rede.
+
+    Atende EHLO, HELO, MAIL, RCPT, DATA, RSET, NOOP e QUIT, uma thread por
+    conexão, e guarda as mensagens aceitas. Com pipelining, anuncia a
+    extensão PIPELINING; os comandos de cada leitura são sempre respondidos
+    de uma vez. latency simula a ida e volta da rede: cada leva de respostas
+    espera latency segundos. Destinatários em reject são recusados com 550,
+    e drop_after derruba a conexão depois de tantas mensagens aceitas nela.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        pipelining: bool = True,
+        reject: Iterable[str] = (),
+        drop_after: Optional[int] = None,
+    ):
+        """Prepara o servidor; port 0 escolhe uma porta livre em start()."""
+        if latency < 0:
+            raise ValueError("A latência não pode ser negativa")
+        if drop_after is not None and drop_after <= 0:
+            raise ValueError("drop_after deve ser positivo")
+
+        self.latency = latency
+        self.pipelining = pipelining
+        self.reject = frozenset(reject)
+        self.drop_after = drop_after
+        self._address = (host, port)
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._messages: list[ReceivedMessage] = []
+        self._connections = 0
+        self._round_trips = 0
+
+    def __enter__(self) -> "LocalSmtpServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def host(self) -> str:
+        """Endereço em que o servidor escuta."""
+        return self._address[0]
+
+    @property
+    def port(self) -> int:
+        """Porta em que o servidor escuta."""
+        return self._address[1]
+
+    @property
+    def messages(self) -> List[ReceivedMessage]:
+        """Mensagens aceitas até agora, na ordem de chegada."""
+        with self._lock:
+            return list(self._messages)
+
+    @property
+    def connections(self) -> int:
+        """Conexões recebidas até agora."""
+        with self._lock:
+            return self._connections
+
+    @property
+    def round_trips(self) -> int:
+        """Levas de respostas enviadas, inclusive as saudações."""
+        with self._lock:
+            return self._round_trips
+
+    def start(self) -> None:
+        """Passa a aceitar conexões em uma thread de fundo."""
+        if self._server is not None:
+            return
+        self._server = _Server(self._address, _SmtpHandler)
+        self._server.owner = self
+        self._address = self._server.server_address[:2]
+        # Verificar o pedido de parada com frequência agiliza close()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="local-smtp",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Para de aceitar conexões e libera a porta."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def reply(self, request, replies: list[bytes]) -> None:
+        """Envia uma leva de respostas depois da latência simulada."""
+        if self.latency:
+            time.sleep(self.latency)
+        request.sendall(b"".join(replies))
+        with self._lock:
+            self._round_trips += 1
+
+    def count_connection(self) -> None:
+        """Registra uma conexão nova."""
+        with self._lock:
+            self._connections += 1
+
+    def accept(self, message: ReceivedMessage) -> None:
+        """Guarda uma mensagem aceita."""
+        with self._lock:
+            self._messages.append(message)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    """Servidor TCP com uma thread por conexão."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+    owner: LocalSmtpServer
+
+
+class _SmtpHandler(socketserver.BaseRequestHandler):
+    """Atende uma conexão SMTP."""
+
+    server: _Server
+
+    def handle(self) -> None:
+        """Lê os comandos e responde cada leitura de uma só vez."""
+        owner = self.server.owner
+        owner.count_connection()
+        session = _SmtpSession(owner)
+        owner.reply(self.request, [b"220 localhost ESMTP\r\n"])
+
+        buffer = b""
+        while not session.closed:
+            chunk = self.request.recv(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            replies, buffer = session.feed(buffer)
+            if replies:
+                owner.reply(self.request, replies)
+            if len(buffer) > _MAX_LINE:
+                owner.reply(self.request, [b"500 Line too long\r\n"])
+                return
+
+
+class _SmtpSession:
+    """Estado do diálogo SMTP de uma conexão."""
+
+    def __init__(self, owner: LocalSmtpServer):
+        """Inicia a sessão sem transação aberta."""
+        self.closed = False
+        self._owner = owner
+        self._accepted = 0
+        self._sender: Optional[str] = None
+        self._recipients: list[str] = []
+        self._data: Optional[list[bytes]] = None
+
+    def feed(self, buffer: bytes) -> tuple[list[bytes], bytes]:
+        """Processa as linhas completas; retorna as respostas e o que sobrou."""
+        replies = []
+        position = 0
+        while not self.closed:
+            end = buffer.find(b"\r\n", position)
+            if end == -1:
+                break
+            reply = self._line(buffer[position:end])
+            position = end + 2
+            if reply:
+                replies.append(reply)
+        return replies, buffer[position:]
+
+    def _line(self, line: bytes) -> Optional[bytes]:
+        """Trata uma linha de comando ou do conteúdo da mensagem."""
+        if self._data is not None:
+            if line != b".":
+                # Desfaz o ponto duplicado no início das linhas
+                self._data.append(line[1:] if line.startswith(b".") else line)
+                return None
+            data = b"\r\n".join(self._data) + b"\r\n"
+            self._owner.accept(
+                ReceivedMessage(self._sender, tuple(self._recipients), data)
+            )
+            self._accepted += 1
+            self._reset()
+            return b"250 OK: message accepted\r\n"
+
+        drop_after = self._owner.drop_after
+        if drop_after is not None and self._accepted >= drop_after:
+            # Queda simulada: a conexão fecha sem responder
+            self.closed = True
+            return None
+
+        verb = line[:4].upper()
+        argument = line[4:].strip().decode("utf-8", "replace")
+        if verb == b"EHLO":
+            if self._owner.pipelining:
+                return b"250-localhost\r\n250-PIPELINING\r\n250 8BITMIME\r\n"
+            return b"250-localhost\r\n250 8BITMIME\r\n"
+        if verb == b"HELO":
+            return b"250 localhost\r\n"
+        if verb == b"MAIL":
+            if self._sender is not None:
+                return b"503 Nested MAIL command\r\n"
+            self._sender = _address(argument)
+            return b"250 OK\r\n"
+        if verb == b"RCPT":
+            if self._sender is None:
+                return b"503 Need MAIL before RCPT\r\n"
+            recipient = _address(argument)
+            if recipient in self._owner.reject:
+                return b"550 Mailbox unavailable\r\n"
+            self._recipients.append(recipient)
+            return b"250 OK\r\n"
+        if verb == b"DATA":
+            if not self._recipients:
+                return b"554 No valid recipients\r\n"
+            self._data = []
+            return b"354 End data with <CR><LF>.<CR><LF>\r\n"
+        if verb == b"RSET":
+            self._reset()
+            return b"250 OK\r\n"
+        if verb == b"NOOP":
+            return b"250 OK\r\n"
+        if verb == b"QUIT":
+            self.closed = True
+            return b"221 Bye\r\n"
+        return b"502 Command not implemented\r\n"
+
+    def _reset(self) -> None:
+        """Descarta a transação em andamento."""
+        self._sender = None
+        self._recipients = []
+        self._data = None
+
+
+def _address(argument: str) -> str:
+    """Endereço entre < e > de um argumento FROM:<...> ou TO:<...>."""
+    _, _, rest = argument.partition("<")
+    return rest.partition(">")[0]
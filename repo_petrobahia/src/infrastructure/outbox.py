@@ -0,0 +1,289 @@
+import smtplib
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+from domain.entities import EmailMessage
+from domain.services import EmailOutbox, EmailSender
+
+PENDING = "pending"
+SENT = "sent"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS email_outbox_key_idx ON email_outbox (key);
+CREATE INDEX IF NOT EXISTS email_outbox_due_idx
+    ON email_outbox (status, next_attempt_at);
+"""
+
+_INSERT = (
+    "INSERT OR IGNORE INTO email_outbox "
+    "(key, recipient, subject, body, next_attempt_at, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_DUE = (
+    "SELECT id, key, recipient, subject, body, attempts FROM email_outbox "
+    "WHERE status = 'pending' AND next_attempt_at <= ? "
+    "ORDER BY next_attempt_at, id LIMIT ?"
+)
+_LEASE = "UPDATE email_outbox SET next_attempt_at = ? WHERE id = ?"
+_MARK_SENT = "UPDATE email_outbox SET status = 'sent', sent_at = ? WHERE id = ?"
+_MARK_FAILED = (
+    "UPDATE email_outbox SET status = ?, attempts = attempts + 1, "
+    "next_attempt_at = ?, last_error = ? WHERE id = ?"
+)
+_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM email_outbox GROUP BY status"
+_PURGE_SENT = "DELETE FROM email_outbox WHERE status = 'sent' AND sent_at < ?"
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEntry:
+    """Mensagem retirada da caixa de saída para envio."""
+
+    id: int
+    message: EmailMessage
+    attempts: int  # tentativas que já falharam
+
+
+class SqliteEmailOutbox(EmailOutbox):
+    """
+    Caixa de saída de emails em SQLite.
+
+    Cada mensagem é gravada com uma chave única (a do EmailMessage ou, sem
+    ela, uma gerada), então guardar de novo a mesma mensagem não a duplica.
+    As linhas enviadas continuam na tabela com status sent, preservando a
+    deduplicação até purge_sent; as que esgotaram as tentativas ficam como
+    dead, com o último erro. O banco usa WAL com synchronous=FULL: uma
+    mensagem guardada sobrevive a quedas do processo e do sistema.
+
+    claim reserva as mensagens por um prazo (lease) na mesma transação em
+    que as seleciona: vários despachantes podem drenar a mesma caixa, e as
+    de um despachante que caiu voltam a ficar disponíveis ao fim do prazo.
+    """
+
+    def __init__(self, database_path: str):
+        """Abre (ou cria) a caixa de saída."""
+        # Transações explícitas (claim precisa de BEGIN IMMEDIATE), e a conexão
+        # é compartilhada entre threads sob self._lock
+        self._connection = sqlite3.connect(
+            database_path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SqliteEmailOutbox":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._connection.close()
+
+    def enqueue(self, message: EmailMessage) -> bool:
+        """Guarda uma mensagem; retorna False se a chave já estava guardada."""
+        return self.enqueue_many([message]) == 1
+
+    def enqueue_many(self, messages: List[EmailMessage]) -> int:
+        """Guarda as mensagens em uma única transação; retorna quantas eram novas."""
+        now = time.time()
+        rows = [
+            (
+                message.key or uuid.uuid4().hex,
+                message.to,
+                message.subject,
+                message.body,
+                now,
+                now,
+            )
+            for message in messages
+        ]
+        with self._transaction() as connection:
+            before = connection.total_changes
+            connection.executemany(_INSERT, rows)
+            return connection.total_changes - before
+
+    def claim(self, limit: int, lease: float) -> List[OutboxEntry]:
+        """
+        Reserva até limit mensagens pendentes e vencidas, na ordem de chegada.
+
+        As reservadas só voltam a ser entregues por claim depois de lease
+        segundos, se até lá não forem marcadas como enviadas ou falhas.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            rows = connection.execute(_SELECT_DUE, (now, limit)).fetchall()
+            connection.executemany(_LEASE, [(now + lease, row[0]) for row in rows])
+        return [
+            OutboxEntry(
+                id=entry_id,
+                message=EmailMessage(to=to, subject=subject, body=body, key=key),
+                attempts=attempts,
+            )
+            for entry_id, key, to, subject, body, attempts in rows
+        ]
+
+    def mark_sent(self, ids: Iterable[int]) -> None:
+        """Marca as mensagens como enviadas."""
+        now = time.time()
+        with self._transaction() as connection:
+            connection.executemany(_MARK_SENT, [(now, entry_id) for entry_id in ids])
+
+    def mark_failed(self, failures: Iterable[tuple[int, Optional[float], str]]) -> None:
+        """
+        Registra uma tentativa que falhou para cada (id, próxima tentativa, erro).
+
+        Sem horário da próxima tentativa (None), a mensagem é abandonada.
+        """
+        rows = [
+            (
+                PENDING if retry_at is not None else DEAD,
+                retry_at or 0.0,
+                error,
+                entry_id,
+            )
+            for entry_id, retry_at, error in failures
+        ]
+        with self._transaction() as connection:
+            connection.executemany(_MARK_FAILED, rows)
+
+    def counts(self) -> dict[str, int]:
+        """Quantidade de mensagens por status (pending, sent e dead)."""
+        with self._lock:
+            return dict(self._connection.execute(_COUNT_BY_STATUS).fetchall())
+
+    def purge_sent(self, before: float) -> int:
+        """Apaga as enviadas antes do instante informado; retorna quantas."""
+        with self._transaction() as connection:
+            return connection.execute(_PURGE_SENT, (before,)).rowcount
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transação que trava o banco para escrita desde o início."""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+
+class OutboxDispatcher:
+    """
+    Drena a caixa de saída em lotes, com novas tentativas espaçadas.
+
+    Cada lote de até batch_size mensagens vai de uma vez ao send_each do
+    remetente, que informa o resultado de cada mensagem: as entregues são
+    marcadas como enviadas e só as demais falham. Uma mensagem que falhou
+    volta a ficar pendente após base_delay * 2 ** (tentativas - 1) segundos,
+    limitados a max_delay, até max_attempts tentativas. Só as recusas com
+    código 5xx, inclusive as de endereços inválidos, são abandonadas na hora.
+    """
+
+    def __init__(
+        self,
+        outbox: SqliteEmailOutbox,
+        sender: EmailSender,
+        batch_size: int = 500,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        lease: float = 60.0,
+    ):
+        """Inicializa o despachante."""
+        if batch_size <= 0:
+            raise ValueError("O tamanho do lote deve ser positivo")
+        if max_attempts <= 0:
+            raise ValueError("A quantidade de tentativas deve ser positiva")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("Os intervalos entre tentativas são inválidos")
+
+        self._outbox = outbox
+        self._sender = sender
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._lease = lease
+
+    def dispatch_once(self) -> int:
+        """Envia um lote de mensagens vencidas; retorna quantas foram retiradas."""
+        entries = self._outbox.claim(self._batch_size, self._lease)
+        if not entries:
+            return 0
+
+        try:
+            results = self._sender.send_each([entry.message for entry in entries])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Sem resultado por mensagem, o lote inteiro volta para a caixa
+            error = f"{type(exc).__name__}: {exc}"
+            self._fail([(entry, error, False) for entry in entries])
+            return len(entries)
+
+        self._outbox.mark_sent(
+            entry.id for entry, result in zip(entries, results) if result is None
+        )
+        self._fail(
+            [
+                (entry, *_describe_failure(result))
+                for entry, result in zip(entries, results)
+                if result is not None
+            ]
+        )
+        return len(entries)
+
+    def run(self, stop: threading.Event, poll_interval: float = 1.0) -> None:
+        """Drena a caixa até stop ser sinalizado, esperando quando esvazia."""
+        while not stop.is_set():
+            if self.dispatch_once() < self._batch_size:
+                stop.wait(poll_interval)
+
+    def backoff(self, attempts: int) -> float:
+        """Espera, em segundos, antes da tentativa seguinte à informada."""
+        return min(self._max_delay, self._base_delay * 2 ** (attempts - 1))
+
+    def _fail(self, failures: List[tuple[OutboxEntry, str, bool]]) -> None:
+        """Reagenda as mensagens ou as abandona se esgotaram as tentativas."""
+        now = time.time()
+        rows = []
+        for entry, error, permanent in failures:
+            attempts = entry.attempts + 1
+            if permanent or attempts >= self._max_attempts:
+                rows.append((entry.id, None, error))
+            else:
+                rows.append((entry.id, now + self.backoff(attempts), error))
+        if rows:
+            self._outbox.mark_failed(rows)
+
+
+def _describe_failure(error: Exception) -> tuple[str, bool]:
+    """Texto do erro de uma mensagem e se a falha é permanente."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        text = error.smtp_error
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", "replace")
+        return f"{error.smtp_code} {text}", error.smtp_code >= 500
+    # Só a recusa do servidor é atribuída à mensagem; o resto é tentado de novo
+    return f"{type(error).__name__}: {error}", False
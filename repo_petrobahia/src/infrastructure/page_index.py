@@ -0,0 +1,153 @@
+import struct
+import sys
+from array import array
+
+from infrastructure.snapshot import atomic_file
+
+PAGE_INDEX_SUFFIX = ".idx"
+
+MAGIC = b"PBPIDX"
+VERSION = 2
+
+# Um cliente a cada DEFAULT_INTERVAL tem seu offset guardado: do marco até
+# o cursor são lidas no máximo DEFAULT_INTERVAL - 1 linhas a mais
+DEFAULT_INTERVAL = 100
+
+# Cabeçalho (little-endian): magic, versão, intervalo, clientes indexados,
+# offset do CSV coberto pelo índice, tamanho e bytes da impressão digital e
+# identidade do CSV (dispositivo, inode e CRC do início)
+_HEADER = struct.Struct("<6sHIQQB64sQQI")
+
+
+class PageIndex:
+    """
+    Índice esparso de offsets de um arquivo de clientes.
+
+    Guarda o byte do CSV onde começa a linha de cada interval-ésimo cliente
+    válido (0, interval, 2 * interval...), então achar o ponto de leitura de
+    qualquer posição é uma divisão. O índice registra até que byte do CSV
+    leu, com os bytes que o antecedem e a identidade do arquivo para
+    reconhecê-lo, e pode ser estendido com as linhas acrescentadas depois.
+    """
+
+    def __init__(self, interval: int = DEFAULT_INTERVAL):
+        """Inicializa um índice vazio."""
+        if interval <= 0:
+            raise ValueError("O intervalo do índice deve ser positivo")
+        self._interval = interval
+        self._offsets = array("Q")
+        self._rows = 0
+        self._csv_offset = 0
+        self._fingerprint = b""
+        self._csv_identity = (0, 0, 0)
+
+    @classmethod
+    def read(cls, path: str) -> "PageIndex":
+        """Lê o índice gravado em path, validando o cabeçalho."""
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < _HEADER.size:
+            raise ValueError("Índice de páginas inválido: arquivo truncado")
+
+        (
+            magic,
+            version,
+            interval,
+            rows,
+            csv_offset,
+            fingerprint_size,
+            fingerprint,
+            csv_device,
+            csv_inode,
+            csv_head_crc,
+        ) = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Índice de páginas inválido: assinatura desconhecida")
+        if version != VERSION:
+            raise ValueError(f"Versão de índice de páginas não suportada: {version}")
+
+        index = cls(interval)
+        index._offsets.frombytes(data[_HEADER.size :])
+        if len(index._offsets) != -(-rows // interval):
+            raise ValueError("Índice de páginas inválido: tamanho diferente do gravado")
+        if sys.byteorder != "little":
+            index._offsets.byteswap()
+        index._rows = rows
+        index._csv_offset = csv_offset
+        index._fingerprint = fingerprint[:fingerprint_size]
+        index._csv_identity = (csv_device, csv_inode, csv_head_crc)
+        return index
+
+    @property
+    def interval(self) -> int:
+        """Clientes entre dois offsets guardados."""
+        return self._interval
+
+    @property
+    def rows(self) -> int:
+        """Clientes válidos nas linhas cobertas pelo índice."""
+        return self._rows
+
+    @property
+    def csv_offset(self) -> int:
+        """Byte do CSV até onde as linhas estão no índice."""
+        return self._csv_offset
+
+    @property
+    def fingerprint(self) -> bytes:
+        """Bytes do CSV que antecedem csv_offset."""
+        return self._fingerprint
+
+    @property
+    def csv_identity(self) -> tuple[int, int, int]:
+        """Dispositivo, inode e CRC do início do CSV indexado."""
+        return self._csv_identity
+
+    def add(self, offset: int) -> None:
+        """Registra o próximo cliente válido, cuja linha começa no offset."""
+        if self._rows % self._interval == 0:
+            self._offsets.append(offset)
+        self._rows += 1
+
+    def cover(
+        self, csv_offset: int, fingerprint: bytes, csv_identity: tuple[int, int, int]
+    ) -> None:
+        """Registra até que byte do CSV o índice leu e a identidade do CSV."""
+        if len(fingerprint) > 64:
+            raise ValueError("A impressão digital do CSV tem no máximo 64 bytes")
+        self._csv_offset = csv_offset
+        self._fingerprint = fingerprint
+        self._csv_identity = csv_identity
+
+    def seek(self, position: int) -> tuple[int, int]:
+        """
+        Ponto de leitura mais próximo antes da posição informada.
+
+        Retorna o byte do CSV e a posição do cliente que começa nele. Posições
+        além das indexadas começam no fim da parte coberta do CSV.
+        """
+        if position >= self._rows:
+            return self._csv_offset, self._rows
+        checkpoint = position // self._interval
+        return self._offsets[checkpoint], checkpoint * self._interval
+
+    def write(self, path: str) -> None:
+        """Grava o índice de forma atômica em path."""
+        offsets = self._offsets
+        if sys.byteorder != "little":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            self._interval,
+            self._rows,
+            self._csv_offset,
+            len(self._fingerprint),
+            self._fingerprint,
+            *self._csv_identity,
+        )
+        with atomic_file(path) as file:
+            file.write(header)
+            file.write(offsets)
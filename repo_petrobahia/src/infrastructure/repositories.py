@@ -1,60 +1,749 @@
-from typing import List
+import atexit
+import mmap
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator, List, Optional
 
 from domain.entities import Client
+from domain.repositories import DEFAULT_PAGE_SIZE, ClientPage
 from domain.repositories import ClientRepository as IClientRepository
+from domain.repositories import check_page, email_domain, normalize_email
+from infrastructure.indexes import ClientIndexes
+from services.metrics import timed
+
+if TYPE_CHECKING:
+    from infrastructure.page_index import PageIndex
+    from infrastructure.snapshot import SnapshotTable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sem fcntl (Windows)
+    fcntl = None
+
+
+class DurabilityPolicy(Enum):
+    """Quando o repositório força a gravação dos dados em disco (fsync)."""
+
+    NONE = "none"  # o sistema operacional decide quando gravar
+    BATCH = "batch"  # fsync a cada descarga do buffer
+    WRITE = "write"  # fsync a cada gravação
+
+
+@dataclass(frozen=True, slots=True)
+class LoadStats:
+    """Contadores do cache usado por load_all."""
+
+    hits: int  # nada mudou no arquivo
+    tail_parses: int  # o arquivo só cresceu e apenas o final foi lido
+    full_reloads: int  # primeira leitura, ou arquivo reescrito ou truncado
 
 
 class FileClientRepository(IClientRepository):
-    """Repositório para persistir clientes em arquivos de texto."""
+    """
+    Repositório para persistir clientes em arquivos de texto.
+
+    No modo buffered, o arquivo fica aberto e as linhas novas se acumulam em
+    memória até somarem flush_size bytes ou até flush_interval segundos após
+    a primeira linha pendente. Não há timer: os dois limites são verificados
+    na gravação seguinte. A política de durabilidade define quando há fsync;
+    flush(), close() e a saída do bloco with sempre gravam e sincronizam o
+    que estiver pendente. Uma instância com linhas no buffer e que não foi
+    fechada é fechada ao fim do interpretador (atexit), então as últimas
+    linhas não se perdem numa saída normal do processo.
+
+    Vários processos podem gravar no mesmo arquivo: cada gravação ocorre sob
+    trava exclusiva (fcntl.flock), e a verificação de email duplicado e o
+    acréscimo das linhas são atômicos. Cada instância guarda até que byte do
+    arquivo já leu e, a cada consulta, lê apenas o que foi acrescentado desde
+    então. Em plataformas sem fcntl a trava não tem efeito.
+
+    Os clientes lidos ficam em cache junto com a identidade do arquivo
+    (dispositivo, inode, tamanho e mtime): load_all não relê um arquivo
+    inalterado e, se ele apenas cresceu, lê só o final. Um arquivo trocado,
+    truncado ou alterado no meio é relido por inteiro.
+
+    As consultas por nível, domínio e email normalizado usam índices
+    secundários sobre os clientes em cache, montados na primeira consulta e
+    atualizados a cada linha lida ou gravada.
+
+    load_page e count não usam o cache: um índice esparso de offsets leva
+    cada página direto ao trecho do arquivo onde ela está. As consultas só o
+    estendem em memória; ele é gravado ao lado do arquivo, com o sufixo .idx,
+    em flush, close ou save_page_index.
+    """
+
+    # Bytes antes do offset sincronizado comparados para confirmar que o
+    # arquivo apenas cresceu desde a última leitura
+    _FINGERPRINT_SIZE = 64
+    # Bytes do início do arquivo cobertos pelo CRC guardado em snapshots e
+    # índices, junto com o dispositivo e o inode
+    _HEAD_SIZE = 64 * 1024
+
+    DEFAULT_FLUSH_SIZE = 64 * 1024
+    DEFAULT_FLUSH_INTERVAL = 1.0
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        buffered: bool = False,
+        durability: DurabilityPolicy = DurabilityPolicy.NONE,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
         """Inicializa o repositório de clientes."""
+        if flush_size <= 0:
+            raise ValueError("O tamanho de descarga deve ser positivo")
+        if flush_interval < 0:
+            raise ValueError("O intervalo de descarga não pode ser negativo")
+
         self._file_path = file_path
+        self._clients: list[Client] = []
+        self._partial_client: Optional[Client] = None
+        self._email_index: dict[str, Client] = {}
+        self._indexes: Optional[ClientIndexes] = None
+        self._page_index: Optional["PageIndex"] = None
+        self._page_index_dirty = False
+        # CRC do início do arquivo, pela identidade sem o tamanho e os bytes lidos
+        self._head_crc: Optional[tuple[tuple[int, int, int, int], int]] = None
+        self._identity: Optional[tuple[int, int, int, int]] = None
+        self._fingerprint = b""
+        self._synced_offset = 0  # fim da última linha completa já lida
+        self._seen_size = 0  # tamanho do arquivo na última leitura
+        self._hits = 0
+        self._tail_parses = 0
+        self._full_reloads = 0
+
+        self._buffered = buffered
+        self._durability = durability
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._handle = None
+        self._pending: list[tuple[Client, bytes]] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._rejected: list[Client] = []
+        self._unsynced = False
+        self._closes_at_exit = False
+
+    def __enter__(self) -> "FileClientRepository":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def exists(self, email: str) -> bool:
         """Verifica se um cliente com o email já existe."""
-        try:
-            clients = self.load_all()
-            return any(client.email == email for client in clients)
-        except FileNotFoundError:
-            return False
+        return email in self._get_email_index()
 
+    @timed
     def save(self, client: Client) -> None:
         """Salva o cliente no arquivo em formato CSV."""
-        if self.exists(client.email):
-            raise ValueError(f"Cliente com email {client.email} já está cadastrado")
-        
-        with open(self._file_path, "a", encoding="utf-8") as file:
-            line = f"{client.name},{client.email},{client.tier}\n"
-            file.write(line)
+        line = self._format_line(client).encode("utf-8")
+
+        if self._buffered:
+            email_index = self._get_email_index()
+            if client.email in email_index:
+                raise ValueError(f"Cliente com email {client.email} já está cadastrado")
+            email_index[client.email] = client
+            self._buffer([(client, line)])
+            return
+
+        with self._locked_file() as file:
+            self._sync(file)
+            if client.email in self._email_index:
+                raise ValueError(f"Cliente com email {client.email} já está cadastrado")
+            self._write_locked(file, [(client, line)], self._sync_each_write)
+
+    @timed
+    def save_many(self, clients: List[Client]) -> List[bool]:
+        """
+        Salva um lote de clientes com uma única escrita no arquivo.
+
+        No modo buffered, um cliente aceito ainda pode ser descartado na
+        descarga se outro processo gravar o mesmo email antes; veja flush().
+        """
+        if self._buffered:
+            saved, entries = self._accept(clients, self._get_email_index())
+            if entries:
+                self._buffer(entries)
+            return saved
+
+        with self._locked_file() as file:
+            self._sync(file)
+            saved, entries = self._accept(clients, self._email_index)
+            if entries:
+                self._write_locked(file, entries, self._sync_each_write)
+        return saved
+
+    @timed
+    def flush(self) -> List[Client]:
+        """
+        Grava as linhas pendentes e sincroniza o arquivo com o disco.
+
+        Retorna os clientes descartados desde a última chamada porque outro
+        processo gravou o mesmo email antes da descarga.
+        """
+        self._write_pending(sync=True)
+        if self._page_index_dirty:
+            try:
+                self.save_page_index()
+            except OSError:
+                # Sem permissão de escrita, o índice fica só em memória
+                pass
+        rejected, self._rejected = self._rejected, []
+        return rejected
 
+    def save_page_index(self) -> None:
+        """Grava o índice de páginas em memória ao lado do arquivo de clientes."""
+        from infrastructure import page_index  # pylint: disable=import-outside-toplevel
+
+        if self._page_index is not None:
+            self._page_index.write(self._file_path + page_index.PAGE_INDEX_SUFFIX)
+        self._page_index_dirty = False
+
+    def close(self) -> None:
+        """Descarrega as linhas pendentes e fecha o arquivo."""
+        self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._closes_at_exit:
+            atexit.unregister(self.close)
+            self._closes_at_exit = False
+
+    @timed
     def load_all(self) -> List[Client]:
-        """Carrega todos os clientes do arquivo."""
-        clients = []
+        """Carrega todos os clientes do arquivo, relendo só o que mudou."""
+        result = self._refresh()
+        if result is _Sync.HIT:
+            self._hits += 1
+        elif result is _Sync.TAIL:
+            self._tail_parses += 1
+        else:
+            self._full_reloads += 1
 
-        try:
-            with open(self._file_path, "r", encoding="utf-8") as file:
-                for line in file:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    parts = line.split(",")
-                    if len(parts) == 3:
-                        try:
-                            client = Client(
-                                name=parts[0].strip(),
-                                email=parts[1].strip(),
-                                tier=parts[2].strip(),
-                            )
-                            clients.append(client)
-                        except ValueError:
-                            # Pula clientes inválidos
-                            continue
+        clients = list(self._clients)
+        if self._partial_client is not None:
+            clients.append(self._partial_client)
+        return clients
+
+    def find_by_tier(self, tier: str) -> List[Client]:
+        """Clientes do nível informado."""
+        rows = self._get_indexes().tier_rows(tier)
+        return self._with_partial(rows, lambda client: client.tier == tier)
+
+    def find_by_domain(self, domain: str) -> List[Client]:
+        """Clientes com email no domínio informado, sem diferenciar maiúsculas."""
+        rows = self._get_indexes().domain_rows(domain)
+        domain = normalize_email(domain)
+        return self._with_partial(
+            rows, lambda client: email_domain(client.email) == domain
+        )
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Primeiro cliente com o email informado, sem diferenciar maiúsculas."""
+        row = self._get_indexes().email_row(email)
+        if row is not None:
+            return self._clients[row]
+
+        email = normalize_email(email)
+        matches = self._with_partial(
+            (), lambda client: normalize_email(client.email) == email
+        )
+        return matches[0] if matches else None
+
+    def count_by_tier(self) -> dict[str, int]:
+        """Quantidade de clientes de cada nível."""
+        counts = self._get_indexes().tier_counts()
+        if self._partial_client is not None:
+            tier = self._partial_client.tier
+            counts[tier] = counts.get(tier, 0) + 1
+        return counts
+
+    def count(self) -> int:
+        """Quantidade de clientes no arquivo, pelo índice de páginas."""
+        self._write_pending()
+        with self._open_file() as file:
+            index = self._get_page_index(file)
+            # Depois da parte indexada só resta uma última linha sem quebra
+            file.seek(index.csv_offset)
+            tail = [self._parse_line(raw_line.decode("utf-8")) for raw_line in file]
+        return index.rows + sum(client is not None for client in tail)
+
+    def load_page(self, cursor: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ClientPage:
+        """
+        Página de até limit clientes a partir da posição cursor.
+
+        O índice de páginas dá o offset do marco mais próximo antes do cursor;
+        dali são lidas só as linhas até o cursor (menos que o intervalo do
+        índice), as da página e mais uma, para saber se há próxima página.
+        """
+        check_page(cursor, limit)
+        self._write_pending()
+        with self._open_file() as file:
+            offset, position = self._get_page_index(file).seek(cursor)
+            file.seek(offset)
+            clients = []
+            for raw_line in file:
+                client = self._parse_line(raw_line.decode("utf-8"))
+                if client is None:
+                    continue
+                if position >= cursor:
+                    clients.append(client)
+                    if len(clients) > limit:
+                        break
+                position += 1
+        return ClientPage.from_rows(clients, cursor, limit)
+
+    def load_stats(self) -> LoadStats:
+        """Retorna os contadores do cache de load_all."""
+        return LoadStats(
+            hits=self._hits,
+            tail_parses=self._tail_parses,
+            full_reloads=self._full_reloads,
+        )
+
+    def iter_clients(self) -> Iterator[Client]:
+        """
+        Itera sobre os clientes do arquivo sob demanda.
+
+        O arquivo é lido via mmap, então apenas as páginas percorridas são
+        carregadas e o consumidor pode interromper a iteração a qualquer momento.
+        """
+        # Linhas ainda no buffer também devem ser lidas
+        self._write_pending()
+
+        with self._open_file() as file:
+            # mmap não aceita arquivos vazios
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for raw_line in iter(mapped.readline, b""):
+                    client = self._parse_line(raw_line.decode("utf-8"))
+                    if client is not None:
+                        yield client
+
+    def snapshot(self, path: Optional[str] = None) -> str:
+        """
+        Grava um snapshot binário das linhas completas do arquivo.
+
+        Por padrão o snapshot fica ao lado do arquivo, com o sufixo .snap. Ele
+        é gravado de forma atômica e registra até que byte do arquivo leu;
+        linhas ainda no buffer entram no arquivo depois e são reaplicadas por
+        load_table. Retorna o caminho do snapshot.
+        """
+        from infrastructure import snapshot  # pylint: disable=import-outside-toplevel
+
+        self._write_pending()
+        path = path or self._file_path + snapshot.SNAPSHOT_SUFFIX
+
+        with open(self._file_path, "rb") as file:
+            offset = 0
+
+            def complete_lines() -> Iterator[Client]:
+                nonlocal offset
+                # Só linhas completas: outro processo pode estar gravando
+                for raw_line in file:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    offset += len(raw_line)
+                    client = self._parse_line(raw_line.decode("utf-8"))
+                    if client is not None:
+                        yield client
+
+            table = snapshot.ClientTable(complete_lines())
+            fingerprint = self._read_fingerprint(file, offset)
+            identity = self._read_csv_identity(file, offset)
+        snapshot.write_snapshot(path, table, offset, fingerprint, identity)
+        return path
+
+    def load_table(self, path: Optional[str] = None) -> "SnapshotTable":
+        """
+        Carrega os clientes numa tabela colunar, partindo do snapshot.
+
+        O snapshot é mapeado via mmap, sem criar objetos por linha, e só as
+        linhas acrescentadas ao arquivo depois dele são lidas e reaplicadas.
+        Se o snapshot não existir ou não corresponder mais ao arquivo (outro
+        arquivo no mesmo caminho, ou este reescrito ou truncado), o arquivo
+        inteiro é lido.
+        """
+        from infrastructure import snapshot  # pylint: disable=import-outside-toplevel
+
+        self._write_pending()
+        path = path or self._file_path + snapshot.SNAPSHOT_SUFFIX
+
+        with self._open_file() as file:
+            try:
+                table = snapshot.SnapshotTable.open(path)
+            except (FileNotFoundError, ValueError):
+                table = snapshot.SnapshotTable()
+            if not self._covers(file, table):
+                table.close()
+                table = snapshot.SnapshotTable()
 
+            file.seek(table.csv_offset)
+            for raw_line in file:
+                client = self._parse_line(raw_line.decode("utf-8"))
+                if client is not None:
+                    table.append(client)
+        return table
+
+    def _open_file(self) -> BinaryIO:
+        """Abre o arquivo de clientes para leitura."""
+        try:
+            return open(self._file_path, "rb")
         except FileNotFoundError as exc:
             raise FileNotFoundError(
                 f"Arquivo de clientes não encontrado: {self._file_path}"
             ) from exc
 
+    def _get_page_index(self, file: BinaryIO) -> "PageIndex":
+        """
+        Índice de páginas do arquivo aberto, estendido com as linhas novas.
+
+        Parte do índice em memória ou do gravado em disco; se ele não
+        corresponder mais ao arquivo (outro arquivo no mesmo caminho, ou este
+        reescrito ou truncado), é refeito. As linhas completas acrescentadas
+        são indexadas só em memória; a gravação fica para save_page_index.
+        """
+        from infrastructure import page_index  # pylint: disable=import-outside-toplevel
+
+        path = self._file_path + page_index.PAGE_INDEX_SUFFIX
+        index = self._page_index
+        if index is None:
+            try:
+                index = page_index.PageIndex.read(path)
+            except (FileNotFoundError, ValueError):
+                index = page_index.PageIndex()
+        if not self._covers(file, index):
+            index = page_index.PageIndex()
+
+        file.seek(index.csv_offset)
+        offset = index.csv_offset
+        for raw_line in file:
+            # Só linhas completas: a última pode estar sendo gravada
+            if not raw_line.endswith(b"\n"):
+                break
+            if self._parse_line(raw_line.decode("utf-8")) is not None:
+                index.add(offset)
+            offset += len(raw_line)
+
+        if offset != index.csv_offset:
+            index.cover(
+                offset,
+                self._read_fingerprint(file, offset),
+                self._read_csv_identity(file, offset),
+            )
+            self._page_index_dirty = True
+        self._page_index = index
+        return index
+
+    @property
+    def _sync_each_write(self) -> bool:
+        """Indica se gravações fora do buffer devem fazer fsync."""
+        return self._durability is not DurabilityPolicy.NONE
+
+    def _refresh(self) -> "_Sync":
+        """Grava o que estiver pendente e sincroniza o cache com o arquivo."""
+        self._write_pending()
+
+        with self._open_file() as file:
+            return self._sync(file)
+
+    def _get_indexes(self) -> ClientIndexes:
+        """Sincroniza o cache e retorna os índices, montando-os se preciso."""
+        self._refresh()
+        if self._indexes is None:
+            indexes = ClientIndexes()
+            for row, client in enumerate(self._clients):
+                indexes.add(row, client.email, client.tier_code)
+            self._indexes = indexes
+        return self._indexes
+
+    def _append_client(self, client: Client) -> None:
+        """Acrescenta um cliente lido ou gravado ao cache e aos índices."""
+        self._clients.append(client)
+        if self._indexes is not None:
+            self._indexes.add(len(self._clients) - 1, client.email, client.tier_code)
+
+    def _with_partial(
+        self, rows: Iterable[int], matches: Callable[[Client], bool]
+    ) -> List[Client]:
+        """Clientes das linhas, mais a última linha incompleta se corresponder."""
+        clients = [self._clients[row] for row in rows]
+        partial = self._partial_client
+        if partial is not None and matches(partial):
+            clients.append(partial)
         return clients
+
+    def _get_email_index(self) -> dict[str, Client]:
+        """Retorna o índice email→cliente, lendo antes o que outros acrescentaram."""
+        try:
+            stat = os.stat(self._file_path)
+        except FileNotFoundError:
+            return self._email_index
+
+        if _identity(stat) != self._identity:
+            with open(self._file_path, "rb") as file:
+                self._sync(file)
+        return self._email_index
+
+    def _sync(self, file: BinaryIO) -> "_Sync":
+        """Atualiza o cache e o índice com o arquivo aberto, se ele mudou."""
+        stat = os.fstat(file.fileno())
+        identity = _identity(stat)
+        if identity == self._identity:
+            return _Sync.HIT
+
+        result = _Sync.TAIL
+        if not self._only_grew(file, stat):
+            self._reset()
+            result = _Sync.FULL
+
+        self._read_tail(file)
+        self._identity = identity
+        return result
+
+    def _only_grew(self, file: BinaryIO, stat: os.stat_result) -> bool:
+        """Verifica se o arquivo é o já lido, apenas com linhas acrescentadas."""
+        if self._identity is None or self._identity[:2] != _identity(stat)[:2]:
+            return False
+        if stat.st_size <= self._seen_size:
+            return False
+        return self._read_fingerprint(file) == self._fingerprint
+
+    def _reset(self) -> None:
+        """Descarta o cache para reler o arquivo do início."""
+        self._clients.clear()
+        self._indexes = None
+        self._partial_client = None
+        self._email_index.clear()
+        # Linhas ainda no buffer continuam reservando seus emails
+        for client, _ in self._pending:
+            self._email_index[client.email] = client
+        self._synced_offset = 0
+        self._seen_size = 0
+
+    def _read_tail(self, file: BinaryIO) -> None:
+        """
+        Lê as linhas acrescentadas ao arquivo desde a última leitura.
+
+        Só linhas completas avançam o offset sincronizado; uma última linha
+        sem quebra entra no índice, mas é relida da próxima vez.
+        """
+        file.seek(self._synced_offset)
+        position = self._synced_offset
+        self._partial_client = None
+        for raw_line in file:
+            position += len(raw_line)
+            client = self._parse_line(raw_line.decode("utf-8"))
+            if raw_line.endswith(b"\n"):
+                self._synced_offset = position
+                if client is not None:
+                    self._append_client(client)
+            else:
+                self._partial_client = client
+            if client is not None:
+                self._email_index[client.email] = client
+
+        self._seen_size = position
+        self._fingerprint = self._read_fingerprint(file)
+
+    def _read_fingerprint(self, file: BinaryIO, offset: Optional[int] = None) -> bytes:
+        """Lê os bytes que antecedem o offset (por padrão, o sincronizado)."""
+        if offset is None:
+            offset = self._synced_offset
+        start = max(0, offset - self._FINGERPRINT_SIZE)
+        file.seek(start)
+        return file.read(offset - start)
+
+    def _read_csv_identity(self, file: BinaryIO, offset: int) -> tuple[int, int, int]:
+        """
+        Dispositivo, inode e CRC do início do arquivo, até o offset.
+
+        O CRC é reaproveitado enquanto o arquivo tiver o mesmo dispositivo,
+        inode e mtime e a mesma quantidade de bytes for comparada.
+        """
+        stat = os.fstat(file.fileno())
+        size = min(offset, self._HEAD_SIZE)
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, size)
+        if self._head_crc is None or self._head_crc[0] != key:
+            import zlib  # pylint: disable=import-outside-toplevel
+
+            file.seek(0)
+            self._head_crc = (key, zlib.crc32(file.read(size)))
+        return (stat.st_dev, stat.st_ino, self._head_crc[1])
+
+    def _covers(self, file: BinaryIO, mark: "SnapshotTable | PageIndex") -> bool:
+        """
+        Verifica se o snapshot ou índice foi gerado deste arquivo.
+
+        O arquivo precisa ser o mesmo (dispositivo e inode), com o mesmo
+        início e os mesmos bytes antes do offset coberto. Um arquivo trocado
+        por outro de mesmo tamanho, ou editado no início, é recusado.
+        """
+        if mark.csv_offset == 0:
+            # Nada coberto: vale para qualquer arquivo
+            return True
+        return mark.csv_identity == self._read_csv_identity(
+            file, mark.csv_offset
+        ) and mark.fingerprint == self._read_fingerprint(file, mark.csv_offset)
+
+    @contextmanager
+    def _locked_file(self) -> Iterator[BinaryIO]:
+        """Abre o arquivo para acréscimo e o mantém sob trava exclusiva."""
+        if not self._buffered:
+            with open(self._file_path, "a+b") as file, _exclusive_lock(file):
+                yield file
+            return
+
+        if self._handle is None:
+            self._handle = open(self._file_path, "a+b")
+        with _exclusive_lock(self._handle):
+            yield self._handle
+
+    def _write_locked(
+        self, file: BinaryIO, entries: list[tuple[Client, bytes]], sync: bool
+    ) -> None:
+        """Acrescenta as linhas ao arquivo travado, cujo fim já foi lido."""
+        data = b"".join(line for _, line in entries)
+        if self._seen_size > self._synced_offset:
+            # A última linha do arquivo não terminava em quebra de linha
+            data = b"\n" + data
+            if self._partial_client is not None:
+                self._append_client(self._partial_client)
+                self._partial_client = None
+
+        file.write(data)
+        file.flush()
+        if sync:
+            os.fsync(file.fileno())
+        self._unsynced = not sync
+
+        for client, _ in entries:
+            self._append_client(client)
+            self._email_index[client.email] = client
+        stat = os.fstat(file.fileno())
+        self._synced_offset = self._seen_size = stat.st_size
+        self._fingerprint = self._read_fingerprint(file)
+        self._identity = _identity(stat)
+
+    def _accept(
+        self, clients: List[Client], email_index: dict[str, Client]
+    ) -> tuple[List[bool], list[tuple[Client, bytes]]]:
+        """Separa os clientes com email inédito, registrando-os no índice."""
+        saved = []
+        entries = []
+        for client in clients:
+            if client.email in email_index:
+                saved.append(False)
+                continue
+            email_index[client.email] = client
+            entries.append((client, self._format_line(client).encode("utf-8")))
+            saved.append(True)
+        return saved, entries
+
+    def _buffer(self, entries: list[tuple[Client, bytes]]) -> None:
+        """Acumula linhas no buffer e o descarrega ao atingir os limites."""
+        if not self._closes_at_exit:
+            # Sem close, as linhas do buffer seriam perdidas na saída
+            atexit.register(self.close)
+            self._closes_at_exit = True
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.extend(entries)
+        self._pending_bytes += sum(len(line) for _, line in entries)
+
+        if (
+            self._durability is DurabilityPolicy.WRITE
+            or self._pending_bytes >= self._flush_size
+            or time.monotonic() - self._pending_since >= self._flush_interval
+        ):
+            self._write_pending(sync=self._sync_each_write)
+
+    def _write_pending(self, sync: bool = False) -> None:
+        """
+        Escreve as linhas pendentes sob trava e, se pedido, faz fsync.
+
+        Antes de gravar, lê o que outros processos acrescentaram; linhas cujo
+        email apareceu nesse meio tempo são descartadas e guardadas para flush().
+        """
+        if self._pending:
+            with self._locked_file() as file:
+                self._sync(file)
+                entries = []
+                for client, line in self._pending:
+                    # Se o índice aponta para outro cliente, o email veio do arquivo
+                    if self._email_index.get(client.email, client) is client:
+                        entries.append((client, line))
+                    else:
+                        self._rejected.append(client)
+                if entries:
+                    self._write_locked(file, entries, sync)
+            self._pending.clear()
+            self._pending_bytes = 0
+
+        if sync and self._unsynced:
+            if self._handle is not None:
+                os.fsync(self._handle.fileno())
+            else:
+                with open(self._file_path, "ab") as file:
+                    os.fsync(file.fileno())
+            self._unsynced = False
+
+    @staticmethod
+    def _format_line(client: Client) -> str:
+        """Formata o cliente como uma linha CSV."""
+        return f"{client.name},{client.email},{client.tier}\n"
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Client]:
+        """Converte uma linha CSV em cliente, ou None se for inválida."""
+        line = line.strip()
+        if not line:
+            return None
+
+        parts = line.split(",")
+        if len(parts) != 3:
+            return None
+
+        try:
+            return Client(
+                name=parts[0].strip(),
+                email=parts[1].strip(),
+                tier=parts[2].strip(),
+            )
+        except ValueError:
+            # Pula clientes inválidos
+            return None
+
+
+class _Sync(Enum):
+    """Resultado da sincronização do cache com o arquivo."""
+
+    HIT = "hit"
+    TAIL = "tail"
+    FULL = "full"
+
+
+def _identity(stat: os.stat_result) -> tuple[int, int, int, int]:
+    """Identidade do arquivo usada para validar o cache."""
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+@contextmanager
+def _exclusive_lock(file: BinaryIO) -> Iterator[None]:
+    """Mantém uma trava exclusiva (advisory) sobre o arquivo aberto."""
+    if fcntl is None:
+        yield
+        return
+
+    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
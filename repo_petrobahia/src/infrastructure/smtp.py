@@ -0,0 +1,401 @@
+import re
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import EmailMessage as MimeMessage
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import formatdate
+from typing import Iterator, List, Optional
+
+from domain.entities import EmailMessage
+from domain.services import EmailSender
+from services.metrics import timed
+
+# Linhas do conteúdo que começam com ponto recebem outro (RFC 5321, 4.5.2)
+_LEADING_DOT = re.compile(rb"(?m)^\.")
+
+# Falhas de conexão que justificam reconectar e reenviar o que faltou
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class TokenBucket:
+    """
+    Limitador de taxa por balde de fichas.
+
+    O balde comporta até capacity fichas e recebe rate fichas por segundo;
+    cada envio consome uma. Rajadas de até capacity envios passam direto e,
+    com o balde vazio, acquire espera pela próxima ficha. É seguro entre
+    threads: quem chega depois reserva a ficha seguinte.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Inicializa o balde cheio; por padrão, comporta um segundo de fichas."""
+        if rate <= 0:
+            raise ValueError("A taxa do limitador deve ser positiva")
+        limit = float(rate if capacity is None else capacity)
+        if limit < 1:
+            raise ValueError("O limitador deve comportar ao menos uma ficha")
+
+        self._rate = rate
+        self._capacity = limit
+        self._tokens = limit
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Consome uma ficha, esperando por ela se preciso; retorna a espera."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            # Fichas negativas são reservas de quem está esperando
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class _Session:
+    """Conexão SMTP do pool e quantas mensagens já enviou."""
+
+    __slots__ = ("smtp", "pipelining", "sent")
+
+    def __init__(self, smtp: smtplib.SMTP, pipelining: bool):
+        """Registra a conexão recém-aberta."""
+        self.smtp = smtp
+        self.pipelining = pipelining
+        self.sent = 0
+
+
+class _Delivery:
+    """Progresso de um lote: quantas mensagens tiveram resposta final."""
+
+    __slots__ = ("messages", "done", "refused")
+
+    def __init__(self, messages: List[EmailMessage]):
+        """Inicia o lote sem nenhuma mensagem entregue."""
+        self.messages = messages
+        self.done = 0
+        # Recusas pela posição da mensagem: o mesmo destinatário pode se repetir
+        self.refused: dict[int, tuple[int, bytes]] = {}
+
+    def refuse(self, reply: tuple[int, bytes]) -> None:
+        """Registra a recusa da mensagem em andamento e passa à seguinte."""
+        self.refused[self.done] = reply
+        self.done += 1
+
+
+class SmtpEmailSender(EmailSender):
+    """
+    Remetente de emails por SMTP com pool de conexões persistentes.
+
+    Até pool_size conexões ficam abertas e são reaproveitadas entre envios;
+    cada uma é encerrada depois de max_messages_per_session mensagens, limite
+    comum nos servidores. send_many entrega o lote em uma só sessão e, se o
+    servidor anuncia PIPELINING (RFC 2920), envia o conteúdo de uma mensagem
+    junto com o envelope da seguinte, com uma ida e volta por mensagem em vez
+    de quatro. Chamadas simultâneas usam conexões diferentes do pool: para
+    paralelizar, use-o sob um QueuedEmailSender com vários workers.
+
+    Se a conexão cair, ela é descartada e as mensagens ainda sem resposta
+    final são reenviadas em outra, desistindo após max_reconnects quedas
+    seguidas sem progresso; uma mensagem cuja resposta se perdeu na queda
+    pode chegar duas vezes.
+    Destinatários recusados, inclusive endereços inválidos (recusados aqui
+    mesmo com 501, sem ir ao servidor), não interrompem o lote: send_each
+    informa o resultado de cada mensagem, e send_many levanta ao final
+    smtplib.SMTPRecipientsRefused com os recusados.
+    """
+
+    DEFAULT_POOL_SIZE = 4
+    DEFAULT_MAX_MESSAGES_PER_SESSION = 100
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        from_address: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_messages_per_session: int = DEFAULT_MAX_MESSAGES_PER_SESSION,
+        max_reconnects: int = 2,
+        rate_limiter: Optional[TokenBucket] = None,
+        timeout: float = 10.0,
+        starttls: bool = False,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pipelining: bool = True,
+    ):
+        """Configura o remetente; as conexões são abertas sob demanda."""
+        if pool_size <= 0:
+            raise ValueError("O tamanho do pool deve ser positivo")
+        if max_messages_per_session <= 0:
+            raise ValueError("O limite de mensagens por sessão deve ser positivo")
+        if max_reconnects < 0:
+            raise ValueError("O limite de reconexões não pode ser negativo")
+
+        self._host = host
+        self._port = port
+        self._from_address = from_address
+        self._envelope_from = _envelope_address(from_address)
+        self._max_messages = max_messages_per_session
+        self._max_reconnects = max_reconnects
+        self._rate_limiter = rate_limiter
+        self._timeout = timeout
+        self._starttls = starttls
+        self._credentials = (username, password) if username is not None else None
+        self._pipelining = pipelining
+
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._idle: list[_Session] = []
+        self._idle_lock = threading.Lock()
+
+    def __enter__(self) -> "SmtpEmailSender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def send(self, to: str, subject: str, body: str) -> None:
+        """Envia um email por uma conexão do pool."""
+        self.send_many([EmailMessage(to=to, subject=subject, body=body)])
+
+    @timed
+    def send_many(self, messages: List[EmailMessage]) -> None:
+        """Envia um lote de emails pela mesma conexão, reconectando se cair."""
+        messages = list(messages)
+        results = self.send_each(messages)
+        refused = {}
+        for message, error in zip(messages, results):
+            if isinstance(error, smtplib.SMTPResponseException):
+                refused[message.to] = (error.smtp_code, error.smtp_error)
+            elif error is not None:
+                raise error
+        if refused:
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+    @timed
+    def send_each(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        """
+        Envia um lote pela mesma conexão e informa o resultado de cada mensagem.
+
+        Recusas viram smtplib.SMTPResponseException com o código do servidor.
+        Se as reconexões se esgotarem, as mensagens ainda sem resposta final
+        recebem o erro da última queda; as anteriores mantêm seu resultado.
+        """
+        delivery = _Delivery(list(messages))
+        failure: Optional[Exception] = None
+        try:
+            self._deliver(delivery)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            failure = exc
+
+        results: List[Optional[Exception]] = [None] * len(delivery.messages)
+        for index, (code, text) in delivery.refused.items():
+            results[index] = smtplib.SMTPResponseException(code, text)
+        for index in range(delivery.done, len(delivery.messages)):
+            results[index] = failure
+        return results
+
+    def close(self) -> None:
+        """Encerra as conexões ociosas do pool."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for session in idle:
+            _quit(session.smtp)
+
+    def _deliver(self, delivery: _Delivery) -> None:
+        """Entrega o lote, reconectando quando a conexão cai."""
+        reconnects = 0
+        while delivery.done < len(delivery.messages):
+            done = delivery.done
+            try:
+                with self._session() as session:
+                    if session.pipelining:
+                        self._deliver_pipelined(session, delivery)
+                    else:
+                        self._deliver_sequential(session, delivery)
+            except _CONNECTION_ERRORS:
+                # Só conta quedas seguidas, sem nenhuma mensagem entregue entre elas
+                reconnects = 1 if delivery.done > done else reconnects + 1
+                if reconnects > self._max_reconnects:
+                    raise
+
+    @contextmanager
+    def _session(self) -> Iterator[_Session]:
+        """Empresta uma conexão do pool, abrindo outra se não houver ociosa."""
+        with self._slots:
+            with self._idle_lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                session = self._connect()
+
+            try:
+                yield session
+            except BaseException:
+                # A conexão pode ter ficado no meio de uma transação
+                session.smtp.close()
+                raise
+
+            if session.sent >= self._max_messages:
+                _quit(session.smtp)
+            else:
+                with self._idle_lock:
+                    self._idle.append(session)
+
+    def _connect(self) -> _Session:
+        """Abre e prepara uma conexão nova."""
+        smtp = smtplib.SMTP(self._host, self._port, timeout=self._timeout)
+        try:
+            smtp.ehlo()
+            if self._starttls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self._credentials is not None:
+                smtp.login(*self._credentials)
+        except BaseException:
+            smtp.close()
+            raise
+        return _Session(smtp, self._pipelining and smtp.has_extn("pipelining"))
+
+    def _deliver_sequential(self, session: _Session, delivery: _Delivery) -> None:
+        """Envia as mensagens uma a uma, esperando cada resposta."""
+        end = self._session_end(session, delivery)
+        while delivery.done < end:
+            message = delivery.messages[delivery.done]
+            invalid = _invalid_address(message.to)
+            if invalid is not None:
+                delivery.refuse(invalid)
+                continue
+
+            self._acquire()
+            session.sent += 1
+            try:
+                session.smtp.sendmail(
+                    self._from_address, [message.to], self._format(message)
+                )
+            except smtplib.SMTPRecipientsRefused as exc:
+                delivery.refuse(next(iter(exc.recipients.values())))
+            except smtplib.SMTPResponseException as exc:
+                if exc.smtp_code == 421:
+                    raise smtplib.SMTPServerDisconnected(exc.smtp_error) from exc
+                delivery.refuse((exc.smtp_code, exc.smtp_error))
+            else:
+                delivery.done += 1
+
+    def _deliver_pipelined(self, session: _Session, delivery: _Delivery) -> None:
+        """
+        Envia as mensagens com pipelining.
+
+        Cada escrita leva o conteúdo da mensagem anterior e o envelope (MAIL,
+        RCPT e DATA) da próxima; as respostas de uma escrita são lidas antes
+        da seguinte. Um endereço inválido é recusado sem ir ao servidor, depois
+        de enviar o conteúdo pendente.
+        """
+        smtp = session.smtp
+        end = self._session_end(session, delivery)
+        content = b""  # conteúdo já aceito pelo DATA, ainda não enviado
+
+        for index in range(delivery.done, end):
+            message = delivery.messages[index]
+            invalid = _invalid_address(message.to)
+            if invalid is not None:
+                if content:
+                    smtp.send(content)
+                    self._finish(session, delivery, _reply(smtp))
+                    content = b""
+                delivery.refuse(invalid)
+                continue
+
+            recipient = _envelope_address(message.to)
+            self._acquire()
+            smtp.send(
+                content
+                + f"MAIL FROM:{self._envelope_from}\r\n".encode("ascii")
+                + f"RCPT TO:{recipient}\r\n".encode("ascii")
+                + b"DATA\r\n"
+            )
+            if content:
+                self._finish(session, delivery, _reply(smtp))
+
+            replies = [_reply(smtp) for _ in range(3)]
+            if replies[2][0] == 354:
+                content = _LEADING_DOT.sub(b"..", self._format(message)) + b".\r\n"
+                continue
+
+            # MAIL ou RCPT recusado: a primeira falha explica o DATA recusado
+            content = b""
+            smtp.rset()
+            session.sent += 1
+            delivery.refuse(next(reply for reply in replies if reply[0] >= 400))
+
+        if content:
+            smtp.send(content)
+            self._finish(session, delivery, _reply(smtp))
+
+    def _finish(
+        self, session: _Session, delivery: _Delivery, reply: tuple[int, bytes]
+    ) -> None:
+        """Registra a resposta final da mensagem em andamento."""
+        session.sent += 1
+        if reply[0] != 250:
+            delivery.refuse(reply)
+        else:
+            delivery.done += 1
+
+    def _session_end(self, session: _Session, delivery: _Delivery) -> int:
+        """Índice após a última mensagem que cabe na sessão."""
+        remaining = self._max_messages - session.sent
+        return min(len(delivery.messages), delivery.done + remaining)
+
+    def _acquire(self) -> None:
+        """Respeita o limite de taxa antes de cada mensagem."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    def _format(self, message: EmailMessage) -> bytes:
+        """Monta a mensagem MIME com quebras de linha CRLF."""
+        mime = MimeMessage(policy=SMTP_POLICY)
+        mime["From"] = self._from_address
+        mime["To"] = message.to
+        mime["Subject"] = message.subject
+        mime["Date"] = formatdate(localtime=True)
+        # quoted-printable mantém a mensagem em 7 bits, aceita por qualquer servidor
+        mime.set_content(message.body, cte="quoted-printable")
+        return mime.as_bytes()
+
+
+def _envelope_address(address: str) -> str:
+    """Endereço entre < e > para os comandos MAIL e RCPT."""
+    invalid = _invalid_address(address)
+    if invalid is not None:
+        raise ValueError(invalid[1].decode("utf-8"))
+    return f"<{address.strip()}>"
+
+
+def _invalid_address(address: str) -> Optional[tuple[int, bytes]]:
+    """Recusa para endereços que o envelope não comporta, ou None se válido."""
+    if any(character in address for character in "\r\n<>"):
+        return (501, f"Endereço de email inválido: {address!r}".encode("utf-8"))
+    if not address.isascii():
+        # Sem SMTPUTF8, MAIL e RCPT só aceitam endereços ASCII
+        return (553, f"Endereço de email fora do ASCII: {address!r}".encode("utf-8"))
+    return None
+
+
+def _reply(smtp: smtplib.SMTP) -> tuple[int, bytes]:
+    """Lê uma resposta; 421 indica que o servidor vai encerrar a conexão."""
+    code, text = smtp.getreply()
+    if code == 421:
+        raise smtplib.SMTPServerDisconnected(text.decode("utf-8", "replace"))
+    return code, text
+
+
+def _quit(smtp: smtplib.SMTP) -> None:
+    """Encerra a conexão educadamente, ignorando uma que já caiu."""
+    try:
+        smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp.close()
@@ -0,0 +1,435 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from domain.entities import Client
+from domain.repositories import ClientReader
+from domain.tiers import TIERS
+from infrastructure.client_table import ClientRow, ClientTable
+from infrastructure.indexes import IndexedRows
+
+SNAPSHOT_SUFFIX = ".snap"
+
+MAGIC = b"PBSNAP"
+VERSION = 2
+
+# Cabeçalho (little-endian): magic, versão, quantidade de níveis, linhas,
+# offset do CSV coberto pelo snapshot, tamanho e bytes da impressão digital
+# do CSV, identidade do CSV (dispositivo, inode e CRC do início), tamanho do
+# arquivo e o início de cada seção
+_HEADER = struct.Struct("<6sHIQQB64s7xQQI4xQ6Q")
+_TIER_LENGTH = struct.Struct("<H")
+_ALIGNMENT = 8
+# Os códigos de nível são gravados em 16 bits, como na ClientTable
+_MAX_TIERS = 1 << 16
+
+
+class SnapshotTable(IndexedRows, ClientReader):
+    """
+    Tabela de clientes carregada de um snapshot binário via mmap.
+
+    O snapshot guarda as mesmas colunas da ClientTable (buffers UTF-8 de nomes
+    e emails, offsets de fim de cada linha e códigos de nível), então abri-lo
+    não cria objetos por linha e cada linha é acessada em O(1) direto nas
+    páginas mapeadas. Os códigos de nível valem só no processo que gravou:
+    o arquivo leva também o texto de cada nível, reinternado em TIERS na
+    abertura. Linhas acrescentadas depois ficam numa ClientTable em memória.
+    """
+
+    def __init__(self):
+        """Inicializa uma tabela vazia, sem snapshot."""
+        self._file = None
+        self._mapped: Optional[mmap.mmap] = None
+        self._views: list[memoryview] = []
+        self._rows = 0
+        self._name_ends: "array | memoryview" = array("Q")
+        self._names_start = 0
+        self._email_ends: "array | memoryview" = array("Q")
+        self._emails_start = 0
+        self._emails_end = 0
+        self._tier_codes: "array | memoryview" = array("H")
+        self._translation: list[int] = []
+        self._csv_offset = 0
+        self._fingerprint = b""
+        self._csv_identity = (0, 0, 0)
+        self._tail = ClientTable()
+
+    @classmethod
+    def open(cls, path: str) -> "SnapshotTable":
+        """Mapeia o snapshot gravado em path, validando o cabeçalho."""
+        table = cls()
+        with ExitStack() as on_error:
+            table._file = on_error.enter_context(open(path, "rb"))
+            on_error.callback(table.close)
+            table._map()
+            # Mapeado: o arquivo fica aberto até close()
+            on_error.pop_all()
+        return table
+
+    def __enter__(self) -> "SnapshotTable":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Quantidade de clientes: as do snapshot mais as acrescentadas."""
+        return self._rows + len(self._tail)
+
+    def __getitem__(self, index: int) -> ClientRow:
+        """Retorna a visão da linha no índice informado."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de cliente fora do intervalo")
+        return ClientRow(self, index)
+
+    def __iter__(self) -> Iterator[ClientRow]:
+        """Itera sobre as visões das linhas."""
+        for index in range(len(self)):
+            yield ClientRow(self, index)
+
+    @property
+    def snapshot_rows(self) -> int:
+        """Linhas lidas do snapshot."""
+        return self._rows
+
+    @property
+    def csv_offset(self) -> int:
+        """Byte do CSV até onde as linhas estão no snapshot."""
+        return self._csv_offset
+
+    @property
+    def fingerprint(self) -> bytes:
+        """Bytes do CSV que antecedem csv_offset quando o snapshot foi gravado."""
+        return self._fingerprint
+
+    @property
+    def csv_identity(self) -> tuple[int, int, int]:
+        """Dispositivo, inode e CRC do início do CSV quando o snapshot foi gravado."""
+        return self._csv_identity
+
+    def append(self, client: Client) -> None:
+        """Adiciona um cliente depois das linhas do snapshot."""
+        self._tail.append(client)
+        self._index_row(len(self) - 1, client.email, client.tier_code)
+
+    def extend(self, clients: Iterable[Client]) -> None:
+        """Adiciona vários clientes depois das linhas do snapshot."""
+        for client in clients:
+            self.append(client)
+
+    def name_at(self, index: int) -> str:
+        """Nome do cliente na linha informada."""
+        if index >= self._rows:
+            return self._tail.name_at(index - self._rows)
+        start = self._names_start + (self._name_ends[index - 1] if index else 0)
+        end = self._names_start + self._name_ends[index]
+        return str(self._mapped[start:end], "utf-8")
+
+    def email_at(self, index: int) -> str:
+        """Email do cliente na linha informada."""
+        if index >= self._rows:
+            return self._tail.email_at(index - self._rows)
+        start = self._emails_start + (self._email_ends[index - 1] if index else 0)
+        end = self._emails_start + self._email_ends[index]
+        return str(self._mapped[start:end], "utf-8")
+
+    def tier_at(self, index: int) -> str:
+        """Nível do cliente na linha informada."""
+        return TIERS.name(self.tier_code_at(index))
+
+    def tier_code_at(self, index: int) -> int:
+        """Código do nível do cliente na linha informada."""
+        if index >= self._rows:
+            return self._tail.tier_code_at(index - self._rows)
+        return self._translation[self._tier_codes[index]]
+
+    def client_at(self, index: int) -> Client:
+        """Materializa o cliente da linha informada."""
+        return Client(
+            name=self.name_at(index),
+            email=self.email_at(index),
+            tier=self.tier_at(index),
+        )
+
+    def load_all(self) -> List[Client]:
+        """Materializa todos os clientes da tabela."""
+        return list(self.iter_clients())
+
+    def iter_clients(self) -> Iterator[Client]:
+        """Itera sobre os clientes, materializando um por vez."""
+        for index in range(len(self)):
+            yield self.client_at(index)
+
+    def exists(self, email: str) -> bool:
+        """Verifica se o email está na tabela sem materializar linhas."""
+        needle = email.encode("utf-8")
+        if not needle:
+            return False
+
+        if self._rows:
+            position = self._mapped.find(needle, self._emails_start, self._emails_end)
+            while position != -1:
+                # A ocorrência só conta se coincidir exatamente com uma linha
+                end = position + len(needle) - self._emails_start
+                row = bisect_left(self._email_ends, end)
+                row_start = self._email_ends[row - 1] if row else 0
+                if (
+                    row < self._rows
+                    and self._email_ends[row] == end
+                    and row_start == position - self._emails_start
+                ):
+                    return True
+                position = self._mapped.find(needle, position + 1, self._emails_end)
+        return self._tail.exists(email)
+
+    def close(self) -> None:
+        """Libera o mapeamento; as linhas do snapshot deixam de ser acessíveis."""
+        self._rows = 0
+        self._indexes = None
+        self._name_ends = self._email_ends = self._tier_codes = array("Q")
+        # As colunas derivam das fatias: são liberadas na ordem inversa
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _map(self) -> None:
+        """Mapeia o arquivo aberto e prepara as colunas."""
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            raise ValueError("Snapshot inválido: arquivo truncado")
+        self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            tier_count,
+            rows,
+            csv_offset,
+            fingerprint_size,
+            fingerprint,
+            csv_device,
+            csv_inode,
+            csv_head_crc,
+            file_size,
+            tiers_start,
+            name_ends_start,
+            names_start,
+            email_ends_start,
+            emails_start,
+            tier_codes_start,
+        ) = _HEADER.unpack_from(self._mapped)
+        if magic != MAGIC:
+            raise ValueError("Snapshot inválido: assinatura desconhecida")
+        if version != VERSION:
+            raise ValueError(f"Versão de snapshot não suportada: {version}")
+        if file_size != size:
+            raise ValueError("Snapshot inválido: tamanho diferente do gravado")
+
+        # Um arquivo corrompido com o mesmo tamanho não pode ler fora das seções
+        starts = [
+            tiers_start,
+            name_ends_start,
+            names_start,
+            email_ends_start,
+            emails_start,
+            tier_codes_start,
+            size,
+        ]
+        corrupt = (
+            fingerprint_size > len(fingerprint),
+            tier_count > _MAX_TIERS,
+            tiers_start < _HEADER.size,
+            any(start > following for start, following in zip(starts, starts[1:])),
+            name_ends_start + rows * 8 > names_start,
+            email_ends_start + rows * 8 > emails_start,
+            tier_codes_start + rows * 2 > size,
+        )
+        if any(corrupt):
+            raise ValueError("Snapshot inválido: seções corrompidas")
+
+        position = tiers_start
+        for _ in range(tier_count):
+            if position + _TIER_LENGTH.size > name_ends_start:
+                raise ValueError("Snapshot inválido: seções corrompidas")
+            (length,) = _TIER_LENGTH.unpack_from(self._mapped, position)
+            position += _TIER_LENGTH.size
+            if position + length > name_ends_start:
+                raise ValueError("Snapshot inválido: seções corrompidas")
+            tier = str(self._mapped[position : position + length], "utf-8")
+            self._translation.append(TIERS.intern(tier))
+            position += length
+
+        self._name_ends = self._column(name_ends_start, rows, "Q")
+        self._email_ends = self._column(email_ends_start, rows, "Q")
+        self._tier_codes = self._column(tier_codes_start, rows, "H")
+        if rows and (
+            names_start + self._name_ends[-1] > email_ends_start
+            or emails_start + self._email_ends[-1] > tier_codes_start
+        ):
+            raise ValueError("Snapshot inválido: seções corrompidas")
+        self._names_start = names_start
+        self._emails_start = emails_start
+        self._emails_end = emails_start + (self._email_ends[-1] if rows else 0)
+        self._csv_offset = csv_offset
+        self._fingerprint = fingerprint[:fingerprint_size]
+        self._csv_identity = (csv_device, csv_inode, csv_head_crc)
+        self._rows = rows
+
+    def _column(self, start: int, rows: int, typecode: str) -> "array | memoryview":
+        """Coluna de inteiros little-endian lida direto do mapeamento."""
+        view = self._view(start, start + rows * array(typecode).itemsize)
+        if sys.byteorder == "little":
+            column = view.cast(typecode)
+            self._views.append(column)
+            return column
+        # Em máquinas big-endian a coluna é copiada e convertida
+        column = array(typecode, view.tobytes())
+        column.byteswap()
+        return column
+
+    def _view(self, start: int, end: int) -> memoryview:
+        """Fatia do mapeamento, liberada junto com ele em close()."""
+        view = memoryview(self._mapped)[start:end]
+        self._views.append(view)
+        return view
+
+
+def write_snapshot(
+    path: str,
+    table: ClientTable,
+    csv_offset: int,
+    fingerprint: bytes,
+    csv_identity: tuple[int, int, int],
+) -> None:
+    """
+    Grava de forma atômica o snapshot da tabela de clientes.
+
+    csv_offset é o byte do CSV até onde os clientes foram lidos; fingerprint
+    são os bytes do CSV logo antes dele e csv_identity o dispositivo, o inode
+    e o CRC do início do CSV, usados juntos para reconhecer o arquivo. O
+    snapshot é gravado com atomic_file: quem lê vê o antigo ou o novo.
+    """
+    if len(fingerprint) > 64:
+        raise ValueError("A impressão digital do CSV tem no máximo 64 bytes")
+    if len(TIERS) > _MAX_TIERS:
+        raise ValueError(f"O snapshot comporta no máximo {_MAX_TIERS} níveis")
+
+    columns = table.columns()
+    # Os códigos gravados são os de TIERS: o texto de cada um vai junto
+    tiers = bytearray()
+    for code in range(len(TIERS)):
+        encoded = TIERS.name(code).encode("utf-8")
+        if len(encoded) >= 1 << 16:
+            raise ValueError("O nome de um nível tem no máximo 65535 bytes")
+        tiers += _TIER_LENGTH.pack(len(encoded)) + encoded
+
+    sections = [
+        tiers,
+        columns.name_ends,
+        columns.names,
+        columns.email_ends,
+        columns.emails,
+        columns.tier_codes,
+    ]
+
+    # Cada seção começa alinhada para que as colunas possam ser lidas no lugar
+    starts = []
+    position = _HEADER.size
+    for section in sections:
+        position = _align(position)
+        starts.append(position)
+        position += _byte_length(section)
+    file_size = position
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(TIERS),
+        len(table),
+        csv_offset,
+        len(fingerprint),
+        fingerprint,
+        *csv_identity,
+        file_size,
+        *starts,
+    )
+
+    with atomic_file(path) as file:
+        file.write(header)
+        for start, section in zip(starts, sections):
+            file.write(b"\0" * (start - file.tell()))
+            file.write(_little_endian(section))
+
+
+@contextmanager
+def atomic_file(path: str) -> Iterator[BinaryIO]:
+    """
+    Arquivo temporário que substitui path de forma atômica ao fim do bloco.
+
+    O temporário fica no mesmo diretório e é sincronizado antes de ser
+    renomeado: quem lê vê o arquivo antigo ou o novo. Se o bloco falhar, o
+    temporário é removido e path não é alterado.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+    _fsync_directory(directory)
+
+
+def _align(position: int) -> int:
+    """Arredonda a posição para o próximo múltiplo do alinhamento."""
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _byte_length(section: "bytes | bytearray | array") -> int:
+    """Tamanho da seção em bytes."""
+    if isinstance(section, array):
+        return len(section) * section.itemsize
+    return len(section)
+
+
+def _little_endian(section: "bytes | bytearray | array") -> "bytes | bytearray | array":
+    """Seção pronta para gravação, com inteiros em little-endian."""
+    if isinstance(section, array) and sys.byteorder != "little":
+        section = array(section.typecode, section)
+        section.byteswap()
+    return section
+
+
+def _fsync_directory(directory: str) -> None:
+    """Sincroniza o diretório para que a renomeação sobreviva a quedas."""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - plataformas sem open de diretórios
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,188 @@
+import sqlite3
+from typing import Iterable, Iterator, List, Optional
+
+from domain.entities import Client
+from domain.repositories import DEFAULT_PAGE_SIZE, ClientPage
+from domain.repositories import ClientRepository as IClientRepository
+from domain.repositories import check_page, normalize_email
+from infrastructure.repositories import FileClientRepository
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    tier TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS clients_email_idx ON clients (email);
+CREATE INDEX IF NOT EXISTS clients_tier_idx ON clients (tier);
+CREATE INDEX IF NOT EXISTS clients_domain_idx
+    ON clients (lower(substr(email, instr(email, '@') + 1)));
+CREATE INDEX IF NOT EXISTS clients_email_lower_idx ON clients (lower(email));
+"""
+
+_INSERT = "INSERT INTO clients (name, email, tier) VALUES (?, ?, ?)"
+_INSERT_IGNORE = "INSERT OR IGNORE INTO clients (name, email, tier) VALUES (?, ?, ?)"
+_EXISTS = "SELECT 1 FROM clients WHERE email = ?"
+_SELECT_ALL = "SELECT name, email, tier FROM clients ORDER BY id"
+# As expressões precisam ser idênticas às dos índices para que sejam usados
+_SELECT_BY_TIER = "SELECT name, email, tier FROM clients WHERE tier = ? ORDER BY id"
+_SELECT_BY_DOMAIN = (
+    "SELECT name, email, tier FROM clients "
+    "WHERE lower(substr(email, instr(email, '@') + 1)) = ? ORDER BY id"
+)
+_SELECT_BY_EMAIL = (
+    "SELECT name, email, tier FROM clients "
+    "WHERE lower(email) = ? ORDER BY id LIMIT 1"
+)
+_COUNT_BY_TIER = "SELECT tier, COUNT(*) FROM clients GROUP BY tier"
+_COUNT = "SELECT COUNT(*) FROM clients"
+_SELECT_PAGE = "SELECT name, email, tier FROM clients ORDER BY id LIMIT ? OFFSET ?"
+
+
+class SqliteClientRepository(IClientRepository):
+    """
+    Repositório de clientes em SQLite.
+
+    O email tem índice UNIQUE, então consultas e a garantia de unicidade
+    ficam a cargo do banco, inclusive entre processos. As instruções SQL são
+    constantes e reaproveitadas pelo cache de prepared statements do sqlite3.
+
+    Nível, domínio do email e email em minúsculas têm índices próprios. O
+    lower() do SQLite só converte letras ASCII, então domínio e email só
+    ignoram maiúsculas acentuadas nos outros repositórios.
+    """
+
+    DEFAULT_BATCH_SIZE = 5000
+
+    def __init__(self, database_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        """Abre (ou cria) o banco de clientes."""
+        if batch_size <= 0:
+            raise ValueError("O tamanho do lote deve ser positivo")
+
+        self._batch_size = batch_size
+        self._connection = sqlite3.connect(database_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteClientRepository":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def exists(self, email: str) -> bool:
+        """Verifica se um cliente com o email já existe."""
+        return self._connection.execute(_EXISTS, (email,)).fetchone() is not None
+
+    def save(self, client: Client) -> None:
+        """Salva o cliente no banco."""
+        try:
+            with self._connection:
+                self._connection.execute(_INSERT, _as_row(client))
+        except sqlite3.IntegrityError as exc:
+            raise ValueError(
+                f"Cliente com email {client.email} já está cadastrado"
+            ) from exc
+
+    def save_many(self, clients: List[Client]) -> List[bool]:
+        """Salva um lote de clientes, com uma transação a cada batch_size linhas."""
+        saved = []
+        for start in range(0, len(clients), self._batch_size):
+            batch = clients[start : start + self._batch_size]
+            with self._connection:
+                for client in batch:
+                    cursor = self._connection.execute(_INSERT_IGNORE, _as_row(client))
+                    saved.append(cursor.rowcount == 1)
+        return saved
+
+    def load_all(self) -> List[Client]:
+        """Carrega todos os clientes do banco."""
+        return list(self.iter_clients())
+
+    def iter_clients(self) -> Iterator[Client]:
+        """Itera sobre os clientes na ordem de inserção."""
+        for name, email, tier in self._connection.execute(_SELECT_ALL):
+            yield Client(name=name, email=email, tier=tier)
+
+    def find_by_tier(self, tier: str) -> List[Client]:
+        """Clientes do nível informado, pelo índice de nível."""
+        return self._select(_SELECT_BY_TIER, tier)
+
+    def find_by_domain(self, domain: str) -> List[Client]:
+        """Clientes com email no domínio informado, pelo índice de domínio."""
+        return self._select(_SELECT_BY_DOMAIN, normalize_email(domain))
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Primeiro cliente com o email informado, sem diferenciar maiúsculas."""
+        clients = self._select(_SELECT_BY_EMAIL, normalize_email(email))
+        return clients[0] if clients else None
+
+    def count_by_tier(self) -> dict[str, int]:
+        """Quantidade de clientes de cada nível, lida do índice de nível."""
+        return dict(self._connection.execute(_COUNT_BY_TIER).fetchall())
+
+    def count(self) -> int:
+        """Quantidade de clientes no banco."""
+        return self._connection.execute(_COUNT).fetchone()[0]
+
+    def load_page(self, cursor: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ClientPage:
+        """
+        Página de até limit clientes a partir da posição cursor.
+
+        O SQLite percorre as linhas antes do cursor pela chave primária sem
+        materializá-las; só as da página (e uma a mais) viram Client.
+        """
+        check_page(cursor, limit)
+        clients = [
+            Client(name=name, email=email, tier=tier)
+            for name, email, tier in self._connection.execute(
+                _SELECT_PAGE, (limit + 1, cursor)
+            )
+        ]
+        return ClientPage.from_rows(clients, cursor, limit)
+
+    def import_clients(self, clients: Iterable[Client]) -> int:
+        """
+        Importa clientes em transações de batch_size linhas.
+
+        Emails já cadastrados são ignorados. Retorna quantos foram inseridos.
+        """
+        inserted = 0
+        batch = []
+        for client in clients:
+            batch.append(_as_row(client))
+            if len(batch) >= self._batch_size:
+                inserted += self._insert_batch(batch)
+                batch = []
+        if batch:
+            inserted += self._insert_batch(batch)
+        return inserted
+
+    def import_from_file(self, file_path: str) -> int:
+        """Importa os clientes de um arquivo no formato de clientes.txt."""
+        return self.import_clients(FileClientRepository(file_path).iter_clients())
+
+    def _select(self, query: str, parameter: str) -> List[Client]:
+        """Executa a consulta e materializa apenas as linhas retornadas."""
+        return [
+            Client(name=name, email=email, tier=tier)
+            for name, email, tier in self._connection.execute(query, (parameter,))
+        ]
+
+    def _insert_batch(self, rows: list[tuple[str, str, str]]) -> int:
+        """Insere um lote de linhas em uma única transação."""
+        with self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(_INSERT_IGNORE, rows)
+            return self._connection.total_changes - before
+
+
+def _as_row(client: Client) -> tuple[str, str, str]:
+    """Converte o cliente em parâmetros para as instruções SQL."""
+    return (client.name, client.email, client.tier)
@@ -1,16 +1,40 @@
-from domain.entities import Client, OrderItem
-from infrastructure.repositories import FileClientRepository
-from services.discount import QuantityDiscountCalculator, TierDiscountCalculator
-from services.email import ConsoleEmailService
-from services.tax import TaxCalculator
-from services.validation import ClientValidator, EmailValidator
-from use_cases.client_management import RegisterClientUseCase
-from use_cases.order_processing import GenerateOrderSummaryUseCase, ProcessOrderUseCase
-from use_cases.price_calculation import CalculateFinalPriceUseCase
-
-
-def main():
+# Cada comando importa só o que usa: o início do interpretador domina as
+# execuções curtas, disparadas aos milhares por cron e pipelines de shell.
+# Veja python -m benchmarks.startup.
+# pylint: disable=import-outside-toplevel
+import argparse
+import sys
+import time
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+    from domain.entities import Client, Order, OrderItem
+    from use_cases.client_management import RegistrationResult
+
+T = TypeVar("T")
+
+# Quantidade padrão de linhas nos relatórios de --profile e --tracemalloc
+DEFAULT_TOP = 20
+
+
+def run_demo() -> None:
     """Executa cenários de demonstração com a arquitetura refatorada."""
+    from domain.entities import Client, OrderItem
+    from infrastructure.repositories import FileClientRepository
+    from services.discount import QuantityDiscountCalculator, TierDiscountCalculator
+    from services.email import ConsoleEmailService
+    from services.tax import TaxCalculator
+    from services.validation import ClientValidator, EmailValidator
+    from use_cases.client_management import RegisterClientUseCase
+    from use_cases.order_processing import (
+        GenerateOrderSummaryUseCase,
+        ProcessOrderUseCase,
+    )
+    from use_cases.price_calculation import CalculateFinalPriceUseCase
+
     print("=== Sistema de Gerenciamento de Pedidos PetroBahia ===\n")
 
     # Inicializa infraestrutura e serviços
@@ -103,5 +127,459 @@ def main():
     print("=== Demonstração concluída ===")
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """Interpreta a linha de comando; sem subcomando, executa a demonstração."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        run_demo()
+        return 0
+    if args.repeat < 1:
+        parser.error("--repeat deve ser ao menos 1")
+
+    try:
+        return args.handler(args)
+    except (ImportError, OSError, ValueError) as exc:
+        # ImportError: dependência opcional ausente, como o NumPy do modo batch
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser com os subcomandos e as opções de medição."""
+    measurement = argparse.ArgumentParser(add_help=False)
+    group = measurement.add_argument_group("medição")
+    group.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="executa o comando N vezes e relata os tempos (padrão: 1)",
+    )
+    group.add_argument(
+        "--profile",
+        action="store_true",
+        help="executa sob cProfile e imprime as funções mais custosas",
+    )
+    group.add_argument(
+        "--profile-sort",
+        default="cumulative",
+        choices=("cumulative", "tottime", "ncalls"),
+        help="ordenação do resumo do cProfile (padrão: cumulative)",
+    )
+    group.add_argument(
+        "--profile-output",
+        metavar="ARQUIVO",
+        help="grava as estatísticas do cProfile para análise posterior",
+    )
+    group.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="relata os maiores pontos de alocação e o pico de memória",
+    )
+    group.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help=f"linhas nos relatórios de perfil e memória (padrão: {DEFAULT_TOP})",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Sistema de Gerenciamento de Pedidos PetroBahia.",
+        epilog="Sem subcomando, executa a demonstração.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMANDO")
+
+    register = commands.add_parser(
+        "register",
+        parents=[measurement],
+        help="registra os clientes de um arquivo CSV (nome,email,nível)",
+    )
+    register.add_argument("clients", metavar="CLIENTES", help="arquivo de clientes")
+    register.add_argument(
+        "--store", default="clientes.txt", help="arquivo de clientes cadastrados"
+    )
+    register.set_defaults(handler=command_register)
+
+    price = commands.add_parser(
+        "price",
+        parents=[measurement],
+        help="calcula o preço final de carrinhos (um por linha)",
+    )
+    price.add_argument(
+        "carts",
+        metavar="CARRINHOS",
+        help="arquivo com um carrinho por linha: itens 'nome:preço' ou 'preço'",
+    )
+    price.add_argument(
+        "--mode",
+        default="float",
+        choices=("float", "exact", "batch"),
+        help="execute, execute_exact ou execute_batch (padrão: float)",
+    )
+    price.add_argument(
+        "--tax-rate", type=float, default=0.10, help="alíquota (padrão: 0.10)"
+    )
+    price.set_defaults(handler=command_price)
+
+    orders = commands.add_parser(
+        "orders",
+        parents=[measurement],
+        help="processa pedidos e gera os resumos",
+    )
+    orders.add_argument(
+        "orders",
+        metavar="PEDIDOS",
+        help="arquivo com um pedido por linha: email seguido dos itens",
+    )
+    orders.add_argument(
+        "--store", default="clientes.txt", help="arquivo de clientes cadastrados"
+    )
+    orders.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processos para execute_parallel (padrão: 1, sem pool)",
+    )
+    orders.add_argument(
+        "--output", metavar="ARQUIVO", help="grava os resumos dos pedidos"
+    )
+    orders.set_defaults(handler=command_orders)
+
+    load = commands.add_parser(
+        "load",
+        parents=[measurement],
+        help="carrega o arquivo de clientes cadastrados",
+    )
+    load.add_argument(
+        "--store", default="clientes.txt", help="arquivo de clientes cadastrados"
+    )
+    load.add_argument(
+        "--mode",
+        default="load_all",
+        choices=("load_all", "iter"),
+        help="load_all ou iter_clients (padrão: load_all)",
+    )
+    load.set_defaults(handler=command_load)
+
+    return parser
+
+
+def command_register(args: argparse.Namespace) -> int:
+    """
+    Registra em lote os clientes do arquivo informado.
+
+    Com --repeat, cada repetição registra numa cópia temporária do cadastro
+    original, com os emails de boas-vindas descartados, e o relatório é o da
+    primeira execução, a única gravada e a única que envia.
+    """
+    import contextlib
+
+    from infrastructure.repositories import FileClientRepository
+    from services.email import ConsoleEmailService
+    from services.validation import ClientValidator, EmailValidator
+    from use_cases.client_management import RegisterClientUseCase
+
+    clients = _read_clients(args.clients)
+    validator = ClientValidator(EmailValidator())
+    email_sender = ConsoleEmailService()
+    runs: List[List["RegistrationResult"]] = []
+
+    # Só a primeira execução grava no cadastro; as repetições partem de
+    # cópias dele como estava, para não medir só o caminho em que todos os
+    # clientes já estão cadastrados
+    paths = [args.store]
+    discarded = None  # destino dos emails das repetições
+
+    def run() -> List["RegistrationResult"]:
+        with contextlib.ExitStack() as stack:
+            if runs:
+                stack.enter_context(contextlib.redirect_stdout(discarded))
+            repository = stack.enter_context(FileClientRepository(paths[len(runs)]))
+            use_case = RegisterClientUseCase(
+                repository=repository,
+                validator=validator,
+                email_sender=email_sender,
+            )
+            runs.append(use_case.execute_many(clients))
+        return runs[-1]
+
+    with contextlib.ExitStack() as cleanup:
+        if args.repeat > 1:
+            import os
+            import tempfile
+
+            scratch = cleanup.enter_context(tempfile.TemporaryDirectory())
+            paths += _copy_store(args.store, scratch, args.repeat - 1)
+            discarded = cleanup.enter_context(open(os.devnull, "w", encoding="utf-8"))
+        measure(args, run)
+
+    results = runs[0]
+    registered = sum(result.registered for result in results)
+    print(f"{registered} de {len(clients)} cliente(s) registrado(s)")
+    for result in results:
+        if result.error:
+            print(f"  {result.client.email}: {result.error}")
+    return 0
+
+
+def _copy_store(store: str, directory: str, count: int) -> List[str]:
+    """Faz count cópias do cadastro em directory, antes de qualquer medição."""
+    import os
+    import shutil
+
+    paths = []
+    for number in range(1, count + 1):
+        paths.append(os.path.join(directory, f"execucao-{number}.txt"))
+        if os.path.exists(store):
+            shutil.copyfile(store, paths[-1])
+    return paths
+
+
+def command_price(args: argparse.Namespace) -> int:
+    """Calcula o preço final de cada carrinho do arquivo informado."""
+    from services.discount import QuantityDiscountCalculator
+    from services.tax import TaxCalculator
+    from use_cases.price_calculation import CalculateFinalPriceUseCase
+
+    carts = [items for _, _, items in _read_orders(args.carts, with_email=False)]
+    use_case = CalculateFinalPriceUseCase(
+        quantity_discount=QuantityDiscountCalculator(),
+        tax_calculator=TaxCalculator(tax_rate=args.tax_rate),
+    )
+
+    if args.mode == "batch":
+        prices = [item.price for items in carts for item in items]
+        offsets = [0]
+        for items in carts:
+            offsets.append(offsets[-1] + len(items))
+        final_prices = measure(args, lambda: use_case.execute_batch(prices, offsets))
+        total = float(final_prices.sum())
+    elif args.mode == "exact":
+        final_prices = measure(
+            args, lambda: [use_case.execute_exact(items) for items in carts]
+        )
+        total = sum(price.cents for price in final_prices) / 100
+    else:
+        final_prices = measure(
+            args, lambda: [use_case.execute(items) for items in carts]
+        )
+        total = sum(final_prices)
+
+    print(f"{len(carts)} carrinho(s), total R$ {total:.2f}")
+    return 0
+
+
+def command_orders(args: argparse.Namespace) -> int:
+    """Processa os pedidos do arquivo para clientes já cadastrados."""
+    from infrastructure.repositories import FileClientRepository
+    from services.discount import TierDiscountCalculator
+    from use_cases.order_processing import (
+        GenerateOrderSummaryUseCase,
+        ProcessOrderUseCase,
+    )
+
+    clients = {
+        client.email: client
+        for client in FileClientRepository(args.store).iter_clients()
+    }
+    orders = []
+    for line_number, email, items in _read_orders(args.orders, with_email=True):
+        client = clients.get(email)
+        if client is None:
+            raise ValueError(f"Linha {line_number}: cliente {email} não cadastrado")
+        orders.append((client, items))
+
+    process_order = ProcessOrderUseCase(discount_calculator=TierDiscountCalculator())
+    generate_summary = GenerateOrderSummaryUseCase()
+
+    def run() -> List["Order"]:
+        processed = process_order.execute_parallel(orders, workers=args.workers)
+        if args.output:
+            generate_summary.write_many(processed, args.output)
+        else:
+            for order in processed:
+                generate_summary.execute(order)
+        return processed
+
+    processed = measure(args, run)
+    total = sum(order.total for order in processed)
+    print(f"{len(processed)} pedido(s) processado(s), total R$ {total:.2f}")
+    return 0
+
+
+def command_load(args: argparse.Namespace) -> int:
+    """Carrega os clientes cadastrados, como numa execução a frio."""
+    from infrastructure.repositories import FileClientRepository
+
+    def run() -> List["Client"]:
+        # Um repositório novo a cada repetição: o cache não mascara a leitura
+        repository = FileClientRepository(args.store)
+        if args.mode == "iter":
+            return list(repository.iter_clients())
+        return repository.load_all()
+
+    clients = measure(args, run)
+    tiers: dict[str, int] = {}
+    for client in clients:
+        tiers[client.tier] = tiers.get(client.tier, 0) + 1
+    print(f"{len(clients)} cliente(s) carregado(s)")
+    for tier, count in sorted(tiers.items()):
+        print(f"  {tier}: {count}")
+    return 0
+
+
+def measure(args: argparse.Namespace, work: Callable[[], T]) -> T:
+    """
+    Executa work args.repeat vezes e retorna o resultado da última execução.
+
+    O tempo de cada execução é relatado na saída de erro, assim como os
+    relatórios de --profile e --tracemalloc, para não se misturarem à saída
+    do comando.
+    """
+    profiler = None
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    if args.tracemalloc:
+        import tracemalloc
+
+        tracemalloc.start()
+
+    timings = []
+    try:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            if profiler is not None:
+                profiler.enable()
+            try:
+                result = work()
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+            timings.append(time.perf_counter() - start)
+
+        if args.tracemalloc:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+    finally:
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+    _report_timings(timings)
+    if profiler is not None:
+        _report_profile(profiler, args)
+    if args.tracemalloc:
+        _report_allocations(snapshot, peak, args.top)
+    return result
+
+
+def _report_timings(timings: List[float]) -> None:
+    """Imprime o tempo das execuções em milissegundos."""
+    if len(timings) == 1:
+        print(f"Tempo: {timings[0] * 1000:.2f} ms", file=sys.stderr)
+        return
+
+    import statistics
+
+    print(
+        f"Tempo em {len(timings)} execuções: "
+        f"mín {min(timings) * 1000:.2f} ms, "
+        f"mediana {statistics.median(timings) * 1000:.2f} ms, "
+        f"máx {max(timings) * 1000:.2f} ms",
+        file=sys.stderr,
+    )
+
+
+def _report_profile(profiler: "cProfile.Profile", args: argparse.Namespace) -> None:
+    """Imprime o resumo do cProfile e, se pedido, grava as estatísticas."""
+    import pstats
+
+    if args.profile_output:
+        profiler.dump_stats(args.profile_output)
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.strip_dirs().sort_stats(args.profile_sort).print_stats(args.top)
+
+
+def _report_allocations(snapshot: "tracemalloc.Snapshot", peak: int, top: int) -> None:
+    """Imprime o pico de memória e os pontos que mais retêm memória."""
+    import tracemalloc
+
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+    )
+    print(f"Pico de memória: {peak / 1024:.1f} KiB", file=sys.stderr)
+    print(f"Maiores pontos de alocação (top {top}):", file=sys.stderr)
+    for stat in snapshot.statistics("lineno")[:top]:
+        print(f"  {stat}", file=sys.stderr)
+
+
+def _read_clients(path: str) -> List["Client"]:
+    """
+    Lê um cliente por linha, no formato nome,email,nível.
+
+    Linhas vazias ou iniciadas por # são ignoradas; uma linha malformada
+    interrompe a leitura com o número dela.
+    """
+    from domain.entities import Client
+
+    clients = []
+    with open(path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            fields = [field.strip() for field in line.split(",")]
+            if len(fields) != 3:
+                raise ValueError(
+                    f"Linha {line_number}: esperado nome,email,nível em '{line}'"
+                )
+            try:
+                clients.append(Client(name=fields[0], email=fields[1], tier=fields[2]))
+            except ValueError as exc:
+                raise ValueError(
+                    f"Linha {line_number}: cliente inválido '{line}' ({exc})"
+                ) from exc
+    return clients
+
+
+def _read_orders(
+    path: str, with_email: bool
+) -> Iterator[tuple[int, Optional[str], List["OrderItem"]]]:
+    """
+    Lê um pedido por linha, separando os campos por vírgula.
+
+    Cada item é 'nome:preço' ou só o preço; com with_email, o primeiro campo
+    é o email do cliente. Linhas vazias ou iniciadas por # são ignoradas.
+    """
+    from domain.entities import OrderItem
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            fields = [field.strip() for field in line.split(",")]
+            email = fields.pop(0) if with_email else None
+            if not fields:
+                raise ValueError(f"Linha {line_number}: o pedido não tem itens")
+            items = []
+            for position, field in enumerate(fields, start=1):
+                name, _, price = field.rpartition(":")
+                name = name.strip() or f"Item {position}"
+                try:
+                    items.append(OrderItem(name=name, price=float(price)))
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Linha {line_number}: item inválido '{field}' ({exc})"
+                    ) from exc
+            yield line_number, email, items
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
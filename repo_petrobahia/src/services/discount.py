@@ -1,6 +1,11 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from domain.money import Money, RoundingMode, exact_ratio
 from domain.services import DiscountCalculator as IDiscountCalculator
+from domain.tiers import TIERS
+
+if TYPE_CHECKING:
+    from fractions import Fraction
 
 
 class TierDiscountCalculator(IDiscountCalculator):
@@ -8,7 +13,9 @@ class TierDiscountCalculator(IDiscountCalculator):
     Calcula descontos baseados no nível do cliente.
 
     Aberto para extensão (novos níveis podem ser adicionados) mas fechado
-    para modificação.
+    para modificação. As taxas e os multiplicadores (1 - taxa) ficam em
+    listas indexadas pelo código do nível no registro TIERS, estendidas
+    quando surgem níveis novos; níveis desconhecidos têm taxa zero.
     """
 
     DEFAULT_DISCOUNT_RATES = {
@@ -20,18 +27,69 @@ class TierDiscountCalculator(IDiscountCalculator):
     def __init__(self, discount_rates: Optional[dict[str, float]] = None):
         """Inicializa o calculador de descontos."""
         self._discount_rates = discount_rates or self.DEFAULT_DISCOUNT_RATES
+        self._rates_by_code: list[float] = []
+        self._multipliers_by_code: list[float] = []
+
+    def __reduce__(self):
+        """Serializa só as taxas; as tabelas por código valem só no processo."""
+        return (type(self), (self._discount_rates,))
 
     def get_discount_rate(self, tier: str) -> float:
         """Obtém a taxa de desconto do nível."""
-        return self._discount_rates.get(tier.lower(), 0.0)
+        code = TIERS.code(tier)
+        if code is None:
+            return self._discount_rates.get(tier.lower(), 0.0)
+        return self.get_discount_rate_by_code(code)
+
+    def get_discount_rate_by_code(self, tier_code: int) -> float:
+        """Obtém a taxa de desconto pelo código do nível."""
+        if tier_code >= len(self._rates_by_code):
+            self._build_tables()
+        return self._rates_by_code[tier_code]
 
     def calculate_discounted_price(self, base_price: float, tier: str) -> float:
         """Calcula o preço com desconto do nível."""
+        code = TIERS.code(tier)
+        if code is None:
+            if base_price < 0:
+                raise ValueError("O preço base não pode ser negativo")
+            return base_price * (1 - self._discount_rates.get(tier.lower(), 0.0))
+        return self.calculate_discounted_price_by_code(base_price, code)
+
+    def calculate_discounted_price_by_code(
+        self, base_price: float, tier_code: int
+    ) -> float:
+        """Calcula o preço com desconto pelo código do nível."""
         if base_price < 0:
             raise ValueError("O preço base não pode ser negativo")
+        if tier_code >= len(self._multipliers_by_code):
+            self._build_tables()
+        return base_price * self._multipliers_by_code[tier_code]
+
+    def get_exact_multiplier(self, tier: str) -> "Fraction":
+        """Fator exato (1 - taxa) do nível, com a taxa lida pelo seu repr."""
+        return 1 - exact_ratio(self.get_discount_rate(tier))
+
+    def calculate_discounted_price_exact(
+        self,
+        base_price: Money,
+        tier: str,
+        rounding: RoundingMode = RoundingMode.HALF_EVEN,
+    ) -> Money:
+        """Calcula o preço com desconto do nível em centavos exatos."""
+        if base_price.cents < 0:
+            raise ValueError("O preço base não pode ser negativo")
+        return base_price.scale(self.get_exact_multiplier(tier), rounding)
 
-        discount_rate = self.get_discount_rate(tier)
-        return base_price * (1 - discount_rate)
+    def _build_tables(self) -> None:
+        """Recalcula as tabelas por código para todos os níveis registrados."""
+        rates = [
+            self._discount_rates.get(TIERS.name(code).lower(), 0.0)
+            for code in range(len(TIERS))
+        ]
+        # Atribuição única: leitores em outras threads veem as listas completas
+        self._multipliers_by_code = [1 - rate for rate in rates]
+        self._rates_by_code = rates
 
 
 class QuantityDiscountCalculator:
@@ -45,6 +103,11 @@ class QuantityDiscountCalculator:
             (0, 0.0),  # <5 itens: sem desconto
         ]
 
+    @property
+    def thresholds(self) -> tuple[tuple[int, float], ...]:
+        """Faixas (quantidade mínima, taxa) em ordem decrescente de quantidade."""
+        return tuple(self._thresholds)
+
     def get_discount_rate(self, quantity: int) -> float:
         """Obtém a taxa de desconto por quantidade."""
         for threshold, rate in self._thresholds:
@@ -61,3 +124,20 @@ class QuantityDiscountCalculator:
 
         discount_rate = self.get_discount_rate(quantity)
         return price * (1 - discount_rate)
+
+    def get_exact_multiplier(self, quantity: int) -> "Fraction":
+        """Fator exato (1 - taxa) da quantidade, com a taxa lida pelo seu repr."""
+        return 1 - exact_ratio(self.get_discount_rate(quantity))
+
+    def apply_discount_exact(
+        self,
+        price: Money,
+        quantity: int,
+        rounding: RoundingMode = RoundingMode.HALF_EVEN,
+    ) -> Money:
+        """Aplica o desconto por quantidade ao valor em centavos exatos."""
+        if price.cents < 0:
+            raise ValueError("O preço não pode ser negativo")
+        if quantity < 0:
+            raise ValueError("A quantidade não pode ser negativa")
+        return price.scale(self.get_exact_multiplier(quantity), rounding)
@@ -1,16 +1,28 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from domain.entities import EmailMessage
 from domain.services import EmailSender
 
+# Marca de parada colocada na fila para encerrar cada worker
+_STOP = object()
+
 
 class ConsoleEmailService(EmailSender):
     """Serviço de email que imprime no console (para testes/desenvolvimento)."""
 
     def send(self, to: str, subject: str, body: str) -> None:
         """Imprime os detalhes do email no console."""
-        print("--- Email ---")
-        print(f"Para: {to}")
-        print(f"Assunto: {subject}")
-        print(f"Mensagem: {body}")
-        print("-------------")
+        print(
+            "--- Email ---\n"
+            f"Para: {to}\n"
+            f"Assunto: {subject}\n"
+            f"Mensagem: {body}\n"
+            "-------------"
+        )
 
 
 class WelcomeEmailService:
@@ -35,3 +47,172 @@ class WelcomeEmailService:
         subject = "Saudações da PetroBahia"
         body = "Obrigado por ser nosso valorizado cliente!"
         self._email_sender.send(email, subject, body)
+
+
+@dataclass(frozen=True, slots=True)
+class EmailQueueStats:
+    """Estatísticas de um QueuedEmailSender."""
+
+    queue_depth: int
+    sent: int
+    failed: int
+    batches: int
+    average_latency: float
+    max_latency: float
+
+
+class QueuedEmailSender(EmailSender):
+    """
+    Decorador que entrega emails em segundo plano.
+
+    send apenas enfileira a mensagem; um pool de threads retira da fila lotes
+    de até batch_size mensagens e os repassa ao send_each do remetente
+    decorado, contando cada mensagem entregue ou falha. Com a fila cheia,
+    send bloqueia (até enqueue_timeout segundos, se informado) para conter o
+    produtor. Depois de close, send gera RuntimeError; close espera os envios
+    que já estavam em andamento, que são entregues.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        max_queue_size: int = 1000,
+        workers: int = 1,
+        batch_size: int = 50,
+        enqueue_timeout: Optional[float] = None,
+    ):
+        """Inicializa a fila e inicia as threads de envio."""
+        if max_queue_size <= 0:
+            raise ValueError("O tamanho da fila deve ser positivo")
+        if workers <= 0:
+            raise ValueError("A quantidade de workers deve ser positiva")
+        if batch_size <= 0:
+            raise ValueError("O tamanho do lote deve ser positivo")
+
+        self._sender = sender
+        self._batch_size = batch_size
+        self._enqueue_timeout = enqueue_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # Protege closed e a contagem de envios que ainda vão pôr na fila
+        self._state = threading.Condition()
+        self._closed = False
+        self._enqueuing = 0
+
+        self._stats_lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._batches = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self.last_error: Optional[Exception] = None
+
+        self._workers = [
+            threading.Thread(target=self._run, name=f"email-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "QueuedEmailSender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def send(self, to: str, subject: str, body: str) -> None:
+        """Enfileira um email para envio."""
+        self._enqueue(EmailMessage(to=to, subject=subject, body=body))
+
+    def send_many(self, messages: List[EmailMessage]) -> None:
+        """Enfileira um lote de emails para envio."""
+        for message in messages:
+            self._enqueue(message)
+
+    def close(self) -> None:
+        """Para de aceitar emails e aguarda a entrega de todos os enfileirados."""
+        with self._state:
+            if self._closed:
+                return
+            self._closed = True
+            # Nenhuma mensagem pode entrar na fila depois das marcas de parada
+            self._state.wait_for(lambda: self._enqueuing == 0)
+        # A fila é FIFO: cada worker só encontra sua marca de parada depois
+        # que todas as mensagens anteriores foram retiradas
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+
+    def stats(self) -> EmailQueueStats:
+        """Retorna a profundidade da fila e as latências de envio (em segundos)."""
+        with self._stats_lock:
+            delivered = self._sent + self._failed
+            return EmailQueueStats(
+                queue_depth=self._queue.qsize(),
+                sent=self._sent,
+                failed=self._failed,
+                batches=self._batches,
+                average_latency=self._total_latency / delivered if delivered else 0.0,
+                max_latency=self._max_latency,
+            )
+
+    def _enqueue(self, message: EmailMessage) -> None:
+        """Coloca a mensagem na fila, bloqueando se ela estiver cheia."""
+        with self._state:
+            if self._closed:
+                raise RuntimeError("O envio de emails já foi encerrado")
+            self._enqueuing += 1
+        try:
+            self._queue.put(
+                (time.perf_counter(), message), timeout=self._enqueue_timeout
+            )
+        except queue.Full as exc:
+            raise TimeoutError("A fila de emails está cheia") from exc
+        finally:
+            with self._state:
+                self._enqueuing -= 1
+                self._state.notify_all()
+
+    def _run(self) -> None:
+        """Laço de um worker: retira lotes da fila e os entrega."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._deliver(batch)
+            if stop:
+                return
+
+    def _deliver(self, batch: list[tuple[float, EmailMessage]]) -> None:
+        """Entrega um lote pelo remetente decorado e atualiza as estatísticas."""
+        try:
+            results = self._sender.send_each([message for _, message in batch])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Uma falha de envio não pode derrubar o worker
+            results = [exc] * len(batch)
+        errors = [error for error in results if error is not None]
+
+        finished = time.perf_counter()
+        with self._stats_lock:
+            self._batches += 1
+            self._sent += len(batch) - len(errors)
+            self._failed += len(errors)
+            if errors:
+                self.last_error = errors[-1]
+            for enqueued, _ in batch:
+                latency = finished - enqueued
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
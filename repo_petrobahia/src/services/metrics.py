@@ -0,0 +1,456 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Limites (em segundos) dos histogramas de latência, de 10µs a 10s
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+OPERATION_SECONDS = "petrobahia_operation_duration_seconds"
+OPERATION_ERRORS = "petrobahia_operation_errors_total"
+
+F = TypeVar("F", bound=Callable)
+
+
+class _ThreadCells:
+    """
+    Acumuladores por thread de uma métrica.
+
+    Cada thread grava na sua própria lista, sem travas; a leitura soma as
+    listas das threads vivas e os totais das que já terminaram. Quando uma
+    thread termina, o threading.local descarta a marca dela e a lista é
+    incorporada a esses totais, então threads de vida curta (as de um
+    ThreadingHTTPServer, por exemplo) não acumulam listas.
+    """
+
+    def __init__(self, size: int):
+        """Inicializa os acumuladores com `size` posições."""
+        self._size = size
+        self._local = threading.local()
+        self._cells: dict[int, list[float]] = {}
+        self._retired: list[float] = [0] * size
+        self._lock = threading.Lock()
+
+    def get(self) -> list[float]:
+        """Retorna o acumulador da thread atual, criando-o no primeiro uso."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0] * self._size
+            with self._lock:
+                self._cells[id(cell)] = cell
+            self._local.cell = cell
+            self._local.exit = _ThreadExit(self._retire, cell)
+            return cell
+
+    def totals(self) -> list[float]:
+        """Soma os acumuladores de todas as threads."""
+        with self._lock:
+            cells = list(self._cells.values())
+            totals = list(self._retired)
+        for cell in cells:
+            for index, value in enumerate(cell):
+                totals[index] += value
+        return totals
+
+    def _retire(self, cell: list[float]) -> None:
+        """Incorpora aos totais o acumulador de uma thread que terminou."""
+        with self._lock:
+            if self._cells.pop(id(cell), None) is None:
+                return
+            for index, value in enumerate(cell):
+                self._retired[index] += value
+
+
+class _ThreadExit:
+    """Marca guardada no threading.local: descartada quando a thread termina."""
+
+    __slots__ = ("_retire", "_cell")
+
+    def __init__(self, retire: Callable[[list[float]], None], cell: list[float]):
+        """Guarda o acumulador e a função que o incorpora aos totais."""
+        self._retire = retire
+        self._cell = cell
+
+    def __del__(self):
+        """Incorpora o acumulador aos totais quando a thread termina."""
+        self._retire(self._cell)
+
+
+class Counter:
+    """Contador que só aumenta."""
+
+    def __init__(self, registry: "MetricsRegistry"):
+        """Inicializa o contador."""
+        self._registry = registry
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """Incrementa o contador."""
+        if not self._registry.enabled:
+            return
+        if amount < 0:
+            raise ValueError("O contador só pode aumentar")
+        self._cells.get()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Valor acumulado."""
+        return self._cells.totals()[0]
+
+
+class Gauge:
+    """Valor que pode subir e descer, como o tamanho de uma fila."""
+
+    def __init__(self, registry: "MetricsRegistry"):
+        """Inicializa o medidor."""
+        self._registry = registry
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Define o valor atual."""
+        if self._registry.enabled:
+            self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """Soma ao valor atual."""
+        if self._registry.enabled:
+            with self._lock:
+                self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Subtrai do valor atual."""
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        """Valor atual."""
+        return self._value
+
+
+class Histogram:
+    """Histograma com faixas fixas, no formato cumulativo do Prometheus."""
+
+    def __init__(self, registry: "MetricsRegistry", buckets: tuple[float, ...]):
+        """Inicializa o histograma com os limites superiores das faixas."""
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("As faixas do histograma devem ser crescentes")
+        self._registry = registry
+        self._bounds = tuple(buckets)
+        # Uma contagem por faixa, mais a faixa +Inf e a soma dos valores
+        self._cells = _ThreadCells(len(buckets) + 2)
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """Limites superiores das faixas (sem o +Inf)."""
+        return self._bounds
+
+    def observe(self, value: float) -> None:
+        """Registra um valor observado."""
+        if not self._registry.enabled:
+            return
+        cell = self._cells.get()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Contagens por faixa (incluindo +Inf, não cumulativas) e a soma."""
+        totals = self._cells.totals()
+        return [int(count) for count in totals[:-1]], totals[-1]
+
+    @property
+    def count(self) -> int:
+        """Quantidade de valores observados."""
+        return sum(self.snapshot()[0])
+
+
+class MetricsRegistry:
+    """
+    Registro de contadores, medidores e histogramas.
+
+    Cada métrica é identificada pelo nome e pelos rótulos. Com o registro
+    desabilitado (o padrão), nada é gravado.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """Inicializa o registro vazio."""
+        self._enabled = enabled
+        self._listeners: list[Callable[[bool], None]] = []
+        # Muda a cada clear(), invalidando as métricas guardadas por timed
+        self.generation = 0
+        self._families: dict[str, tuple[str, str]] = {}
+        self._metrics: dict[tuple[str, tuple[tuple[str, str], ...]], object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se as métricas estão sendo gravadas."""
+        return self._enabled
+
+    def enable(self) -> None:
+        """Passa a gravar as métricas."""
+        self._set_enabled(True)
+
+    def disable(self) -> None:
+        """Deixa de gravar as métricas."""
+        self._set_enabled(False)
+
+    def add_listener(self, listener: Callable[[bool], None]) -> None:
+        """Registra uma função chamada a cada enable() ou disable()."""
+        self._listeners.append(listener)
+
+    def clear(self) -> None:
+        """Remove todas as métricas registradas."""
+        with self._lock:
+            self._families.clear()
+            self._metrics.clear()
+            self.generation += 1
+
+    def counter(
+        self, name: str, help_text: str = "", labels: Optional[dict] = None
+    ) -> Counter:
+        """Retorna o contador com o nome e os rótulos, criando-o se necessário."""
+        return self._get(name, "counter", help_text, labels, lambda: Counter(self))
+
+    def gauge(
+        self, name: str, help_text: str = "", labels: Optional[dict] = None
+    ) -> Gauge:
+        """Retorna o medidor com o nome e os rótulos, criando-o se necessário."""
+        return self._get(name, "gauge", help_text, labels, lambda: Gauge(self))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        labels: Optional[dict] = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Retorna o histograma com o nome e os rótulos, criando-o se necessário."""
+        return self._get(
+            name, "histogram", help_text, labels, lambda: Histogram(self, buckets)
+        )
+
+    def dump(self) -> str:
+        """Exporta as métricas no formato de texto do Prometheus."""
+        with self._lock:
+            families = dict(self._families)
+            metrics = sorted(self._metrics.items(), key=lambda item: item[0])
+
+        lines = []
+        for name, (kind, help_text) in sorted(families.items()):
+            if help_text:
+                lines.append(f"# HELP {name} {_escape_help(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (metric_name, labels), metric in metrics:
+                if metric_name != name:
+                    continue
+                if kind == "histogram":
+                    lines.extend(_histogram_lines(name, labels, metric))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {metric.value!r}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _set_enabled(self, enabled: bool) -> None:
+        """Atualiza o estado e avisa os interessados."""
+        self._enabled = enabled
+        for listener in self._listeners:
+            listener(enabled)
+
+    def _get(self, name, kind, help_text, labels, factory):
+        """Busca a métrica registrada ou cria uma nova do tipo informado."""
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is not None and self._families[name][0] == kind:
+            return metric
+
+        with self._lock:
+            registered = self._families.get(name)
+            if registered is not None and registered[0] != kind:
+                raise ValueError(
+                    f"A métrica {name} já foi registrada como {registered[0]}"
+                )
+            if registered is None:
+                self._families[name] = (kind, help_text)
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = factory()
+        return metric
+
+
+# Registro usado pelas operações instrumentadas com timed;
+# PETROBAHIA_METRICS=1 o habilita desde o início do processo
+METRICS = MetricsRegistry(enabled=os.environ.get("PETROBAHIA_METRICS") == "1")
+
+# Métodos instrumentados: (classe, nome, função original, versão medida)
+_INSTRUMENTED: list[tuple[type, str, Callable, Callable]] = []
+
+
+def timed(func: F) -> F:
+    """
+    Mede a latência de cada chamada em METRICS, rotulada pelo nome qualificado.
+
+    Exceções também incrementam o contador de erros da operação. Em métodos,
+    a classe guarda a função original enquanto METRICS está desabilitado e
+    a versão medida enquanto está habilitado, então desabilitadas as
+    métricas não acrescentam nenhum custo às chamadas.
+    """
+    return _TimedMethod(func)
+
+
+class _TimedMethod:
+    """Marcador criado por timed, trocado pela função adequada na classe."""
+
+    def __init__(self, func: Callable):
+        """Guarda a função original e prepara a versão medida."""
+        self._func = func
+        self._measured = _measured(func)
+        functools.update_wrapper(self, func)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Instala na classe a função que corresponde ao estado de METRICS."""
+        _INSTRUMENTED.append((owner, name, self._func, self._measured))
+        setattr(owner, name, self._measured if METRICS.enabled else self._func)
+
+    def __call__(self, *args, **kwargs):
+        """Fora de classes não há o que trocar: decide a cada chamada."""
+        if METRICS.enabled:
+            return self._measured(*args, **kwargs)
+        return self._func(*args, **kwargs)
+
+
+def _measured(func: Callable) -> Callable:
+    """Versão da função que registra latência e erros em METRICS."""
+    labels = {"operation": func.__qualname__}
+    # Histograma da operação e a geração do registro em que foi obtido
+    cached: list = [None, -1]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            METRICS.counter(
+                OPERATION_ERRORS, "Chamadas que terminaram em exceção.", labels
+            ).inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if cached[1] != METRICS.generation:
+                cached[0] = METRICS.histogram(
+                    OPERATION_SECONDS, "Latência das operações em segundos.", labels
+                )
+                cached[1] = METRICS.generation
+            cached[0].observe(elapsed)
+
+    return wrapper
+
+
+def _swap_instrumented(enabled: bool) -> None:
+    """Troca os métodos instrumentados conforme o estado de METRICS."""
+    for owner, name, func, measured in _INSTRUMENTED:
+        setattr(owner, name, measured if enabled else func)
+
+
+METRICS.add_listener(_swap_instrumented)
+
+
+def start_http_server(
+    port: int = 0,
+    host: str = "127.0.0.1",
+    registry: Optional[MetricsRegistry] = None,
+) -> "ThreadingHTTPServer":
+    """
+    Serve as métricas em http://host:port/metrics em uma thread de fundo.
+
+    Com port=0 o sistema escolhe uma porta livre (veja server.server_port).
+    Encerre com server.shutdown() e server.server_close().
+    """
+    import http.server  # pylint: disable=import-outside-toplevel
+
+    registry = registry or METRICS
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        """Responde GET /metrics com o texto do Prometheus."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Atende a requisição de métricas."""
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.dump().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            """Não registra cada requisição no stderr."""
+
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _histogram_lines(name: str, labels: tuple, histogram: Histogram) -> list[str]:
+    """Linhas _bucket, _sum e _count de um histograma."""
+    counts, total = histogram.snapshot()
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds + (float("inf"),), counts):
+        cumulative += count
+        bucket_labels = labels + (("le", _format_bound(bound)),)
+        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {total!r}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return lines
+
+
+def _format_bound(bound: float) -> str:
+    """Formata o limite de uma faixa como o Prometheus espera."""
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _format_labels(labels: tuple) -> str:
+    """Formata os rótulos como {nome="valor",...}."""
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    """Escapa barra invertida, aspas e quebras de linha em valores de rótulo."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    """Escapa barra invertida e quebras de linha no texto de ajuda."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
@@ -1,3 +1,11 @@
+from typing import TYPE_CHECKING, Optional
+
+from domain.money import Money, RoundingMode, exact_ratio
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+
 class TaxCalculator:
     """Calcula impostos sobre preços."""
 
@@ -6,12 +14,21 @@ class TaxCalculator:
         if tax_rate < 0:
             raise ValueError("A taxa de imposto não pode ser negativa")
         self._tax_rate = tax_rate
+        self._exact_multiplier: Optional["Fraction"] = None
 
     @property
     def tax_rate(self) -> float:
         """Taxa de imposto atual."""
         return self._tax_rate
 
+    @property
+    def exact_multiplier(self) -> "Fraction":
+        """Fator exato (1 + taxa), com a taxa lida pelo seu repr."""
+        # Calculado no primeiro uso, pois só os caminhos exatos precisam dele
+        if self._exact_multiplier is None:
+            self._exact_multiplier = 1 + exact_ratio(self._tax_rate)
+        return self._exact_multiplier
+
     def calculate_tax(self, price: float) -> float:
         """Calcula o valor do imposto."""
         if price < 0:
@@ -23,3 +40,11 @@ class TaxCalculator:
         if price < 0:
             raise ValueError("O preço não pode ser negativo")
         return price * (1 + self._tax_rate)
+
+    def apply_tax_exact(
+        self, price: Money, rounding: RoundingMode = RoundingMode.HALF_EVEN
+    ) -> Money:
+        """Aplica o imposto ao valor em centavos com aritmética exata."""
+        if price.cents < 0:
+            raise ValueError("O preço não pode ser negativo")
+        return price.scale(self.exact_multiplier, rounding)
@@ -1,4 +1,5 @@
 import re
+from typing import List, Optional
 
 from domain.entities import Client
 from domain.services import ClientValidator as IClientValidator
@@ -8,33 +9,96 @@ class EmailValidator:
     """Valida o formato de email seguindo os padrões RFC."""
 
     EMAIL_REGEX = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+    _EMAIL_PATTERN = re.compile(EMAIL_REGEX)
 
     def is_valid(self, email: str) -> bool:
         """Verifica se o email possui formato válido."""
         if not email:
             return False
-        return bool(re.match(self.EMAIL_REGEX, email))
+        return self._EMAIL_PATTERN.match(email) is not None
 
 
 class ClientValidator(IClientValidator):
     """Valida dados do cliente usando composição."""
 
+    DEFAULT_CHUNK_SIZE = 10_000
+
     def __init__(self, email_validator: EmailValidator):
         """Inicializa o validador de cliente."""
         self._email_validator = email_validator
 
     def validate(self, client: Client) -> bool:
         """Valida os dados do cliente."""
-        if not client.name or not client.name.strip():
-            raise ValueError("O nome do cliente não pode estar vazio")
+        errors = self.errors(client)
+        if errors:
+            raise ValueError(errors[0])
+        return True
 
-        if not client.email or not client.email.strip():
-            raise ValueError("O email do cliente não pode estar vazio")
+    def errors(self, client: Client) -> List[str]:
+        """Retorna todos os problemas encontrados no cliente."""
+        return self._field_errors(client.name, client.email, client.tier)
 
-        if not self._email_validator.is_valid(client.email):
-            raise ValueError("Formato de email inválido")
+    def validate_many(
+        self,
+        clients: List[Client],
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[List[str]]:
+        """
+        Valida um lote de clientes sem lançar exceções.
 
-        if not client.tier or not client.tier.strip():
-            raise ValueError("O nível do cliente não pode estar vazio")
+        Retorna a lista de erros de cada cliente (vazia se ele for válido).
+        Com workers > 1 e mais de chunk_size clientes, os blocos de chunk_size
+        clientes são validados em paralelo por um pool de processos.
+        """
+        if chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser positivo")
 
-        return True
+        if not workers or workers <= 1 or len(clients) <= chunk_size:
+            return [self.errors(client) for client in clients]
+
+        # Os blocos vão como tuplas e voltam só com as linhas inválidas,
+        # reduzindo o custo de serialização entre processos
+        starts = range(0, len(clients), chunk_size)
+        chunks = [
+            [(c.name, c.email, c.tier) for c in clients[start : start + chunk_size]]
+            for start in starts
+        ]
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        results: List[List[str]] = [[] for _ in clients]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            for start, invalid_rows in zip(
+                starts, executor.map(self._invalid_rows, chunks)
+            ):
+                for offset, errors in invalid_rows:
+                    results[start + offset] = errors
+        return results
+
+    def _invalid_rows(
+        self, rows: List[tuple[str, str, str]]
+    ) -> List[tuple[int, List[str]]]:
+        """Valida linhas (nome, email, nível), retornando apenas as inválidas."""
+        invalid = []
+        for offset, row in enumerate(rows):
+            errors = self._field_errors(*row)
+            if errors:
+                invalid.append((offset, errors))
+        return invalid
+
+    def _field_errors(self, name: str, email: str, tier: str) -> List[str]:
+        """Verifica os campos de um cliente."""
+        errors = []
+
+        if not name or not name.strip():
+            errors.append("O nome do cliente não pode estar vazio")
+
+        if not email or not email.strip():
+            errors.append("O email do cliente não pode estar vazio")
+        elif not self._email_validator.is_valid(email):
+            errors.append("Formato de email inválido")
+
+        if not tier or not tier.strip():
+            errors.append("O nível do cliente não pode estar vazio")
+
+        return errors
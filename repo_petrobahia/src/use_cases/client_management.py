@@ -1,6 +1,24 @@
-from domain.entities import Client
+from dataclasses import dataclass
+from typing import List, Optional
+
+from domain.entities import Client, EmailMessage
 from domain.repositories import ClientWriter
-from domain.services import ClientValidator, EmailSender
+from domain.services import ClientValidator, EmailOutbox, EmailSender
+from services.metrics import timed
+
+
+@dataclass
+class RegistrationResult:
+    """
+    Resultado do registro de um cliente em lote.
+
+    Um cliente registrado ainda pode ter error, se o envio do email de
+    boas-vindas falhou.
+    """
+
+    client: Client
+    registered: bool
+    error: Optional[str] = None
 
 
 class RegisterClientUseCase:
@@ -8,34 +26,115 @@ class RegisterClientUseCase:
     Caso de uso para registrar um novo cliente.
 
     Segue o Princípio da Inversão de Dependência ao depender de abstrações.
+    Com uma caixa de saída (outbox), os emails de boas-vindas são guardados
+    nela logo após o salvamento, com a chave do cliente, e enviados depois
+    por um despachante: o registro não espera o servidor de email. Salvar e
+    guardar não são atômicos, então o email também é guardado quando o
+    cliente já está cadastrado; a chave evita a duplicata, e refazer um
+    registro cujo email não chegou à caixa não o perde. Sem caixa, os emails
+    são enviados na hora pelo email_sender.
     """
 
     def __init__(
         self,
         repository: ClientWriter,
         validator: ClientValidator,
-        email_sender: EmailSender,
+        email_sender: Optional[EmailSender] = None,
+        outbox: Optional[EmailOutbox] = None,
     ):
         """Inicializa o caso de uso de registro de cliente."""
+        if email_sender is None and outbox is None:
+            raise ValueError("Informe um email_sender ou uma caixa de saída")
+
         self._repository = repository
         self._validator = validator
         self._email_sender = email_sender
+        self._outbox = outbox
 
+    @timed
     def execute(self, client: Client) -> bool:
         """Registra um novo cliente."""
         # Valida os dados do cliente
         self._validator.validate(client)
 
-        # Salva no repositório
-        self._repository.save(client)
+        message = self._welcome_message(client)
+        if self._outbox is None:
+            # Salva no repositório e envia o email de boas-vindas
+            self._repository.save(client)
+            self._email_sender.send(message.to, message.subject, message.body)
+            return True
+
+        # Salva e guarda o email de boas-vindas, mesmo se já estava cadastrado
+        (saved,) = self._repository.save_many([client])
+        self._outbox.enqueue_many([message])
+        if not saved:
+            raise ValueError(f"Cliente com email {client.email} já está cadastrado")
+        return True
 
-        # Envia email de boas-vindas
+    @timed
+    def execute_many(self, clients: List[Client]) -> List[RegistrationResult]:
+        """Registra um lote de clientes, retornando o resultado de cada um."""
+        results = [
+            RegistrationResult(client=client, registered=False) for client in clients
+        ]
+
+        # Valida o lote e rejeita emails repetidos dentro dele
+        candidates = []
+        seen_emails = set()
+        errors_per_client = self._validator.validate_many(clients)
+        for result, errors in zip(results, errors_per_client):
+            if errors:
+                result.error = errors[0]
+                continue
+
+            email = result.client.email
+            if email in seen_emails:
+                result.error = f"Cliente com email {email} repetido no lote"
+                continue
+            seen_emails.add(email)
+            candidates.append(result)
+
+        # Salva os aceitos em uma única escrita
+        saved_flags = self._repository.save_many([r.client for r in candidates])
+        messages = []
+        welcomed = []
+        for result, saved in zip(candidates, saved_flags):
+            if saved:
+                result.registered = True
+                messages.append(self._welcome_message(result.client))
+                welcomed.append(result)
+            else:
+                result.error = (
+                    f"Cliente com email {result.client.email} já está cadastrado"
+                )
+                if self._outbox is not None:
+                    # A chave evita a duplicata se as boas-vindas já foram guardadas
+                    messages.append(self._welcome_message(result.client))
+
+        # Envia (ou guarda para envio) os emails de boas-vindas em lote
+        if messages and self._outbox is not None:
+            self._outbox.enqueue_many(messages)
+        elif messages:
+            # Os clientes já estão salvos: uma falha de envio fica no resultado
+            errors = self._email_sender.send_each(messages)
+            for result, error in zip(welcomed, errors):
+                if error is not None:
+                    result.error = f"Falha ao enviar o email de boas-vindas: {error}"
+
+        return results
+
+    @staticmethod
+    def _welcome_message(client: Client) -> EmailMessage:
+        """Monta o email de boas-vindas do cliente."""
         subject = "Bem-vindo à PetroBahia!"
         body = (
             f"Olá {client.name},\n\n"
             "Obrigado por se registrar!\n\n"
             "Atenciosamente,\nEquipe PetroBahia"
         )
-        self._email_sender.send(client.email, subject, body)
-
-        return True
+        return EmailMessage(
+            to=client.email,
+            subject=subject,
+            body=body,
+            key=f"boas-vindas:{client.email}",
+        )
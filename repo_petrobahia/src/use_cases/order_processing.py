@@ -1,7 +1,14 @@
-from typing import List
+import math
+import os
+import time
+from typing import Iterable, Iterator, List, Optional, TextIO
 
 from domain.entities import Client, Order, OrderItem
 from domain.services import DiscountCalculator
+from services.metrics import timed
+
+# Caso de uso de cada processo do pool, criado uma única vez pelo inicializador
+_worker_use_case: Optional["ProcessOrderUseCase"] = None
 
 
 class ProcessOrderUseCase:
@@ -15,48 +22,174 @@ class ProcessOrderUseCase:
         """Inicializa o caso de uso de processamento de pedido."""
         self._discount_calculator = discount_calculator
 
+    @timed
     def execute(self, client: Client, items: List[OrderItem]) -> Order:
         """Processa um pedido para um cliente."""
         if not items:
             raise ValueError("O pedido deve conter pelo menos um item")
 
-        # Calcula o subtotal
-        subtotal = sum(item.price for item in items)
-
         # Obtém a taxa de desconto para o nível do cliente
-        discount_rate = self._discount_calculator.get_discount_rate(client.tier)
-
-        # Calcula o total final
-        total = self._discount_calculator.calculate_discounted_price(
-            subtotal, client.tier
+        discount_rate = self._discount_calculator.get_discount_rate_by_code(
+            client.tier_code
         )
 
-        # Cria a entidade do pedido
+        # Cria a entidade do pedido, que soma o subtotal uma única vez
         order = Order(
-            client=client,
-            items=items,
-            total=total,
-            discount_rate=discount_rate,
+            client=client, items=items, total=0.0, discount_rate=discount_rate
         )
 
+        # Calcula o total final
+        self._apply_discount(order)
+
         return order
 
+    def add_item(self, order: Order, item: OrderItem) -> None:
+        """Adiciona um item ao pedido e recalcula o total pelo calculador."""
+        order.add_item(item)
+        self._apply_discount(order)
+
+    def remove_item(self, order: Order, item: OrderItem) -> None:
+        """Remove um item do pedido e recalcula o total pelo calculador."""
+        order.remove_item(item)
+        self._apply_discount(order)
+
+    def _apply_discount(self, order: Order) -> None:
+        """Calcula o total do pedido pelo calculador de descontos."""
+        order.total = self._discount_calculator.calculate_discounted_price_by_code(
+            order.subtotal, order.client.tier_code
+        )
+
+    # Abaixo disso o custo de iniciar o pool e serializar os pedidos domina
+    DEFAULT_MIN_PARALLEL_SIZE = 10_000
+    # Amostra processada localmente para estimar o custo de cada pedido
+    TUNING_SAMPLE_SIZE = 256
+    # Duração desejada de cada bloco enviado a um processo
+    TARGET_CHUNK_SECONDS = 0.05
+
+    @timed
+    def execute_parallel(
+        self,
+        orders: List[tuple[Client, List[OrderItem]]],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE,
+    ) -> List[Order]:
+        """
+        Processa vários pedidos (cliente, itens) em um pool de processos.
+
+        Os resultados seguem a ordem de entrada. O calculador de descontos é
+        enviado uma vez para cada processo, não a cada bloco. Lotes menores
+        que min_parallel_size, ou com um único worker, rodam no processo atual.
+        Sem chunk_size, uma amostra é processada localmente para medir o
+        custo por pedido e escolher blocos de cerca de TARGET_CHUNK_SECONDS.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(orders) < max(min_parallel_size, 1):
+            return [self.execute(client, items) for client, items in orders]
+
+        results: List[Order] = []
+        if chunk_size is None:
+            sample = orders[: self.TUNING_SAMPLE_SIZE]
+            start = time.perf_counter()
+            results = [self.execute(client, items) for client, items in sample]
+            seconds_per_order = (time.perf_counter() - start) / len(sample)
+            chunk_size = self._tune_chunk_size(
+                seconds_per_order, len(orders) - len(sample), workers
+            )
+        elif chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser positivo")
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        remaining = orders[len(results) :]
+        chunks = [
+            remaining[start : start + chunk_size]
+            for start in range(0, len(remaining), chunk_size)
+        ]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._discount_calculator,),
+        ) as executor:
+            for chunk_orders in executor.map(_process_chunk, chunks):
+                results.extend(chunk_orders)
+        return results
+
+    @classmethod
+    def _tune_chunk_size(
+        cls, seconds_per_order: float, order_count: int, workers: int
+    ) -> int:
+        """Escolhe o tamanho de bloco a partir do custo medido por pedido."""
+        # Cada worker deve receber ao menos um bloco
+        max_chunk = max(1, math.ceil(order_count / workers))
+        if seconds_per_order <= 0:
+            return max_chunk
+        target = int(cls.TARGET_CHUNK_SECONDS / seconds_per_order)
+        return min(max(target, 1), max_chunk)
+
+
+def _init_worker(discount_calculator: DiscountCalculator) -> None:
+    """Cria o caso de uso do processo a partir do calculador recebido."""
+    global _worker_use_case  # pylint: disable=global-statement
+    _worker_use_case = ProcessOrderUseCase(discount_calculator)
+
+
+def _process_chunk(orders: List[tuple[Client, List[OrderItem]]]) -> List[Order]:
+    """Processa um bloco de pedidos dentro de um processo do pool."""
+    if _worker_use_case is None:
+        raise RuntimeError("O processo do pool não foi inicializado")
+    return [_worker_use_case.execute(client, items) for client, items in orders]
+
 
 class GenerateOrderSummaryUseCase:
     """Caso de uso para gerar resumos de pedidos."""
 
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    @timed
     def execute(self, order: Order) -> str:
         """Gera um resumo formatado do pedido."""
-        lines = []
-        lines.append(f"Pedido de {order.client.name} (nível {order.client.tier})")
-        lines.append("Itens:")
+        return "\n".join(self.iter_lines(order))
 
-        for item in order.items:
-            lines.append(f"  - {item.name}: R$ {item.price:.2f}")
-
-        lines.append(f"Subtotal: R$ {order.subtotal:.2f}")
-        lines.append(f"Desconto: {order.discount_rate * 100:.0f}%")
-        lines.append(f"Valor do Desconto: R$ {order.discount_amount:.2f}")
-        lines.append(f"Total: R$ {order.total:.2f}")
+    def iter_lines(self, order: Order) -> Iterator[str]:
+        """Gera as linhas do resumo uma a uma, sem montar o texto completo."""
+        yield f"Pedido de {order.client.name} (nível {order.client.tier})"
+        yield "Itens:"
 
-        return "\n".join(lines)
+        for item in order.items:
+            yield f"  - {item.name}: R$ {item.price:.2f}"
+
+        yield f"Subtotal: R$ {order.subtotal:.2f}"
+        yield f"Desconto: {order.discount_rate * 100:.0f}%"
+        yield f"Valor do Desconto: R$ {order.discount_amount:.2f}"
+        yield f"Total: R$ {order.total:.2f}"
+
+    def write(self, order: Order, stream: TextIO) -> None:
+        """Escreve o resumo do pedido, linha a linha, em um stream de texto."""
+        for line in self.iter_lines(order):
+            stream.write(line)
+            stream.write("\n")
+
+    @timed
+    def write_many(
+        self,
+        orders: Iterable[Order],
+        file_path: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> int:
+        """
+        Escreve os resumos de vários pedidos em um arquivo, separados por uma
+        linha em branco.
+
+        Os pedidos são consumidos sob demanda e a escrita passa por um buffer
+        de buffer_size bytes, então a memória não cresce com a quantidade de
+        pedidos. Retorna quantos resumos foram escritos.
+        """
+        count = 0
+        with open(file_path, "w", encoding="utf-8", buffering=buffer_size) as file:
+            for order in orders:
+                if count:
+                    file.write("\n")
+                self.write(order, file)
+                count += 1
+        return count
@@ -1,9 +1,21 @@
-from typing import List
+import math
+import sys
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from domain.entities import OrderItem
+from domain.money import Money, RoundingMode, divide, to_cents
 from services.discount import QuantityDiscountCalculator
+from services.metrics import timed
 from services.tax import TaxCalculator
 
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+    import numpy
+
+# A partir do Python 3.12, sum() de floats usa a soma compensada de Neumaier
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
 
 class CalculateFinalPriceUseCase:
     """
@@ -21,7 +33,9 @@ class CalculateFinalPriceUseCase:
         """Inicializa o caso de uso de cálculo de preço final."""
         self._quantity_discount = quantity_discount
         self._tax_calculator = tax_calculator
+        self._exact_brackets: Optional[list[tuple[int, "Fraction"]]] = None
 
+    @timed
     def execute(self, items: List[OrderItem]) -> float:
         """Calcula o preço final com desconto por quantidade e imposto."""
         if not items:
@@ -38,3 +52,242 @@ class CalculateFinalPriceUseCase:
         final_price = self._tax_calculator.apply_tax(price_with_discount)
 
         return round(final_price, 2)
+
+    @timed
+    def execute_batch(self, prices: Any, offsets: Any) -> "numpy.ndarray":
+        """
+        Calcula o preço final de vários carrinhos de uma vez (requer NumPy).
+
+        Os preços de todos os carrinhos ficam em um único vetor; o carrinho i
+        ocupa prices[offsets[i]:offsets[i + 1]]. O resultado é idêntico, bit a
+        bit, ao de chamar execute para cada carrinho.
+        """
+        np = _import_numpy()
+        prices = np.asarray(prices, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        quantities = _cart_sizes(np, prices, offsets)
+        if len(quantities) == 0:
+            return np.empty(0)
+
+        subtotals = _segmented_sum(np, prices, offsets[:-1], quantities)
+
+        # Aplica as faixas de desconto por quantidade como operações vetoriais
+        discount_rates = np.zeros(len(quantities))
+        assigned = np.zeros(len(quantities), dtype=bool)
+        for threshold, rate in self._quantity_discount.thresholds:
+            in_bracket = (quantities >= threshold) & ~assigned
+            discount_rates[in_bracket] = rate
+            assigned |= in_bracket
+
+        price_with_discount = subtotals * (1 - discount_rates)
+        final_prices = price_with_discount * (1 + self._tax_calculator.tax_rate)
+
+        return _round_cents(np, final_prices)
+
+    @timed
+    def execute_exact(
+        self, items: List[OrderItem], rounding: RoundingMode = RoundingMode.HALF_EVEN
+    ) -> Money:
+        """
+        Calcula o preço final em centavos exatos.
+
+        Os preços dos itens são convertidos para centavos pelo seu repr e as
+        taxas viram frações exatas: desconto e imposto formam um único fator
+        racional, e o resultado é arredondado uma só vez no modo informado.
+        """
+        if not items:
+            raise ValueError("A lista de itens não pode estar vazia")
+
+        subtotal = 0
+        for item in items:
+            # Caminho rápido de to_cents para preços com até duas casas decimais
+            cents = round(item.price * 100)
+            if cents / 100 != item.price:
+                cents = to_cents(item.price, rounding)
+            subtotal += cents
+
+        factor = self._exact_factor(len(items))
+        return Money(divide(subtotal * factor.numerator, factor.denominator, rounding))
+
+    @timed
+    def execute_exact_batch(
+        self,
+        prices: Any,
+        offsets: Any,
+        rounding: RoundingMode = RoundingMode.HALF_EVEN,
+    ) -> "numpy.ndarray":
+        """
+        Versão exata de execute_batch: retorna os centavos de cada carrinho.
+
+        Usa o mesmo layout de execute_batch e dá o mesmo resultado que
+        execute_exact carrinho a carrinho. As contas são feitas em int64 e,
+        se os valores puderem estourar 64 bits, em inteiros do Python.
+        """
+        np = _import_numpy()
+        prices = np.asarray(prices, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        quantities = _cart_sizes(np, prices, offsets)
+        if len(quantities) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        cents = _to_cents_array(np, prices, rounding)
+        subtotals = np.add.reduceat(cents, offsets[:-1])
+
+        # Todos os fatores sobre um denominador comum: um numerador por carrinho
+        brackets = self._get_exact_brackets()
+        denominator = math.lcm(*(factor.denominator for _, factor in brackets))
+        numerators = np.zeros(len(quantities), dtype=np.int64)
+        assigned = np.zeros(len(quantities), dtype=bool)
+        for threshold, factor in brackets:
+            in_bracket = (quantities >= threshold) & ~assigned
+            numerators[in_bracket] = factor.numerator * (
+                denominator // factor.denominator
+            )
+            assigned |= in_bracket
+
+        largest = int(np.abs(subtotals).max()) * int(numerators.max())
+        if largest >= 2**63 or denominator >= 2**62:
+            subtotals = subtotals.astype(object)
+            numerators = numerators.astype(object)
+        return _divide_array(subtotals * numerators, denominator, rounding)
+
+    def _exact_factor(self, quantity: int) -> "Fraction":
+        """Fator exato de desconto e imposto para a quantidade de itens."""
+        for threshold, factor in self._get_exact_brackets():
+            if quantity >= threshold:
+                return factor
+        return self._tax_calculator.exact_multiplier
+
+    def _get_exact_brackets(self) -> list[tuple[int, "Fraction"]]:
+        """Faixas de quantidade com o fator exato já combinado ao imposto."""
+        if self._exact_brackets is None:
+            tax = self._tax_calculator.exact_multiplier
+            self._exact_brackets = [
+                (
+                    threshold,
+                    self._quantity_discount.get_exact_multiplier(threshold) * tax,
+                )
+                for threshold, _ in self._quantity_discount.thresholds
+            ]
+        return self._exact_brackets
+
+
+def _import_numpy():
+    """Importa o NumPy sob demanda, pois ele é uma dependência opcional."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError("O cálculo em lote requer NumPy (pip install numpy)") from exc
+    return numpy
+
+
+def _cart_sizes(np, prices, offsets):
+    """Valida o layout de preços e offsets e retorna a quantidade por carrinho."""
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0:
+        raise ValueError("Os offsets devem começar em 0")
+    if offsets[-1] != len(prices):
+        raise ValueError("O último offset deve ser o total de preços")
+
+    quantities = np.diff(offsets)
+    if np.any(quantities <= 0):
+        raise ValueError("A lista de itens não pode estar vazia")
+    if np.any(prices < 0):
+        raise ValueError("O preço não pode ser negativo")
+    return quantities
+
+
+def _segmented_sum(np, prices, starts, quantities):
+    """
+    Soma os preços de cada carrinho na mesma ordem e com a mesma aritmética
+    do sum() embutido, vetorizando entre carrinhos a cada posição.
+    """
+    # Carrinhos ordenados do maior para o menor: os ativos formam um prefixo
+    order = np.argsort(-quantities, kind="stable")
+    sorted_starts = starts[order]
+    descending_quantities = quantities[order]
+    ascending_negated = -descending_quantities
+
+    totals = np.zeros(len(quantities))
+    compensation = np.zeros(len(quantities))
+    for position in range(int(descending_quantities[0])):
+        active = int(np.searchsorted(ascending_negated, -position, side="left"))
+        values = prices[sorted_starts[:active] + position]
+        partial = totals[:active]
+        new_partial = partial + values
+        if _COMPENSATED_SUM:
+            compensation[:active] += np.where(
+                np.abs(partial) >= np.abs(values),
+                (partial - new_partial) + values,
+                (values - new_partial) + partial,
+            )
+        totals[:active] = new_partial
+
+    if _COMPENSATED_SUM:
+        apply = (compensation != 0) & np.isfinite(compensation)
+        totals[apply] += compensation[apply]
+
+    subtotals = np.empty_like(totals)
+    subtotals[order] = totals
+    return subtotals
+
+
+def _round_cents(np, values):
+    """Arredonda para 2 casas decimais exatamente como round(valor, 2)."""
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+
+    # Perto de um empate (ou fora da precisão do double) o produto por 100
+    # pode ter perdido a informação necessária; esses casos usam round()
+    with np.errstate(invalid="ignore"):
+        distance_to_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+        ambiguous = (
+            (distance_to_tie <= 2 * np.spacing(np.abs(scaled)))
+            | (np.abs(scaled) >= 2**52)
+            | ~np.isfinite(scaled)
+        )
+    for index in np.flatnonzero(ambiguous):
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
+
+
+def _to_cents_array(np, prices, rounding):
+    """Converte os preços para centavos int64, como to_cents faria um a um."""
+    scaled = np.rint(prices * 100)
+    if len(scaled) and np.abs(scaled).max() >= 2**62:
+        return np.array([to_cents(float(price), rounding) for price in prices], object)
+
+    cents = scaled.astype(np.int64)
+    # Preços com mais de duas casas decimais seguem o caminho exato
+    for index in np.flatnonzero(scaled / 100 != prices):
+        cents[index] = to_cents(float(prices[index]), rounding)
+    return cents
+
+
+def _divide_array(numerators, denominator, rounding):
+    """Versão vetorial de divide para um denominador positivo comum."""
+    # np.divmod não aceita arrays de inteiros do Python (dtype object)
+    quotient = numerators // denominator
+    remainder = numerators - quotient * denominator
+    if rounding is RoundingMode.FLOOR:
+        return quotient
+
+    inexact = remainder != 0
+    if rounding is RoundingMode.CEILING:
+        return quotient + inexact
+
+    negative = numerators < 0
+    if rounding is RoundingMode.DOWN:
+        return quotient + (inexact & negative)
+    if rounding is RoundingMode.UP:
+        return quotient + (inexact & ~negative)
+
+    twice_remainder = remainder * 2
+    if rounding is RoundingMode.HALF_UP:
+        up_on_tie = ~negative
+    elif rounding is RoundingMode.HALF_DOWN:
+        up_on_tie = negative
+    else:
+        up_on_tie = quotient % 2 == 1
+    return quotient + (
+        (twice_remainder > denominator) | ((twice_remainder == denominator) & up_on_tie)
+    )
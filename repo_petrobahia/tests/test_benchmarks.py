@@ -0,0 +1,44 @@
+"""Testes de fumaça para a suíte de benchmarks."""
+
+from benchmarks import data
+from benchmarks.__main__ import main
+from benchmarks.harness import load_results, measure, save_results
+
+
+class TestBenchmarkData:
+    """Casos de teste para os geradores de dados sintéticos."""
+
+    def test_generators_are_deterministic(self):
+        """Testa que a mesma semente gera os mesmos dados."""
+        assert data.make_clients(50, seed=1) == data.make_clients(50, seed=1)
+        assert data.make_carts(20, seed=1) == data.make_carts(20, seed=1)
+        assert data.make_carts(20, seed=1) != data.make_carts(20, seed=2)
+
+    def test_clients_have_unique_emails(self):
+        """Testa que os clientes gerados não repetem emails."""
+        clients = data.make_clients(500)
+        assert len({client.email for client in clients}) == 500
+
+
+class TestBenchmarkHarness:
+    """Casos de teste para a medição e a persistência dos resultados."""
+
+    def test_measure_and_round_trip(self, tmp_path):
+        """Testa que os resultados são gravados e lidos em JSON."""
+        result = measure("suite", "soma", 100, lambda: sum(range(100)), 100, repeat=2)
+        path = str(tmp_path / "resultados.json")
+
+        save_results(path, [result], seed=1)
+
+        assert load_results(path) == [result]
+        assert result.ops_per_second > 0
+
+    def test_main_runs_all_suites(self, tmp_path, capsys):
+        """Testa a execução de ponta a ponta com entradas pequenas."""
+        path = str(tmp_path / "resultados.json")
+
+        main(["--sizes", "5", "--repeat", "1", "--output", path])
+
+        suites = {result.suite for result in load_results(path)}
+        assert suites == {"pricing", "orders", "repository"}
+        assert "FileClientRepository.load_all" in capsys.readouterr().out
@@ -1,5 +1,6 @@
 """Testes unitários para o caso de uso de gerenciamento de clientes."""
 
+import smtplib
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from domain.entities import Client
+from infrastructure.outbox import SqliteEmailOutbox
 from infrastructure.repositories import FileClientRepository
 from services.validation import ClientValidator, EmailValidator
 from use_cases.client_management import RegisterClientUseCase
@@ -86,3 +88,170 @@ class TestRegisterClientUseCase:
             assert "João Silva" in call_args[0][2]
         finally:
             Path(temp_file).unlink(missing_ok=True)
+
+    def test_execute_many_registers_batch(self):
+        """Testa o registro em lote com relatório por cliente."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".txt", encoding="utf-8"
+        ) as f:
+            f.write("Ana Paula,ana@example.com,silver\n")
+            temp_file = f.name
+
+        try:
+            repo = FileClientRepository(temp_file)
+            validator = ClientValidator(EmailValidator())
+            mock_email = MagicMock()
+            mock_email.send_each.return_value = [None, None]
+
+            use_case = RegisterClientUseCase(repo, validator, mock_email)
+            clients = [
+                Client(name="João Silva", email="joao@example.com", tier="gold"),
+                Client(name="Email Ruim", email="email-invalido", tier="gold"),
+                Client(name="João Repetido", email="joao@example.com", tier="silver"),
+                Client(name="Ana Paula", email="ana@example.com", tier="silver"),
+                Client(name="Maria Santos", email="maria@example.com", tier="bronze"),
+            ]
+
+            results = use_case.execute_many(clients)
+
+            assert [r.registered for r in results] == [
+                True,
+                False,
+                False,
+                False,
+                True,
+            ]
+            assert results[0].error is None
+            assert results[1].error == "Formato de email inválido"
+            assert "repetido no lote" in results[2].error
+            assert "já está cadastrado" in results[3].error
+
+            saved_clients = repo.load_all()
+            assert [c.email for c in saved_clients] == [
+                "ana@example.com",
+                "joao@example.com",
+                "maria@example.com",
+            ]
+
+            mock_email.send_each.assert_called_once()
+            messages = mock_email.send_each.call_args[0][0]
+            assert [m.to for m in messages] == ["joao@example.com", "maria@example.com"]
+            mock_email.send.assert_not_called()
+        finally:
+            Path(temp_file).unlink(missing_ok=True)
+
+    def test_execute_many_without_valid_clients_sends_nothing(self):
+        """Testa que nenhum email é enviado quando nenhum cliente é aceito."""
+        mock_repo = MagicMock()
+        mock_repo.save_many.return_value = []
+        mock_email = MagicMock()
+        validator = ClientValidator(EmailValidator())
+
+        use_case = RegisterClientUseCase(mock_repo, validator, mock_email)
+        client = Client(name="João Silva", email="email-invalido", tier="gold")
+
+        results = use_case.execute_many([client])
+
+        assert results[0].registered is False
+        mock_email.send_each.assert_not_called()
+
+    def test_execute_many_reports_email_failures_per_client(self, tmp_path):
+        """Testa que uma falha de envio fica no resultado do cliente."""
+        repo = FileClientRepository(str(tmp_path / "clientes.txt"))
+        mock_email = MagicMock()
+        mock_email.send_each.return_value = [
+            smtplib.SMTPResponseException(550, b"Mailbox unavailable"),
+            None,
+        ]
+        use_case = RegisterClientUseCase(
+            repo, ClientValidator(EmailValidator()), mock_email
+        )
+
+        results = use_case.execute_many(
+            [
+                Client(name="João Silva", email="joao@example.com", tier="gold"),
+                Client(name="Maria Santos", email="maria@example.com", tier="silver"),
+            ]
+        )
+
+        assert [r.registered for r in results] == [True, True]
+        assert "boas-vindas" in results[0].error
+        assert "Mailbox unavailable" in results[0].error
+        assert results[1].error is None
+        assert len(repo.load_all()) == 2
+
+    def test_requires_sender_or_outbox(self):
+        """Testa que o caso de uso precisa de um remetente ou de uma caixa."""
+        validator = ClientValidator(EmailValidator())
+
+        with pytest.raises(ValueError, match="caixa de saída"):
+            RegisterClientUseCase(MagicMock(), validator)
+
+
+class TestRegisterClientUseCaseOutbox:
+    """Casos de teste para o registro com caixa de saída de emails."""
+
+    def test_execute_enqueues_welcome_email(self, tmp_path):
+        """Testa que o email é guardado na caixa, sem envio na hora."""
+        repo = FileClientRepository(str(tmp_path / "clientes.txt"))
+        mock_email = MagicMock()
+        with SqliteEmailOutbox(str(tmp_path / "outbox.db")) as outbox:
+            use_case = RegisterClientUseCase(
+                repo, ClientValidator(EmailValidator()), mock_email, outbox=outbox
+            )
+
+            use_case.execute(
+                Client(name="João Silva", email="joao@example.com", tier="gold")
+            )
+
+            (entry,) = outbox.claim(10, lease=60)
+            assert entry.message.to == "joao@example.com"
+            assert entry.message.key == "boas-vindas:joao@example.com"
+            mock_email.send.assert_not_called()
+
+    def test_execute_many_enqueues_once_per_client(self, tmp_path):
+        """Testa o lote e que a chave evita boas-vindas repetidas."""
+        clients = [
+            Client(name="João Silva", email="joao@example.com", tier="gold"),
+            Client(name="Maria Santos", email="maria@example.com", tier="silver"),
+        ]
+        with SqliteEmailOutbox(str(tmp_path / "outbox.db")) as outbox:
+            use_case = RegisterClientUseCase(
+                FileClientRepository(str(tmp_path / "clientes.txt")),
+                ClientValidator(EmailValidator()),
+                outbox=outbox,
+            )
+
+            use_case.execute_many(clients)
+            # Um novo registro em outro arquivo não repete as boas-vindas
+            RegisterClientUseCase(
+                FileClientRepository(str(tmp_path / "outro.txt")),
+                ClientValidator(EmailValidator()),
+                outbox=outbox,
+            ).execute_many(clients)
+
+            assert outbox.counts() == {"pending": 2}
+
+    def test_retry_after_failed_enqueue_keeps_welcome_email(self, tmp_path):
+        """Testa que refazer o registro guarda as boas-vindas que se perderam."""
+        repo = FileClientRepository(str(tmp_path / "clientes.txt"))
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        with SqliteEmailOutbox(str(tmp_path / "outbox.db")) as outbox:
+            failing_outbox = MagicMock(wraps=outbox)
+            failing_outbox.enqueue_many.side_effect = [OSError("disco cheio")]
+            use_case = RegisterClientUseCase(
+                repo, ClientValidator(EmailValidator()), outbox=failing_outbox
+            )
+            with pytest.raises(OSError):
+                use_case.execute(client)
+
+            use_case = RegisterClientUseCase(
+                repo, ClientValidator(EmailValidator()), outbox=outbox
+            )
+            with pytest.raises(ValueError, match="já está cadastrado"):
+                use_case.execute(client)
+            use_case.execute_many([client])
+
+            (entry,) = outbox.claim(10, lease=60)
+            assert entry.message.key == "boas-vindas:joao@example.com"
+            assert [c.email for c in repo.load_all()] == ["joao@example.com"]
@@ -0,0 +1,125 @@
+"""Testes unitários para a tabela colunar de clientes."""
+
+from unittest.mock import patch
+
+import pytest
+
+from domain.entities import Client
+from domain.repositories import ClientReader
+from infrastructure.client_table import ClientTable
+
+
+def _sample_clients():
+    return [
+        Client(name="João Silva", email="joao@example.com", tier="gold"),
+        Client(name="Maria Santos", email="maria@example.com", tier="silver"),
+        Client(name="Pedro Costa", email="pedro@example.com", tier="gold"),
+    ]
+
+
+class TestClientTable:
+    """Casos de teste para ClientTable."""
+
+    def test_implements_client_reader(self):
+        """Testa que a tabela pode substituir um ClientReader."""
+        assert isinstance(ClientTable(), ClientReader)
+
+    def test_load_all_round_trip(self):
+        """Testa que os clientes materializados são iguais aos originais."""
+        clients = _sample_clients()
+        table = ClientTable(clients)
+
+        assert len(table) == 3
+        assert table.load_all() == clients
+
+    def test_row_view_reads_columns(self):
+        """Testa o acesso às colunas pela visão da linha."""
+        table = ClientTable(_sample_clients())
+
+        row = table[1]
+        assert row.name == "Maria Santos"
+        assert row.email == "maria@example.com"
+        assert row.tier == "silver"
+        assert row.to_client() == _sample_clients()[1]
+        assert table[-1].name == "Pedro Costa"
+
+    def test_index_out_of_range_raises_error(self):
+        """Testa que índices inválidos geram IndexError."""
+        table = ClientTable(_sample_clients())
+
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_tiers_are_interned(self):
+        """Testa que cada nível distinto é armazenado uma única vez."""
+        table = ClientTable(_sample_clients())
+
+        assert table.tier_at(0) is table.tier_at(2)
+
+    def test_exists_matches_whole_email_only(self):
+        """Testa que exists não aceita trechos de outros emails."""
+        table = ClientTable(_sample_clients())
+        table.append(Client(name="Ana", email="ana@example.com.br", tier="bronze"))
+
+        assert table.exists("maria@example.com") is True
+        assert table.exists("ana@example.com.br") is True
+        assert table.exists("ana@example.com") is False
+        assert table.exists("aria@example.com") is False
+        assert table.exists("") is False
+
+    def test_non_ascii_text(self):
+        """Testa nomes com caracteres acentuados."""
+        table = ClientTable(
+            [Client(name="Conceição Araújo", email="ção@example.com", tier="ouro")]
+        )
+
+        assert table[0].name == "Conceição Araújo"
+        assert table.exists("ção@example.com") is True
+
+    def test_columns_expose_buffers(self):
+        """Testa que as colunas expostas são os próprios buffers da tabela."""
+        table = ClientTable(_sample_clients())
+
+        columns = table.columns()
+
+        assert bytes(columns.names).startswith("João Silva".encode("utf-8"))
+        assert list(columns.email_ends) == [16, 33, 50]
+        assert columns.tier_codes[1] == table.tier_code_at(1)
+
+    def test_secondary_index_queries(self):
+        """Testa as consultas por nível, domínio e email normalizado."""
+        table = ClientTable(_sample_clients())
+        table.append(Client(name="Ana", email="Ana@Outro.com.br", tier="bronze"))
+
+        assert [c.name for c in table.find_by_tier("gold")] == [
+            "João Silva",
+            "Pedro Costa",
+        ]
+        assert [c.name for c in table.find_by_domain("outro.COM.br")] == ["Ana"]
+        assert table.find_by_email("ana@outro.com.br").email == "Ana@Outro.com.br"
+        assert table.count_by_tier() == {"gold": 2, "silver": 1, "bronze": 1}
+
+    def test_queries_materialize_only_matching_rows(self):
+        """Testa que só as linhas encontradas viram Client."""
+        table = ClientTable(_sample_clients())
+        table.count_by_tier()
+
+        with patch.object(ClientTable, "client_at", wraps=table.client_at) as spy:
+            table.append(Client(name="Ana", email="ana@example.com", tier="silver"))
+            clients = table.find_by_tier("silver")
+
+        assert [c.name for c in clients] == ["Maria Santos", "Ana"]
+        assert spy.call_count == 2
+
+    def test_pages_go_straight_to_cursor(self):
+        """Testa que as páginas só materializam as próprias linhas."""
+        table = ClientTable(_sample_clients())
+
+        with patch.object(ClientTable, "client_at", wraps=table.client_at) as spy:
+            page = table.load_page(1, limit=1)
+
+        assert [c.name for c in page.clients] == ["Maria Santos"]
+        assert page.next_cursor == 2
+        assert spy.call_count == 2
+        assert table.load_page(2).next_cursor is None
+        assert table.count() == 3
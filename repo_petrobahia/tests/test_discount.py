@@ -1,10 +1,24 @@
 """Testes unitários para o serviço de desconto."""
 
+import pickle
+from fractions import Fraction
+
 import pytest
 
+from domain.entities import Client
+from domain.money import Money
+from domain.tiers import TIERS
 from services.discount import QuantityDiscountCalculator, TierDiscountCalculator
 
 
+class DoubleDiscountCalculator(TierDiscountCalculator):
+    """Subclasse que dobra o desconto, para testar a serialização."""
+
+    def get_discount_rate(self, tier: str) -> float:
+        """Dobra a taxa do nível."""
+        return 2 * super().get_discount_rate(tier)
+
+
 class TestTierDiscountCalculator:
     """Casos de teste para TierDiscountCalculator."""
 
@@ -65,10 +79,55 @@ class TestTierDiscountCalculator:
         assert calculator.get_discount_rate("platinum") == 0.30
         assert calculator.get_discount_rate("gold") == 0.25
 
+    def test_rates_by_tier_code(self):
+        """Testa as taxas obtidas pelo código do nível, inclusive níveis novos."""
+        calculator = TierDiscountCalculator()
+        gold = Client(name="João", email="joao@example.com", tier="GOLD")
+        calculator.get_discount_rate_by_code(gold.tier_code)
+        # Nível registrado depois que as tabelas foram montadas
+        other = Client(name="Maria", email="maria@example.com", tier="esmeralda")
+
+        assert calculator.get_discount_rate_by_code(gold.tier_code) == 0.20
+        assert calculator.get_discount_rate_by_code(other.tier_code) == 0.0
+        assert calculator.calculate_discounted_price_by_code(
+            100.0, gold.tier_code
+        ) == calculator.calculate_discounted_price(100.0, "gold")
+
+    def test_calculate_discounted_price_exact(self):
+        """Testa o desconto por nível exato em centavos."""
+        calculator = TierDiscountCalculator()
+
+        result = calculator.calculate_discounted_price_exact(Money(999), "gold")
+
+        assert result == Money(799)
+        assert calculator.get_exact_multiplier("desconhecido") == 1
+
+    def test_unregistered_tier_is_not_interned(self):
+        """Testa que consultar um nível por texto não o registra."""
+        calculator = TierDiscountCalculator()
+
+        assert calculator.calculate_discounted_price(100.0, "nível-novo-xyz") == 100.0
+        assert TIERS.code("nível-novo-xyz") is None
+
+    def test_pickle_keeps_subclass_and_rates(self):
+        """Testa que a serialização preserva a subclasse e as taxas."""
+        calculator = DoubleDiscountCalculator({"gold": 0.25})
+        calculator.get_discount_rate_by_code(TIERS.code("gold"))
+
+        restored = pickle.loads(pickle.dumps(calculator))
+
+        assert type(restored) is DoubleDiscountCalculator
+        assert restored.get_discount_rate("gold") == 0.5
+
 
 class TestQuantityDiscountCalculator:
     """Casos de teste para QuantityDiscountCalculator."""
 
+    def test_thresholds_in_descending_order(self):
+        """Testa que as faixas são expostas da maior para a menor quantidade."""
+        calculator = QuantityDiscountCalculator()
+        assert calculator.thresholds == ((10, 0.20), (5, 0.10), (0, 0.0))
+
     def test_quantity_10_or_more(self):
         """Testa 20% de desconto para 10+ itens."""
         calculator = QuantityDiscountCalculator()
@@ -116,3 +175,11 @@ class TestQuantityDiscountCalculator:
         calculator = QuantityDiscountCalculator()
         with pytest.raises(ValueError, match="A quantidade não pode ser negativa"):
             calculator.apply_discount(100.0, -5)
+
+    def test_apply_discount_exact(self):
+        """Testa o desconto por quantidade exato em centavos."""
+        calculator = QuantityDiscountCalculator()
+
+        assert calculator.get_exact_multiplier(5) == Fraction(9, 10)
+        assert calculator.apply_discount_exact(Money(1005), 5) == Money(904)
+        assert calculator.apply_discount_exact(Money(1005), 10) == Money(804)
@@ -1,8 +1,17 @@
 """Testes unitários para o serviço de email."""
 
+import threading
 from unittest.mock import MagicMock
 
-from services.email import ConsoleEmailService, WelcomeEmailService
+import pytest
+
+from domain.entities import EmailMessage
+from services.email import ConsoleEmailService, QueuedEmailSender, WelcomeEmailService
+
+
+def _deliver_all(messages):
+    """Resultado de send_each com todas as mensagens entregues."""
+    return [None] * len(messages)
 
 
 class TestConsoleEmailService:
@@ -18,6 +27,37 @@ class TestConsoleEmailService:
         assert "Assunto: Assunto Teste" in captured.out
         assert "Mensagem: Corpo Teste" in captured.out
 
+    def test_send_many_sends_each_message(self, capsys):
+        """Testa que o envio em lote entrega todas as mensagens."""
+        service = ConsoleEmailService()
+        service.send_many(
+            [
+                EmailMessage(to="a@example.com", subject="Assunto A", body="Corpo A"),
+                EmailMessage(to="b@example.com", subject="Assunto B", body="Corpo B"),
+            ]
+        )
+
+        captured = capsys.readouterr()
+        assert "Para: a@example.com" in captured.out
+        assert "Para: b@example.com" in captured.out
+
+    def test_send_each_reports_each_failure(self, monkeypatch):
+        """Testa que send_each segue após uma falha e informa cada resultado."""
+        service = ConsoleEmailService()
+        failure = OSError("falhou")
+
+        def send(to, subject, body):
+            if to == "b@example.com":
+                raise failure
+
+        monkeypatch.setattr(service, "send", send)
+        messages = [
+            EmailMessage(to=f"{name}@example.com", subject="", body="")
+            for name in "abc"
+        ]
+
+        assert service.send_each(messages) == [None, failure, None]
+
 
 class TestWelcomeEmailService:
     """Casos de teste para WelcomeEmailService."""
@@ -46,3 +86,143 @@ class TestWelcomeEmailService:
         call_args = mock_sender.send.call_args
         assert call_args[0][0] == "joao@example.com"
         assert "Saudações da PetroBahia" in call_args[0][1]
+
+
+class TestQueuedEmailSender:
+    """Casos de teste para QueuedEmailSender."""
+
+    def test_close_delivers_all_queued_messages(self):
+        """Testa que close aguarda a entrega de todas as mensagens."""
+        inner = MagicMock()
+        inner.send_each.side_effect = _deliver_all
+        sender = QueuedEmailSender(inner, workers=2, batch_size=10)
+
+        for i in range(25):
+            sender.send(f"cliente{i}@example.com", "Assunto", "Corpo")
+        sender.close()
+
+        delivered = [
+            message.to
+            for call in inner.send_each.call_args_list
+            for message in call[0][0]
+        ]
+        assert sorted(delivered) == sorted(f"cliente{i}@example.com" for i in range(25))
+        assert all(len(call[0][0]) <= 10 for call in inner.send_each.call_args_list)
+
+        stats = sender.stats()
+        assert stats.sent == 25
+        assert stats.failed == 0
+        assert stats.queue_depth == 0
+        assert stats.max_latency >= stats.average_latency >= 0
+
+    def test_send_returns_before_delivery(self):
+        """Testa que send retorna sem esperar o remetente decorado."""
+        release = threading.Event()
+        inner = MagicMock()
+        inner.send_each.side_effect = lambda messages: (
+            release.wait(5) and _deliver_all(messages)
+        )
+
+        with QueuedEmailSender(inner) as sender:
+            sender.send("joao@example.com", "Assunto", "Corpo")
+            assert sender.stats().sent == 0
+            release.set()
+
+        assert sender.stats().sent == 1
+
+    def test_full_queue_applies_backpressure(self):
+        """Testa que a fila cheia bloqueia e depois gera TimeoutError."""
+        release = threading.Event()
+        started = threading.Event()
+        inner = MagicMock()
+
+        def slow_send(messages):
+            started.set()
+            release.wait(5)
+            return _deliver_all(messages)
+
+        inner.send_each.side_effect = slow_send
+        sender = QueuedEmailSender(
+            inner, max_queue_size=1, batch_size=1, enqueue_timeout=0.05
+        )
+        try:
+            sender.send("a@example.com", "Assunto", "Corpo")
+            started.wait(5)
+            sender.send("b@example.com", "Assunto", "Corpo")
+
+            with pytest.raises(TimeoutError, match="A fila de emails está cheia"):
+                sender.send("c@example.com", "Assunto", "Corpo")
+            assert sender.stats().queue_depth == 1
+        finally:
+            release.set()
+            sender.close()
+
+        assert sender.stats().sent == 2
+
+    def test_failures_are_counted(self):
+        """Testa que falhas do remetente são contabilizadas sem parar o worker."""
+        inner = MagicMock()
+        inner.send_each.side_effect = [ConnectionError("falhou"), [None]]
+        sender = QueuedEmailSender(inner, batch_size=1)
+
+        sender.send("a@example.com", "Assunto", "Corpo")
+        sender.send("b@example.com", "Assunto", "Corpo")
+        sender.close()
+
+        stats = sender.stats()
+        assert stats.failed == 1
+        assert stats.sent == 1
+        assert isinstance(sender.last_error, ConnectionError)
+
+    def test_send_after_close_raises_error(self):
+        """Testa que não é possível enfileirar após o encerramento."""
+        sender = QueuedEmailSender(MagicMock())
+        sender.close()
+
+        with pytest.raises(RuntimeError, match="já foi encerrado"):
+            sender.send("a@example.com", "Assunto", "Corpo")
+
+    def test_only_failed_messages_are_counted(self):
+        """Testa que uma falha no lote conta só a mensagem que falhou."""
+        inner = MagicMock()
+        inner.send_each.side_effect = lambda messages: [
+            OSError("recusado") if message.to == "b@example.com" else None
+            for message in messages
+        ]
+        sender = QueuedEmailSender(inner, batch_size=10)
+
+        sender.send_many(
+            [
+                EmailMessage(to=f"{name}@example.com", subject="", body="")
+                for name in "abc"
+            ]
+        )
+        sender.close()
+
+        stats = sender.stats()
+        assert (stats.sent, stats.failed) == (2, 1)
+        assert isinstance(sender.last_error, OSError)
+
+    def test_send_racing_close_is_delivered(self):
+        """Testa que um envio que começou antes de close não se perde."""
+        inner = MagicMock()
+        inner.send_each.side_effect = _deliver_all
+        sender = QueuedEmailSender(inner)
+        put = sender._queue.put
+        closing = []
+
+        def put_while_closing(item, *args, **kwargs):
+            # close começa entre a verificação de encerrado e a entrada na fila
+            if not closing and isinstance(item, tuple):
+                closing.append(threading.Thread(target=sender.close))
+                closing[0].start()
+                closing[0].join(0.1)
+            put(item, *args, **kwargs)
+
+        sender._queue.put = put_while_closing
+        sender.send("a@example.com", "Assunto", "Corpo")
+        closing[0].join()
+
+        assert sender.stats().sent == 1
+        with pytest.raises(RuntimeError, match="já foi encerrado"):
+            sender.send("b@example.com", "Assunto", "Corpo")
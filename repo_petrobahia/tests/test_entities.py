@@ -1,5 +1,8 @@
 """Testes unitários para as entidades do domínio."""
 
+import random
+import sys
+
 import pytest
 
 from domain.entities import Client, Order, OrderItem
@@ -101,3 +104,104 @@ class TestOrder:
         order = Order(client=client, items=items, total=140.0, discount_rate=0.20)
 
         assert order.items_count == 3
+
+    def test_entities_use_slots(self):
+        """Testa que as entidades não alocam __dict__ por instância."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        item = OrderItem(name="Produto A", price=100.0)
+        order = Order(client=client, items=[item], total=80.0, discount_rate=0.20)
+
+        for entity in (client, item, order):
+            assert not hasattr(entity, "__dict__")
+
+    def test_add_item_updates_totals(self):
+        """Testa que adicionar item atualiza subtotal, desconto e total."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        items = [OrderItem(name="Produto A", price=100.0)]
+        order = Order(client=client, items=items, total=80.0, discount_rate=0.20)
+
+        order.add_item(OrderItem(name="Produto B", price=50.0))
+
+        assert order.subtotal == 150.0
+        assert order.discount_amount == 30.0
+        assert order.total == 120.0
+        assert order.items_count == 2
+        # A lista original do chamador não é alterada
+        assert len(items) == 1
+
+    def test_remove_item_updates_totals(self):
+        """Testa que remover item atualiza subtotal e total."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        item_a = OrderItem(name="Produto A", price=100.0)
+        item_b = OrderItem(name="Produto B", price=50.0)
+        order = Order(
+            client=client, items=[item_a, item_b], total=120.0, discount_rate=0.20
+        )
+
+        order.remove_item(item_b)
+        assert order.subtotal == 100.0
+        assert order.total == 80.0
+        assert order.items_count == 1
+
+        order.remove_item(item_a)
+        assert order.subtotal == 0.0
+        assert order.total == 0.0
+
+    def test_item_mutations_match_construction(self):
+        """Testa que add/remove chegam ao mesmo subtotal da construção."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        prices = [0.1, 0.2, 0.3]
+        items = [OrderItem(name=f"Produto {i}", price=p) for i, p in enumerate(prices)]
+        built = Order(client=client, items=items, total=0.0, discount_rate=0.20)
+
+        order = Order(client=client, items=[], total=0.0, discount_rate=0.20)
+        for item in items:
+            order.add_item(item)
+        extra = OrderItem(name="Extra", price=0.7)
+        order.add_item(extra)
+        order.remove_item(extra)
+
+        assert order.subtotal == built.subtotal == 0.6
+        assert order.total == built.subtotal * (1 - 0.20)
+
+    def test_subtotal_is_compensated(self):
+        """Testa que a soma incremental não perde parcelas pequenas."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        order = Order(client=client, items=[], total=0.0, discount_rate=0.0)
+
+        for price in (1e16, 1.0, 1.0):
+            order.add_item(OrderItem(name="Produto", price=price))
+        # Uma soma ingênua perderia as duas parcelas de 1.0
+        assert order.subtotal == 1e16 + 2.0
+
+        extra = OrderItem(name="Extra", price=3.0)
+        order.add_item(extra)
+        order.remove_item(extra)
+        assert order.subtotal == 1e16 + 2.0
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 12), reason="sum() é compensado a partir do 3.12"
+    )
+    def test_subtotal_matches_builtin_sum(self):
+        """Testa que a soma incremental é igual à de sum()."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        rng = random.Random(8)
+        prices = [rng.uniform(0, 10 ** rng.randint(-3, 12)) for _ in range(500)]
+        order = Order(client=client, items=[], total=0.0, discount_rate=0.0)
+
+        for i, price in enumerate(prices):
+            order.add_item(OrderItem(name="Produto", price=price))
+            assert order.subtotal == sum(prices[: i + 1])
+
+    def test_remove_missing_item_raises_error(self):
+        """Testa que remover item inexistente gera ValueError."""
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+        order = Order(
+            client=client,
+            items=[OrderItem(name="Produto A", price=100.0)],
+            total=80.0,
+            discount_rate=0.20,
+        )
+
+        with pytest.raises(ValueError, match="O item não pertence ao pedido"):
+            order.remove_item(OrderItem(name="Produto B", price=50.0))
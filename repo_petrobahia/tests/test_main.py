@@ -0,0 +1,228 @@
+"""Testes da linha de comando em main.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from main import main
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Arquivo de clientes cadastrados com dois clientes."""
+    path = tmp_path / "clientes.txt"
+    path.write_text(
+        "Ana Paula,ana@petrobahia.com,gold\nCarlos Silva,carlos@petrobahia.com,silver\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+class TestCommands:
+    """Casos de teste para os subcomandos."""
+
+    def test_register_reports_each_rejection(self, tmp_path, store, capsys):
+        """Testa o registro em lote a partir de um arquivo de clientes."""
+        clients = tmp_path / "novos.csv"
+        clients.write_text(
+            "Joana,joana@petrobahia.com,bronze\n"
+            "Ana Paula,ana@petrobahia.com,gold\n"
+            "Sem Email,invalido,gold\n",
+            encoding="utf-8",
+        )
+
+        assert main(["register", str(clients), "--store", store]) == 0
+
+        output = capsys.readouterr().out
+        assert "1 de 3 cliente(s) registrado(s)" in output
+        assert "ana@petrobahia.com: Cliente com email" in output
+        assert "invalido: Formato de email inválido" in output
+
+    @pytest.mark.parametrize(
+        ("line", "message"),
+        [
+            ("Jo,jo@x.com,", "Linha 2: cliente inválido"),
+            ("Jo,jo@x.com", "Linha 2: esperado nome,email,nível"),
+        ],
+    )
+    def test_register_rejects_malformed_lines(
+        self, tmp_path, store, capsys, line, message
+    ):
+        """Testa que uma linha malformada é relatada com o número, sem registro."""
+        clients = tmp_path / "novos.csv"
+        clients.write_text(
+            f"Joana,joana@petrobahia.com,bronze\n{line}\n", encoding="utf-8"
+        )
+
+        assert main(["register", str(clients), "--store", store]) == 1
+
+        assert message in capsys.readouterr().err
+        assert "joana" not in Path(store).read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize("mode", ["float", "exact", "batch"])
+    def test_price_modes_agree(self, tmp_path, capsys, mode):
+        """Testa que os três modos de cálculo dão o mesmo total."""
+        if mode == "batch":
+            pytest.importorskip("numpy")
+        carts = tmp_path / "carrinhos.txt"
+        carts.write_text("# comentário\n10.5,20\n\nA:5,B:7.25,C:1\n", encoding="utf-8")
+
+        assert main(["price", str(carts), "--mode", mode]) == 0
+
+        assert "2 carrinho(s), total R$ 48.13" in capsys.readouterr().out
+
+    def test_batch_without_numpy_reports_error(self, tmp_path, capsys, monkeypatch):
+        """Testa que o modo batch sem NumPy termina com erro, sem traceback."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        carts = tmp_path / "carrinhos.txt"
+        carts.write_text("10.5,20\n", encoding="utf-8")
+
+        assert main(["price", str(carts), "--mode", "batch"]) == 1
+
+        assert "Erro: O cálculo em lote requer NumPy" in capsys.readouterr().err
+
+    def test_orders_writes_summaries(self, tmp_path, store, capsys):
+        """Testa o processamento de pedidos de clientes cadastrados."""
+        orders = tmp_path / "pedidos.txt"
+        orders.write_text(
+            "ana@petrobahia.com,Gasolina:100,Diesel:50\ncarlos@petrobahia.com,30\n",
+            encoding="utf-8",
+        )
+        output = tmp_path / "resumos.txt"
+
+        code = main(["orders", str(orders), "--store", store, "--output", str(output)])
+
+        assert code == 0
+        assert "2 pedido(s) processado(s), total R$ 147.00" in capsys.readouterr().out
+        assert "Pedido de Ana Paula (nível gold)" in output.read_text(encoding="utf-8")
+
+    def test_orders_rejects_unknown_client(self, tmp_path, store, capsys):
+        """Testa que pedidos de clientes não cadastrados são apontados."""
+        orders = tmp_path / "pedidos.txt"
+        orders.write_text("outro@petrobahia.com,10\n", encoding="utf-8")
+
+        assert main(["orders", str(orders), "--store", store]) == 1
+
+        error = capsys.readouterr().err
+        assert "Linha 1: cliente outro@petrobahia.com não cadastrado" in error
+
+    def test_invalid_item_points_to_line(self, tmp_path, capsys):
+        """Testa que itens inválidos indicam a linha do arquivo."""
+        carts = tmp_path / "carrinhos.txt"
+        carts.write_text("10\nA:-1\n", encoding="utf-8")
+
+        assert main(["price", str(carts)]) == 1
+
+        assert "Linha 2: item inválido 'A:-1'" in capsys.readouterr().err
+
+    def test_load_counts_tiers(self, store, capsys):
+        """Testa o carregamento dos clientes cadastrados."""
+        assert main(["load", "--store", store, "--mode", "iter"]) == 0
+
+        output = capsys.readouterr().out
+        assert "2 cliente(s) carregado(s)" in output
+        assert "  gold: 1" in output
+
+
+def _modules_loaded_by(argv, cwd):
+    """Módulos carregados ao importar main (e rodar argv) em um processo novo."""
+    src_path = str(Path(__file__).resolve().parent.parent / "src")
+    code = f"import json, sys\nsys.path.insert(0, {src_path!r})\nimport main\n"
+    if argv is not None:
+        code += f"main.main({argv!r})\n"
+    code += "print(json.dumps(sorted(sys.modules)))\n"
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, capture_output=True, check=True
+    )
+    return set(json.loads(completed.stdout.decode("utf-8").splitlines()[-1]))
+
+
+class TestStartup:
+    """Casos de teste para as importações sob demanda de cada comando."""
+
+    def test_import_loads_no_application_module(self, tmp_path):
+        """Testa que importar main não carrega serviços nem casos de uso."""
+        modules = _modules_loaded_by(None, tmp_path)
+
+        packages = {name.split(".")[0] for name in modules}
+        assert not packages & {"domain", "services", "infrastructure", "use_cases"}
+        assert "argparse" in modules
+
+    def test_price_skips_repository_and_process_pool(self, tmp_path):
+        """Testa que o comando price não carrega o repositório nem o pool."""
+        carts = tmp_path / "carrinhos.txt"
+        carts.write_text("10,20\n", encoding="utf-8")
+
+        modules = _modules_loaded_by(["price", str(carts)], tmp_path)
+
+        assert "use_cases.price_calculation" in modules
+        assert "infrastructure.repositories" not in modules
+        assert "concurrent.futures" not in modules
+        assert "http.server" not in modules
+        assert "cProfile" not in modules
+
+
+class TestMeasurement:
+    """Casos de teste para as opções de medição."""
+
+    def test_repeat_reports_timings(self, store, capsys):
+        """Testa que --repeat relata os tempos na saída de erro."""
+        assert main(["load", "--store", store, "--repeat", "3"]) == 0
+
+        captured = capsys.readouterr()
+        assert "Tempo em 3 execuções: mín" in captured.err
+        assert "Tempo" not in captured.out
+
+    def test_repeat_register_reports_first_run(self, tmp_path, store, capsys):
+        """Testa que as repetições do registro não gravam no cadastro."""
+        clients = tmp_path / "novos.csv"
+        clients.write_text("Joana,joana@petrobahia.com,bronze\n", encoding="utf-8")
+
+        assert main(["register", str(clients), "--store", store, "--repeat", "3"]) == 0
+
+        captured = capsys.readouterr()
+        assert "1 de 1 cliente(s) registrado(s)" in captured.out
+        assert captured.out.count("Para: joana@petrobahia.com") == 1
+        assert "Tempo em 3 execuções: mín" in captured.err
+        lines = Path(store).read_text(encoding="utf-8").splitlines()
+        assert lines.count("Joana,joana@petrobahia.com,bronze") == 1
+        assert len(lines) == 3
+
+    def test_profile_prints_sorted_summary(self, tmp_path, store, capsys):
+        """Testa o resumo do cProfile e a gravação das estatísticas."""
+        stats_path = tmp_path / "load.prof"
+
+        code = main(
+            [
+                "load",
+                "--store",
+                store,
+                "--profile",
+                "--profile-sort",
+                "tottime",
+                "--profile-output",
+                str(stats_path),
+            ]
+        )
+
+        assert code == 0
+        error = capsys.readouterr().err
+        assert "Ordered by: internal time" in error
+        assert "load_all" in error
+        assert stats_path.stat().st_size > 0
+
+    def test_tracemalloc_reports_peak(self, store, capsys):
+        """Testa o relatório de pico de memória e pontos de alocação."""
+        assert main(["load", "--store", store, "--tracemalloc", "--top", "2"]) == 0
+
+        error = capsys.readouterr().err
+        assert "Pico de memória:" in error
+        assert "Maiores pontos de alocação (top 2):" in error
+
+    def test_repeat_must_be_positive(self, store):
+        """Testa que --repeat menor que 1 é recusado."""
+        with pytest.raises(SystemExit):
+            main(["load", "--store", store, "--repeat", "0"])
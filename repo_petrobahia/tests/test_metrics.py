@@ -0,0 +1,198 @@
+"""Testes unitários para o subsistema de métricas."""
+
+import threading
+import urllib.request
+
+import pytest
+
+from domain.entities import Client, OrderItem
+from services.discount import TierDiscountCalculator
+from services.metrics import (
+    METRICS,
+    OPERATION_ERRORS,
+    OPERATION_SECONDS,
+    MetricsRegistry,
+    start_http_server,
+    timed,
+)
+from use_cases.order_processing import ProcessOrderUseCase
+
+
+@pytest.fixture
+def metrics():
+    """Habilita o registro global durante o teste e o limpa depois."""
+    METRICS.clear()
+    METRICS.enable()
+    yield METRICS
+    METRICS.disable()
+    METRICS.clear()
+
+
+class TestMetricsRegistry:
+    """Casos de teste para MetricsRegistry."""
+
+    def test_counter_and_gauge_dump(self):
+        """Testa a exportação de contadores e medidores."""
+        registry = MetricsRegistry(enabled=True)
+        registry.counter("pedidos_total", "Pedidos processados.").inc()
+        registry.counter("pedidos_total", labels={"nivel": "gold"}).inc(2)
+        gauge = registry.gauge("fila_emails", "Emails na fila.")
+        gauge.set(5)
+        gauge.dec()
+
+        assert registry.dump() == (
+            "# HELP fila_emails Emails na fila.\n"
+            "# TYPE fila_emails gauge\n"
+            "fila_emails 4\n"
+            "# HELP pedidos_total Pedidos processados.\n"
+            "# TYPE pedidos_total counter\n"
+            "pedidos_total 1\n"
+            'pedidos_total{nivel="gold"} 2\n'
+        )
+
+    def test_histogram_dump_is_cumulative(self):
+        """Testa as faixas cumulativas, a soma e a contagem do histograma."""
+        registry = MetricsRegistry(enabled=True)
+        histogram = registry.histogram(
+            "latencia", labels={"operation": 'a"b'}, buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert registry.dump().splitlines()[1:] == [
+            'latencia_bucket{operation="a\\"b",le="0.1"} 2',
+            'latencia_bucket{operation="a\\"b",le="1.0"} 3',
+            'latencia_bucket{operation="a\\"b",le="+Inf"} 4',
+            'latencia_sum{operation="a\\"b"} 3.65',
+            'latencia_count{operation="a\\"b"} 4',
+        ]
+
+    def test_accumulates_across_threads(self):
+        """Testa que as gravações de várias threads são somadas na leitura."""
+        registry = MetricsRegistry(enabled=True)
+        counter = registry.counter("eventos_total")
+        histogram = registry.histogram("duracao", buckets=(1.0,))
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+                histogram.observe(0.5)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 4000
+        assert histogram.count == 4000
+
+    def test_finished_threads_are_folded_into_totals(self):
+        """Testa que threads que terminaram não deixam acumuladores para trás."""
+        registry = MetricsRegistry(enabled=True)
+        counter = registry.counter("eventos_total")
+        histogram = registry.histogram("duracao", buckets=(1.0,))
+
+        for _ in range(50):
+            thread = threading.Thread(
+                target=lambda: (counter.inc(2), histogram.observe(0.5))
+            )
+            thread.start()
+            thread.join()
+        counter.inc()
+
+        assert counter.value == 101
+        assert histogram.snapshot() == ([50, 0], 25.0)
+        # Só a thread atual, que continua viva, mantém um acumulador
+        assert len(counter._cells._cells) == 1
+        assert len(histogram._cells._cells) == 0
+
+    def test_disabled_registry_records_nothing(self):
+        """Testa que um registro desabilitado não grava valores."""
+        registry = MetricsRegistry()
+        counter = registry.counter("eventos_total")
+        counter.inc()
+        registry.histogram("duracao").observe(1.0)
+
+        assert counter.value == 0
+        assert registry.histogram("duracao").count == 0
+
+    def test_kind_conflict_raises_error(self):
+        """Testa que um nome não pode ser reutilizado com outro tipo."""
+        registry = MetricsRegistry()
+        registry.counter("eventos")
+
+        with pytest.raises(ValueError, match="já foi registrada como counter"):
+            registry.gauge("eventos")
+
+    def test_counter_rejects_negative_amount(self):
+        """Testa que o contador não pode diminuir."""
+        registry = MetricsRegistry(enabled=True)
+
+        with pytest.raises(ValueError, match="O contador só pode aumentar"):
+            registry.counter("eventos").inc(-1)
+
+
+class TestTimed:
+    """Casos de teste para o decorador timed e a instrumentação."""
+
+    def test_records_latency_and_errors(self, metrics):
+        """Testa a latência de cada chamada e o contador de erros."""
+
+        @timed
+        def operation(fail):
+            if fail:
+                raise RuntimeError("falhou")
+            return "ok"
+
+        assert operation(False) == "ok"
+        with pytest.raises(RuntimeError):
+            operation(True)
+
+        labels = {"operation": operation.__qualname__}
+        assert metrics.histogram(OPERATION_SECONDS, labels=labels).count == 2
+        assert metrics.counter(OPERATION_ERRORS, labels=labels).value == 1
+
+    def test_disabled_metrics_skip_recording(self):
+        """Testa que, desabilitadas, as métricas não registram nada."""
+        METRICS.clear()
+        use_case = ProcessOrderUseCase(TierDiscountCalculator())
+
+        use_case.execute(
+            Client(name="João", email="joao@example.com", tier="gold"),
+            [OrderItem(name="Produto", price=10.0)],
+        )
+
+        assert METRICS.dump() == ""
+
+    def test_use_case_is_instrumented(self, metrics):
+        """Testa que o caso de uso de pedidos aparece na exportação."""
+        use_case = ProcessOrderUseCase(TierDiscountCalculator())
+
+        use_case.execute(
+            Client(name="João", email="joao@example.com", tier="gold"),
+            [OrderItem(name="Produto", price=10.0)],
+        )
+
+        assert (
+            f'{OPERATION_SECONDS}_count{{operation="ProcessOrderUseCase.execute"}} 1'
+            in metrics.dump()
+        )
+
+    def test_http_endpoint_serves_dump(self):
+        """Testa o endpoint HTTP local com o texto do Prometheus."""
+        registry = MetricsRegistry(enabled=True)
+        registry.counter("eventos_total").inc(3)
+        server = start_http_server(registry=registry)
+
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert body == registry.dump()
+        assert content_type.startswith("text/plain")
@@ -0,0 +1,86 @@
+"""Testes unitários para o valor monetário em centavos."""
+
+from fractions import Fraction
+
+import pytest
+
+from domain.money import Money, RoundingMode, divide, exact_ratio, to_cents
+
+
+class TestMoney:
+    """Casos de teste para Money."""
+
+    def test_from_float_uses_repr(self):
+        """Testa a conversão de reais para centavos pelo repr do float."""
+        assert Money.from_float(19.99) == Money(1999)
+        assert Money.from_float(0.1 + 0.2) == Money(30)
+        assert Money.from_float(1e16) == Money(10**18)
+
+    def test_from_float_rounds_extra_decimals(self):
+        """Testa o arredondamento de valores com mais de duas casas."""
+        assert Money.from_float(1.005) == Money(100)
+        assert Money.from_float(1.005, RoundingMode.HALF_UP) == Money(101)
+        assert Money.from_float(2.675, RoundingMode.HALF_EVEN) == Money(268)
+
+    def test_arithmetic(self):
+        """Testa soma, subtração, negação e multiplicação por inteiro."""
+        price = Money(1050)
+
+        assert price + Money(25) == Money(1075)
+        assert price - Money(2000) == Money(-950)
+        assert -price == Money(-1050)
+        assert price * 3 == 3 * price == Money(3150)
+        assert Money(100) < Money(101)
+
+    def test_scale_rounds_once(self):
+        """Testa a multiplicação por fração exata com um único arredondamento."""
+        # 10,05 * 0,9 * 1,1 = 9,9495 -> 9,95; arredondando após o desconto
+        # (9,045 -> 9,04) o resultado seria 9,94
+        factor = Fraction(9, 10) * Fraction(11, 10)
+
+        assert Money(1005).scale(factor) == Money(995)
+
+    def test_str_and_float(self):
+        """Testa a representação textual e a conversão para float."""
+        assert str(Money(1999)) == "19.99"
+        assert str(Money(-5)) == "-0.05"
+        assert Money(1999).to_float() == 19.99
+
+
+class TestRounding:
+    """Casos de teste para divide, to_cents e exact_ratio."""
+
+    @pytest.mark.parametrize(
+        "rounding, expected",
+        [
+            (RoundingMode.HALF_EVEN, [2, 2, -2, 3, -3]),
+            (RoundingMode.HALF_UP, [3, 2, -3, 3, -3]),
+            (RoundingMode.HALF_DOWN, [2, 2, -2, 3, -3]),
+            (RoundingMode.UP, [3, 3, -3, 3, -3]),
+            (RoundingMode.DOWN, [2, 2, -2, 2, -2]),
+            (RoundingMode.CEILING, [3, 3, -2, 3, -2]),
+            (RoundingMode.FLOOR, [2, 2, -3, 2, -3]),
+        ],
+    )
+    def test_divide_modes(self, rounding, expected):
+        """Testa 2,5; 2,25; -2,5; 2,75 e -2,75 em cada modo."""
+        cases = [(5, 2), (9, 4), (-5, 2), (11, 4), (-11, 4)]
+
+        assert [divide(n, d, rounding) for n, d in cases] == expected
+
+    def test_divide_exact(self):
+        """Testa que divisões exatas não sofrem arredondamento."""
+        for rounding in RoundingMode:
+            assert divide(-12, 4, rounding) == -3
+
+    def test_exact_ratio_from_repr(self):
+        """Testa que a taxa vira a fração decimal escrita, não a binária."""
+        assert exact_ratio(0.1) == Fraction(1, 10)
+        assert exact_ratio(0.0725) == Fraction(29, 400)
+        assert exact_ratio(1e-05) == Fraction(1, 100000)
+
+    def test_to_cents(self):
+        """Testa a conversão direta para centavos."""
+        assert to_cents(0.07) == 7
+        assert to_cents(0.125) == 12
+        assert to_cents(0.125, RoundingMode.UP) == 13
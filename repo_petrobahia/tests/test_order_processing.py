@@ -1,13 +1,14 @@
 """Testes unitários para os casos de uso de processamento de pedidos."""
 
+import io
+import pickle
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from domain.entities import Client, OrderItem
+from domain.entities import Client, Order, OrderItem
 from services.discount import TierDiscountCalculator
-from use_cases.order_processing import (
-    GenerateOrderSummaryUseCase,
-    ProcessOrderUseCase,
-)
+from use_cases.order_processing import GenerateOrderSummaryUseCase, ProcessOrderUseCase
 
 
 class TestProcessOrderUseCase:
@@ -45,6 +46,42 @@ class TestProcessOrderUseCase:
         assert order.discount_rate == 0.10
         assert order.total == 90.0
 
+    def test_item_mutations_use_order_calculator(self):
+        """Testa que add_item/remove_item recalculam o total pelo calculador."""
+        calculator = MagicMock(spec=TierDiscountCalculator)
+        calculator.get_discount_rate_by_code.return_value = 0.20
+        calculator.calculate_discounted_price_by_code.side_effect = (
+            lambda price, code: price - 1.0
+        )
+        use_case = ProcessOrderUseCase(calculator)
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+
+        order = use_case.execute(client, [OrderItem(name="Produto A", price=100.0)])
+        extra = OrderItem(name="Extra", price=7.0)
+        use_case.add_item(order, OrderItem(name="Produto B", price=50.0))
+        use_case.add_item(order, extra)
+        use_case.remove_item(order, extra)
+
+        expected = use_case.execute(
+            client,
+            [
+                OrderItem(name="Produto A", price=100.0),
+                OrderItem(name="Produto B", price=50.0),
+            ],
+        )
+        assert order.subtotal == expected.subtotal == 150.0
+        assert order.total == expected.total == 149.0
+
+    def test_orders_do_not_carry_the_calculator(self):
+        """Testa que o pedido serializado não leva o calculador junto."""
+        calculator = TierDiscountCalculator()
+        use_case = ProcessOrderUseCase(calculator)
+        client = Client(name="João Silva", email="joao@example.com", tier="gold")
+
+        order = use_case.execute(client, [OrderItem(name="Produto A", price=100.0)])
+
+        assert b"TierDiscountCalculator" not in pickle.dumps(order)
+
     def test_process_order_empty_items_raises_error(self):
         """Testa que lista de itens vazia gera ValueError."""
         calculator = TierDiscountCalculator()
@@ -55,6 +92,50 @@ class TestProcessOrderUseCase:
         with pytest.raises(ValueError, match="O pedido deve conter pelo menos um item"):
             use_case.execute(client, [])
 
+    def test_execute_parallel_keeps_input_order(self):
+        """Testa que o processamento paralelo preserva a ordem de entrada."""
+        use_case = ProcessOrderUseCase(TierDiscountCalculator())
+        orders = _sample_batch(10)
+
+        results = use_case.execute_parallel(
+            orders, workers=2, chunk_size=3, min_parallel_size=0
+        )
+
+        assert results == [use_case.execute(client, items) for client, items in orders]
+
+    def test_execute_parallel_auto_chunk_size(self):
+        """Testa o processamento paralelo com ajuste automático do bloco."""
+        use_case = ProcessOrderUseCase(TierDiscountCalculator())
+        orders = _sample_batch(300)
+
+        results = use_case.execute_parallel(orders, workers=2, min_parallel_size=0)
+
+        assert [order.client.email for order in results] == [
+            client.email for client, _ in orders
+        ]
+        assert results[-1].total == use_case.execute(*orders[-1]).total
+
+    def test_execute_parallel_small_batch_runs_in_process(self):
+        """Testa que lotes pequenos não iniciam o pool de processos."""
+        calculator = MagicMock()
+        calculator.get_discount_rate_by_code.return_value = 0.10
+        calculator.calculate_discounted_price_by_code.return_value = 90.0
+        use_case = ProcessOrderUseCase(calculator)
+
+        with patch("concurrent.futures.ProcessPoolExecutor") as executor:
+            results = use_case.execute_parallel(_sample_batch(5), workers=4)
+
+        executor.assert_not_called()
+        assert [order.total for order in results] == [90.0] * 5
+
+    def test_tune_chunk_size_bounds(self):
+        """Testa os limites do ajuste automático do tamanho do bloco."""
+        tune = ProcessOrderUseCase._tune_chunk_size
+
+        assert tune(0.05, 1000, 4) == 1
+        assert tune(1e-9, 1000, 4) == 250
+        assert tune(1e-5, 100_000, 4) == 5000
+
 
 class TestGenerateOrderSummaryUseCase:
     """Casos de teste para GenerateOrderSummaryUseCase."""
@@ -103,3 +184,52 @@ class TestGenerateOrderSummaryUseCase:
         assert "Subtotal:" in summary
         assert "Desconto:" in summary
         assert "Total:" in summary
+
+    def test_iter_lines_matches_execute(self):
+        """Testa que as linhas geradas compõem o mesmo resumo de execute."""
+        use_case = GenerateOrderSummaryUseCase()
+        order = _sample_order()
+
+        assert "\n".join(use_case.iter_lines(order)) == use_case.execute(order)
+
+    def test_write_to_stream(self):
+        """Testa a escrita do resumo em um stream de texto."""
+        use_case = GenerateOrderSummaryUseCase()
+        order = _sample_order()
+        stream = io.StringIO()
+
+        use_case.write(order, stream)
+
+        assert stream.getvalue() == use_case.execute(order) + "\n"
+
+    def test_write_many_to_file(self, tmp_path):
+        """Testa a exportação em lote de vários resumos para um arquivo."""
+        use_case = GenerateOrderSummaryUseCase()
+        orders = [_sample_order(), _sample_order(tier="silver")]
+        path = tmp_path / "resumos.txt"
+
+        count = use_case.write_many(iter(orders), str(path))
+
+        assert count == 2
+        expected = "\n".join(use_case.execute(order) + "\n" for order in orders)
+        assert path.read_text(encoding="utf-8") == expected
+
+
+def _sample_order(tier="gold"):
+    client = Client(name="João Silva", email="joao@example.com", tier=tier)
+    items = [
+        OrderItem(name="Produto A", price=100.0),
+        OrderItem(name="Produto B", price=50.0),
+    ]
+    return Order(client=client, items=items, total=120.0, discount_rate=0.20)
+
+
+def _sample_batch(count):
+    tiers = ["gold", "silver", "bronze", "standard"]
+    return [
+        (
+            Client(name=f"Cliente {i}", email=f"c{i}@example.com", tier=tiers[i % 4]),
+            [OrderItem(name="Produto", price=float(i + j)) for j in range(1, 4)],
+        )
+        for i in range(count)
+    ]
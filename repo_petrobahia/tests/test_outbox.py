@@ -0,0 +1,252 @@
+"""Testes unitários para a caixa de saída de emails e o despachante."""
+
+import smtplib
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.entities import EmailMessage
+from infrastructure.local_smtp import LocalSmtpServer
+from infrastructure.outbox import OutboxDispatcher, SqliteEmailOutbox
+from infrastructure.smtp import SmtpEmailSender
+
+
+def _message(i, key=None):
+    """Mensagem numerada para cliente{i}@example.com."""
+    return EmailMessage(
+        to=f"cliente{i}@example.com", subject=f"Olá {i}", body="Corpo", key=key
+    )
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    """Caixa de saída em um banco temporário."""
+    with SqliteEmailOutbox(str(tmp_path / "outbox.db")) as email_outbox:
+        yield email_outbox
+
+
+class TestSqliteEmailOutbox:
+    """Casos de teste para SqliteEmailOutbox."""
+
+    def test_enqueue_deduplicates_by_key(self, outbox):
+        """Testa que a mesma chave é guardada uma única vez."""
+        assert outbox.enqueue_many([_message(0, "a"), _message(1, "b")]) == 2
+        assert outbox.enqueue_many([_message(0, "a"), _message(2, "c")]) == 1
+        assert outbox.enqueue(_message(1, "b")) is False
+        # Sem chave, cada mensagem é nova
+        assert outbox.enqueue_many([_message(3), _message(3)]) == 2
+
+        assert outbox.counts() == {"pending": 5}
+
+    def test_claim_leases_messages_in_order(self, outbox):
+        """Testa que claim entrega em ordem e reserva as mensagens."""
+        outbox.enqueue_many([_message(i, str(i)) for i in range(5)])
+
+        first = outbox.claim(3, lease=60)
+        second = outbox.claim(3, lease=60)
+
+        assert [entry.message.key for entry in first] == ["0", "1", "2"]
+        assert [entry.message.key for entry in second] == ["3", "4"]
+        assert first[0].message == _message(0, "0")
+        assert outbox.claim(3, lease=60) == []
+
+    def test_expired_lease_returns_messages(self, outbox):
+        """Testa que mensagens de um despachante que caiu voltam à fila."""
+        outbox.enqueue(_message(0, "a"))
+        outbox.claim(10, lease=0)
+
+        assert [entry.message.key for entry in outbox.claim(10, lease=60)] == ["a"]
+
+    def test_messages_survive_reopening(self, tmp_path):
+        """Testa que as mensagens guardadas persistem no banco."""
+        path = str(tmp_path / "outbox.db")
+        with SqliteEmailOutbox(path) as outbox:
+            outbox.enqueue(_message(0, "a"))
+
+        with SqliteEmailOutbox(path) as outbox:
+            assert outbox.enqueue(_message(0, "a")) is False
+            assert [entry.message.to for entry in outbox.claim(10, 60)] == [
+                "cliente0@example.com"
+            ]
+
+    def test_purge_sent(self, outbox):
+        """Testa que só as enviadas antes do instante são apagadas."""
+        outbox.enqueue_many([_message(0, "a"), _message(1, "b")])
+        entries = outbox.claim(1, lease=60)
+        outbox.mark_sent(entry.id for entry in entries)
+
+        assert outbox.purge_sent(before=time.time() + 1) == 1
+        assert outbox.counts() == {"pending": 1}
+
+
+class TestOutboxDispatcher:
+    """Casos de teste para OutboxDispatcher."""
+
+    def test_dispatch_sends_in_batches(self, outbox):
+        """Testa que cada lote vai em uma chamada de send_each."""
+        outbox.enqueue_many([_message(i) for i in range(5)])
+        sender = MagicMock()
+        sender.send_each.side_effect = lambda messages: [None] * len(messages)
+        dispatcher = OutboxDispatcher(outbox, sender, batch_size=3)
+
+        assert dispatcher.dispatch_once() == 3
+        assert dispatcher.dispatch_once() == 2
+        assert dispatcher.dispatch_once() == 0
+
+        assert [len(call.args[0]) for call in sender.send_each.call_args_list] == [
+            3,
+            2,
+        ]
+        assert outbox.counts() == {"sent": 5}
+
+    def test_failed_batch_is_retried_with_backoff(self, outbox):
+        """Testa que uma falha reagenda o lote com espera exponencial."""
+        outbox.enqueue(_message(0))
+        sender = MagicMock()
+        sender.send_each.return_value = [ConnectionError("servidor fora do ar")]
+        dispatcher = OutboxDispatcher(outbox, sender, base_delay=10, max_delay=25)
+
+        assert dispatcher.dispatch_once() == 1
+        assert outbox.counts() == {"pending": 1}
+        # A próxima tentativa só vence depois da espera
+        assert dispatcher.dispatch_once() == 0
+        assert [dispatcher.backoff(n) for n in (1, 2, 3, 4)] == [10, 20, 25, 25]
+
+    def test_message_is_abandoned_after_max_attempts(self, outbox):
+        """Testa que as tentativas se esgotam e a mensagem fica como dead."""
+        outbox.enqueue(_message(0))
+        sender = MagicMock()
+        sender.send_each.side_effect = [ConnectionError("fora"), TimeoutError("lento")]
+        dispatcher = OutboxDispatcher(
+            outbox, sender, max_attempts=2, base_delay=0, max_delay=0
+        )
+
+        dispatcher.dispatch_once()
+        dispatcher.dispatch_once()
+
+        assert outbox.counts() == {"dead": 1}
+        row = outbox._connection.execute(
+            "SELECT attempts, last_error FROM email_outbox"
+        ).fetchone()
+        assert row == (2, "TimeoutError: lento")
+
+    def test_refused_recipients(self, outbox):
+        """Testa recusas definitivas, temporárias e os demais do lote."""
+        outbox.enqueue_many([_message(i) for i in range(3)])
+        sender = MagicMock()
+        sender.send_each.return_value = [
+            smtplib.SMTPResponseException(550, b"Mailbox unavailable"),
+            smtplib.SMTPResponseException(451, b"Try again later"),
+            None,
+        ]
+
+        OutboxDispatcher(outbox, sender).dispatch_once()
+
+        assert outbox.counts() == {"dead": 1, "pending": 1, "sent": 1}
+        rows = outbox._connection.execute(
+            "SELECT status, last_error FROM email_outbox ORDER BY id"
+        ).fetchall()
+        assert [error for _, error in rows] == [
+            "550 Mailbox unavailable",
+            "451 Try again later",
+            None,
+        ]
+
+    def test_refusal_applies_only_to_its_message(self, outbox):
+        """Testa que a recusa vale pela posição, não pelo destinatário."""
+        outbox.enqueue_many([_message(0), _message(0)])
+        sender = MagicMock()
+        sender.send_each.return_value = [
+            None,
+            smtplib.SMTPResponseException(552, b"Message too large"),
+        ]
+
+        OutboxDispatcher(outbox, sender).dispatch_once()
+
+        assert outbox.counts() == {"dead": 1, "sent": 1}
+
+    def test_errors_not_attributed_to_a_message_are_retried(self, outbox):
+        """Testa que só recusas 5xx abandonam; outros erros voltam à fila."""
+        outbox.enqueue_many([_message(i) for i in range(4)])
+        sender = MagicMock()
+        sender.send_each.return_value = [
+            None,
+            smtplib.SMTPResponseException(553, b"Mailbox name not allowed"),
+            UnicodeEncodeError("ascii", "joão", 2, 3, "ordinal not in range"),
+            ValueError("lote interrompido"),
+        ]
+
+        OutboxDispatcher(outbox, sender).dispatch_once()
+
+        assert outbox.counts() == {"dead": 1, "pending": 2, "sent": 1}
+
+    @pytest.mark.parametrize("address", ["a<b@x.com", "joão@example.com"])
+    def test_invalid_address_mid_batch_is_abandoned(self, outbox, address):
+        """Testa que um endereço inválido não impede o resto do lote."""
+        messages = [_message(i) for i in range(6)]
+        messages[2] = EmailMessage(to=address, subject="Olá", body="Corpo")
+        outbox.enqueue_many(messages)
+
+        with LocalSmtpServer() as server:
+            with SmtpEmailSender(
+                server.host, server.port, "naoresponda@petrobahia.com"
+            ) as sender:
+                OutboxDispatcher(outbox, sender).dispatch_once()
+
+            received = [message.recipients[0] for message in server.messages]
+
+        assert outbox.counts() == {"dead": 1, "sent": 5}
+        assert received == [f"cliente{i}@example.com" for i in range(6) if i != 2]
+
+    def test_drop_mid_batch_retries_only_undelivered(self, outbox):
+        """Testa que uma queda no meio do lote não reenvia as já entregues."""
+        outbox.enqueue_many([_message(i) for i in range(6)])
+
+        with LocalSmtpServer(drop_after=3) as server:
+            with SmtpEmailSender(
+                server.host, server.port, "naoresponda@petrobahia.com", max_reconnects=0
+            ) as sender:
+                dispatcher = OutboxDispatcher(outbox, sender, base_delay=0, max_delay=0)
+                dispatcher.dispatch_once()
+                assert outbox.counts() == {"pending": 3, "sent": 3}
+
+                dispatcher.dispatch_once()
+
+            received = [message.recipients[0] for message in server.messages]
+
+        assert outbox.counts() == {"sent": 6}
+        assert received == [f"cliente{i}@example.com" for i in range(6)]
+
+    def test_run_drains_through_smtp(self, outbox):
+        """Testa o despachante em segundo plano entregando pelo SMTP local."""
+        outbox.enqueue_many([_message(i) for i in range(25)])
+        stop = threading.Event()
+
+        with LocalSmtpServer() as server:
+            with SmtpEmailSender(
+                server.host, server.port, "naoresponda@petrobahia.com"
+            ) as sender:
+                dispatcher = OutboxDispatcher(outbox, sender, batch_size=10)
+                worker = threading.Thread(
+                    target=dispatcher.run, args=(stop,), kwargs={"poll_interval": 0.01}
+                )
+                worker.start()
+                deadline = time.monotonic() + 5
+                while outbox.counts() != {"sent": 25} and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                stop.set()
+                worker.join()
+
+            assert outbox.counts() == {"sent": 25}
+            assert len(server.messages) == 25
+
+    def test_invalid_arguments(self, outbox):
+        """Testa que lote, tentativas e esperas inválidos são recusados."""
+        with pytest.raises(ValueError, match="lote"):
+            OutboxDispatcher(outbox, MagicMock(), batch_size=0)
+        with pytest.raises(ValueError, match="tentativas"):
+            OutboxDispatcher(outbox, MagicMock(), max_attempts=0)
+        with pytest.raises(ValueError, match="intervalos"):
+            OutboxDispatcher(outbox, MagicMock(), base_delay=10, max_delay=1)
@@ -0,0 +1,59 @@
+"""Testes unitários para o índice esparso de páginas."""
+
+import pytest
+
+from infrastructure.page_index import PageIndex
+
+
+def _index_every_line(count, interval):
+    """Índice de count clientes em linhas de 10 bytes."""
+    index = PageIndex(interval)
+    for row in range(count):
+        index.add(row * 10)
+    index.cover(count * 10, b"fim", (1, 2, 3))
+    return index
+
+
+class TestPageIndex:
+    """Casos de teste para PageIndex."""
+
+    def test_seek_returns_previous_checkpoint(self):
+        """Testa que seek volta ao marco anterior à posição."""
+        index = _index_every_line(25, interval=10)
+
+        assert index.seek(0) == (0, 0)
+        assert index.seek(9) == (0, 0)
+        assert index.seek(17) == (100, 10)
+        assert index.seek(20) == (200, 20)
+        assert index.seek(25) == (250, 25)
+        assert index.seek(1000) == (250, 25)
+
+    def test_round_trip(self, tmp_path):
+        """Testa que o índice gravado é lido igual."""
+        path = str(tmp_path / "clientes.txt.idx")
+        _index_every_line(25, interval=10).write(path)
+
+        index = PageIndex.read(path)
+
+        assert (index.interval, index.rows) == (10, 25)
+        assert (index.csv_offset, index.fingerprint) == (250, b"fim")
+        assert index.csv_identity == (1, 2, 3)
+        assert index.seek(24) == (200, 20)
+
+    def test_read_validates_file(self, tmp_path):
+        """Testa que assinaturas e tamanhos inválidos são recusados."""
+        path = tmp_path / "clientes.txt.idx"
+        _index_every_line(25, interval=10).write(str(path))
+        data = path.read_bytes()
+
+        path.write_bytes(b"XXXXXX" + data[6:])
+        with pytest.raises(ValueError, match="assinatura"):
+            PageIndex.read(str(path))
+
+        path.write_bytes(data[:-8])
+        with pytest.raises(ValueError, match="tamanho"):
+            PageIndex.read(str(path))
+
+        path.write_bytes(data[:10])
+        with pytest.raises(ValueError, match="truncado"):
+            PageIndex.read(str(path))
@@ -1,8 +1,12 @@
 """Testes unitários para o caso de uso de cálculo de preço."""
 
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
 import pytest
 
 from domain.entities import OrderItem
+from domain.money import Money, RoundingMode
 from services.discount import QuantityDiscountCalculator
 from services.tax import TaxCalculator
 from use_cases.price_calculation import CalculateFinalPriceUseCase
@@ -103,3 +107,166 @@ class TestCalculateFinalPriceUseCase:
         result = use_case.execute(items)
         # Deve ter exatamente 2 casas decimais
         assert round(result, 2) == result
+
+
+class TestCalculateFinalPriceBatch:
+    """Casos de teste para o cálculo em lote de CalculateFinalPriceUseCase."""
+
+    def _use_case(self):
+        return CalculateFinalPriceUseCase(
+            QuantityDiscountCalculator(), TaxCalculator(tax_rate=0.10)
+        )
+
+    def test_batch_matches_scalar_path(self):
+        """Testa que o lote reproduz exatamente o cálculo por carrinho."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case()
+        rng = random.Random(42)
+        carts = [
+            [round(rng.uniform(0, 500), 2) for _ in range(rng.randint(1, 15))]
+            for _ in range(2000)
+        ]
+        carts.append([0.1, 0.2, 0.3, 1e16, 1.0, -0.0])
+        prices = [price for cart in carts for price in cart]
+        offsets = [0]
+        for cart in carts:
+            offsets.append(offsets[-1] + len(cart))
+
+        result = use_case.execute_batch(prices, offsets)
+
+        expected = [
+            use_case.execute([OrderItem(name="Item", price=p) for p in cart])
+            for cart in carts
+        ]
+        assert result.tolist() == expected
+
+    def test_batch_applies_quantity_brackets(self):
+        """Testa as faixas de desconto por quantidade no lote."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case()
+        prices = [50.0, 30.0, 20.0] + [20.0] * 5 + [10.0] * 10
+
+        result = use_case.execute_batch(prices, [0, 3, 8, 18])
+
+        assert result.tolist() == [110.0, 99.0, 88.0]
+
+    def test_batch_rounds_ties_like_round(self):
+        """Testa o arredondamento de valores próximos a empates."""
+        pytest.importorskip("numpy")
+        use_case = CalculateFinalPriceUseCase(
+            QuantityDiscountCalculator(), TaxCalculator(tax_rate=0.0)
+        )
+        prices = [0.125, 0.375, 1.005, 2.675, 0.045]
+
+        result = use_case.execute_batch(prices, [0, 1, 2, 3, 4, 5])
+
+        assert result.tolist() == [round(p, 2) for p in prices]
+
+    def test_batch_empty_cart_raises_error(self):
+        """Testa que carrinhos vazios geram ValueError."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case()
+
+        with pytest.raises(ValueError, match="A lista de itens não pode estar vazia"):
+            use_case.execute_batch([10.0, 20.0], [0, 2, 2])
+
+    def test_batch_invalid_offsets_raise_error(self):
+        """Testa que offsets inconsistentes geram ValueError."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case()
+
+        with pytest.raises(ValueError, match="O último offset"):
+            use_case.execute_batch([10.0, 20.0], [0, 1])
+
+
+class TestCalculateFinalPriceExact:
+    """Casos de teste para o cálculo exato em centavos."""
+
+    def _use_case(self, tax_rate=0.10):
+        return CalculateFinalPriceUseCase(
+            QuantityDiscountCalculator(), TaxCalculator(tax_rate=tax_rate)
+        )
+
+    def test_exact_applies_discount_and_tax(self):
+        """Testa o preço final exato com as faixas de desconto."""
+        use_case = self._use_case()
+        items = [OrderItem(name="Produto", price=20.0) for _ in range(5)]
+
+        assert use_case.execute_exact(items) == Money(9900)
+
+    def test_exact_matches_decimal_reference(self):
+        """Testa o resultado exato contra o mesmo cálculo em Decimal."""
+        use_case = self._use_case(tax_rate=0.0725)
+        rng = random.Random(7)
+
+        for _ in range(500):
+            prices = [round(rng.uniform(0, 100), 2) for _ in range(rng.randint(1, 12))]
+            subtotal = sum(Decimal(repr(price)) for price in prices)
+            rate = Decimal(
+                "0.2" if len(prices) >= 10 else "0.1" if len(prices) >= 5 else "0"
+            )
+            expected = (subtotal * (1 - rate) * Decimal("1.0725")).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+
+            result = use_case.execute_exact(
+                [OrderItem(name="Item", price=price) for price in prices],
+                RoundingMode.HALF_UP,
+            )
+
+            assert Decimal(result.cents) / 100 == expected
+
+    def test_exact_rounds_ties_by_mode(self):
+        """Testa que o empate é decidido pelo modo, não pelo erro do float."""
+        use_case = self._use_case(tax_rate=0.0)
+        items = [OrderItem(name="Item", price=0.125)]
+
+        # Cada preço é convertido para centavos antes da soma
+        assert use_case.execute_exact(items) == Money(12)
+        assert use_case.execute_exact(items, RoundingMode.HALF_UP) == Money(13)
+
+    def test_exact_empty_items_raises_error(self):
+        """Testa que lista de itens vazia gera ValueError."""
+        with pytest.raises(ValueError, match="A lista de itens não pode estar vazia"):
+            self._use_case().execute_exact([])
+
+    @pytest.mark.parametrize("rounding", list(RoundingMode))
+    def test_exact_batch_matches_scalar_path(self, rounding):
+        """Testa que o lote exato reproduz o cálculo exato por carrinho."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case(tax_rate=0.175)
+        rng = random.Random(3)
+        carts = [
+            [round(rng.uniform(0, 50), 3) for _ in range(rng.randint(1, 12))]
+            for _ in range(500)
+        ]
+        prices = [price for cart in carts for price in cart]
+        offsets = [0]
+        for cart in carts:
+            offsets.append(offsets[-1] + len(cart))
+
+        result = use_case.execute_exact_batch(prices, offsets, rounding)
+
+        expected = [
+            use_case.execute_exact(
+                [OrderItem(name="Item", price=p) for p in cart], rounding
+            ).cents
+            for cart in carts
+        ]
+        assert result.tolist() == expected
+
+    def test_exact_batch_avoids_int64_overflow(self):
+        """Testa que valores enormes passam para inteiros do Python."""
+        pytest.importorskip("numpy")
+        use_case = self._use_case()
+
+        result = use_case.execute_exact_batch([1e15, 3e17], [0, 1, 2])
+
+        assert result.tolist() == [110_000_000_000_000_000, 33 * 10**18]
+
+    def test_exact_batch_negative_price_raises_error(self):
+        """Testa que preços negativos geram ValueError no lote exato."""
+        pytest.importorskip("numpy")
+
+        with pytest.raises(ValueError, match="O preço não pode ser negativo"):
+            self._use_case().execute_exact_batch([10.0, -1.0], [0, 2])
@@ -1,12 +1,32 @@
 """Testes unitários para o repositório de clientes em arquivo."""
 
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
 import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from domain.entities import Client
-from infrastructure.repositories import FileClientRepository
+from domain.repositories import ClientReader
+from domain.tiers import TIERS
+from infrastructure.indexes import ClientIndexes
+from infrastructure.repositories import (
+    DurabilityPolicy,
+    FileClientRepository,
+    LoadStats,
+)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 class TestFileClientRepository:
@@ -111,7 +131,9 @@ class TestFileClientRepository:
         """Testa que FileNotFoundError é lançado quando o arquivo não existe."""
         repo = FileClientRepository("/caminho/inexistente/clientes.txt")
 
-        with pytest.raises(FileNotFoundError, match="Arquivo de clientes não encontrado"):
+        with pytest.raises(
+            FileNotFoundError, match="Arquivo de clientes não encontrado"
+        ):
             repo.load_all()
 
     def test_load_all_skips_empty_lines(self):
@@ -132,3 +154,726 @@ class TestFileClientRepository:
             assert len(clients) == 2
         finally:
             Path(temp_file).unlink(missing_ok=True)
+
+    def test_save_duplicate_email_raises_error(self):
+        """Testa que salvar email já cadastrado gera ValueError."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".txt", encoding="utf-8"
+        ) as f:
+            f.write("João Silva,joao@example.com,gold\n")
+            temp_file = f.name
+
+        try:
+            repo = FileClientRepository(temp_file)
+            client = Client(name="Outro João", email="joao@example.com", tier="silver")
+
+            with pytest.raises(ValueError, match="já está cadastrado"):
+                repo.save(client)
+
+            assert len(repo.load_all()) == 1
+        finally:
+            Path(temp_file).unlink(missing_ok=True)
+
+    def test_email_index_built_once(self):
+        """Testa que o índice de emails é construído uma única vez."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".txt", encoding="utf-8"
+        ) as f:
+            f.write("João Silva,joao@example.com,gold\n")
+            temp_file = f.name
+
+        try:
+            repo = FileClientRepository(temp_file)
+
+            with patch.object(
+                FileClientRepository,
+                "_parse_line",
+                wraps=FileClientRepository._parse_line,
+            ) as parse_line:
+                assert repo.exists("joao@example.com") is True
+                repo.save(
+                    Client(
+                        name="Maria Santos", email="maria@example.com", tier="silver"
+                    )
+                )
+                assert repo.exists("maria@example.com") is True
+                assert repo.exists("pedro@example.com") is False
+
+            # Só a linha original é lida; a gravada pelo próprio repositório não
+            assert parse_line.call_count == 1
+        finally:
+            Path(temp_file).unlink(missing_ok=True)
+
+    def test_exists_file_not_found(self):
+        """Testa que exists retorna False quando o arquivo não existe."""
+        repo = FileClientRepository("/caminho/inexistente/clientes.txt")
+
+        assert repo.exists("joao@example.com") is False
+
+    def test_save_many_skips_duplicates(self):
+        """Testa o salvamento em lote ignorando emails já cadastrados."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".txt", encoding="utf-8"
+        ) as f:
+            f.write("João Silva,joao@example.com,gold\n")
+            temp_file = f.name
+
+        try:
+            repo = FileClientRepository(temp_file)
+            clients = [
+                Client(name="Maria Santos", email="maria@example.com", tier="silver"),
+                Client(name="Outro João", email="joao@example.com", tier="bronze"),
+                Client(name="Maria Dois", email="maria@example.com", tier="gold"),
+            ]
+
+            saved = repo.save_many(clients)
+
+            assert saved == [True, False, False]
+            assert [c.name for c in repo.load_all()] == ["João Silva", "Maria Santos"]
+            assert repo.exists("maria@example.com") is True
+        finally:
+            Path(temp_file).unlink(missing_ok=True)
+
+    def test_iter_clients_is_lazy(self):
+        """Testa que a iteração pode ser interrompida antes do fim do arquivo."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".txt", encoding="utf-8"
+        ) as f:
+            f.write("João Silva,joao@example.com,gold\n")
+            f.write("LinhaInválida\n")
+            f.write("Maria Santos,maria@example.com,silver\n")
+            f.write("Pedro Costa,pedro@example.com,bronze")
+            temp_file = f.name
+
+        try:
+            repo = FileClientRepository(temp_file)
+            clients = repo.iter_clients()
+
+            assert next(clients).name == "João Silva"
+            assert next(clients).name == "Maria Santos"
+            clients.close()
+
+            # A última linha sem quebra de linha também é lida
+            assert [c.name for c in repo.iter_clients()][-1] == "Pedro Costa"
+        finally:
+            Path(temp_file).unlink(missing_ok=True)
+
+    def test_iter_clients_file_not_found(self):
+        """Testa que a iteração lança FileNotFoundError se o arquivo não existe."""
+        repo = FileClientRepository("/caminho/inexistente/clientes.txt")
+
+        with pytest.raises(
+            FileNotFoundError, match="Arquivo de clientes não encontrado"
+        ):
+            next(repo.iter_clients())
+
+
+class TestFileClientRepositoryBuffered:
+    """Casos de teste para o modo de escrita com buffer."""
+
+    def test_buffered_writes_on_flush(self, tmp_path):
+        """Testa que as linhas ficam no buffer até flush."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(str(path), buffered=True, flush_interval=60)
+
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+        assert not path.exists()
+        assert repo.exists("joao@example.com") is True
+
+        repo.flush()
+        assert path.read_text(encoding="utf-8") == "João Silva,joao@example.com,gold\n"
+        repo.close()
+
+    def test_buffered_flushes_on_size_threshold(self, tmp_path):
+        """Testa a descarga automática ao atingir flush_size bytes."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(
+            str(path), buffered=True, flush_size=60, flush_interval=60
+        )
+
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+        assert not path.exists()
+        repo.save(Client(name="Maria Santos", email="maria@example.com", tier="silver"))
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+        repo.close()
+
+    def test_buffered_flushes_on_time_threshold(self, tmp_path):
+        """Testa a descarga automática após flush_interval segundos."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(str(path), buffered=True, flush_interval=0)
+
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+        assert path.read_text(encoding="utf-8") == "João Silva,joao@example.com,gold\n"
+        repo.close()
+
+    def test_pending_lines_are_written_at_exit(self, tmp_path):
+        """Testa que o buffer de uma instância não fechada é gravado na saída."""
+        path = tmp_path / "clientes.txt"
+        src_path = str(Path(__file__).resolve().parent.parent / "src")
+        code = (
+            "import sys\n"
+            f"sys.path.insert(0, {src_path!r})\n"
+            "from domain.entities import Client\n"
+            "from infrastructure.repositories import FileClientRepository\n"
+            f"repo = FileClientRepository({str(path)!r}, buffered=True)\n"
+            "repo.save(Client(name='João', email='joao@example.com', tier='gold'))\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        assert path.read_text(encoding="utf-8") == "João,joao@example.com,gold\n"
+
+    def test_close_removes_exit_hook(self, tmp_path):
+        """Testa que close cancela o fechamento agendado para a saída."""
+        path = tmp_path / "clientes.txt"
+
+        with patch("infrastructure.repositories.atexit") as hook:
+            with FileClientRepository(str(path), buffered=True) as repo:
+                repo.save(Client(name="João", email="joao@example.com", tier="gold"))
+                repo.save(Client(name="Ana", email="ana@example.com", tier="gold"))
+                hook.register.assert_called_once_with(repo.close)
+                hook.unregister.assert_not_called()
+
+        hook.unregister.assert_called_once_with(repo.close)
+
+    def test_load_all_sees_pending_lines(self, tmp_path):
+        """Testa que a leitura inclui as linhas ainda no buffer."""
+        path = tmp_path / "clientes.txt"
+        with FileClientRepository(str(path), buffered=True) as repo:
+            repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+            assert [c.name for c in repo.load_all()] == ["João Silva"]
+
+    def test_context_manager_flushes_and_syncs(self, tmp_path):
+        """Testa que sair do bloco with grava e sincroniza o buffer."""
+        path = tmp_path / "clientes.txt"
+
+        with patch("infrastructure.repositories.os.fsync") as fsync:
+            with FileClientRepository(str(path), buffered=True) as repo:
+                repo.save(Client(name="João", email="joao@example.com", tier="gold"))
+                fsync.assert_not_called()
+
+        fsync.assert_called_once()
+        assert path.read_text(encoding="utf-8") == "João,joao@example.com,gold\n"
+
+    @pytest.mark.parametrize(
+        "buffered, durability, expected_syncs",
+        [
+            (False, DurabilityPolicy.NONE, 0),
+            (False, DurabilityPolicy.WRITE, 3),
+            (True, DurabilityPolicy.NONE, 0),
+            (True, DurabilityPolicy.BATCH, 0),
+            (True, DurabilityPolicy.WRITE, 3),
+        ],
+    )
+    def test_durability_policy_controls_fsync(
+        self, tmp_path, buffered, durability, expected_syncs
+    ):
+        """Testa a quantidade de fsync de cada política antes do checkpoint."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(
+            str(path), buffered=buffered, durability=durability, flush_interval=60
+        )
+
+        with patch("infrastructure.repositories.os.fsync") as fsync:
+            for i in range(3):
+                repo.save(
+                    Client(name="Cliente", email=f"c{i}@example.com", tier="gold")
+                )
+            assert fsync.call_count == expected_syncs
+
+            repo.flush()
+            assert fsync.call_count == max(expected_syncs, 1)
+
+        repo.close()
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_batch_policy_syncs_each_flush(self, tmp_path):
+        """Testa que a política BATCH faz fsync a cada descarga automática."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(
+            str(path),
+            buffered=True,
+            durability=DurabilityPolicy.BATCH,
+            flush_size=1,
+            flush_interval=60,
+        )
+
+        with patch("infrastructure.repositories.os.fsync") as fsync:
+            repo.save(Client(name="João", email="joao@example.com", tier="gold"))
+            repo.save(Client(name="Maria", email="maria@example.com", tier="gold"))
+
+        assert fsync.call_count == 2
+        repo.close()
+
+    def test_invalid_flush_size_raises_error(self, tmp_path):
+        """Testa que o tamanho de descarga deve ser positivo."""
+        with pytest.raises(ValueError, match="O tamanho de descarga deve ser positivo"):
+            FileClientRepository(str(tmp_path / "clientes.txt"), flush_size=0)
+
+
+class TestFileClientRepositoryCache:
+    """Casos de teste para o cache incremental de load_all."""
+
+    def test_load_all_hits_cache_when_file_is_unchanged(self, tmp_path):
+        """Testa que um arquivo inalterado não é relido."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("João,joao@example.com,gold\n", encoding="utf-8")
+        repo = FileClientRepository(str(path))
+
+        first = repo.load_all()
+        with patch.object(
+            FileClientRepository,
+            "_parse_line",
+            wraps=FileClientRepository._parse_line,
+        ) as parse_line:
+            second = repo.load_all()
+
+        assert second == first
+        assert second is not first
+        parse_line.assert_not_called()
+        assert repo.load_stats() == LoadStats(hits=1, tail_parses=0, full_reloads=1)
+
+    def test_load_all_parses_only_appended_tail(self, tmp_path):
+        """Testa que só as linhas acrescentadas por outro escritor são lidas."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("João,joao@example.com,gold\n", encoding="utf-8")
+        repo = FileClientRepository(str(path))
+        repo.load_all()
+
+        with path.open("a", encoding="utf-8") as file:
+            file.write("Maria,maria@example.com,silver\n")
+
+        with patch.object(
+            FileClientRepository,
+            "_parse_line",
+            wraps=FileClientRepository._parse_line,
+        ) as parse_line:
+            clients = repo.load_all()
+
+        assert [c.name for c in clients] == ["João", "Maria"]
+        assert parse_line.call_count == 1
+        assert repo.load_stats() == LoadStats(hits=0, tail_parses=1, full_reloads=1)
+
+    def test_load_all_reloads_rewritten_file(self, tmp_path):
+        """Testa a releitura completa de arquivos truncados ou reescritos."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("João,joao@example.com,gold\n", encoding="utf-8")
+        repo = FileClientRepository(str(path))
+        repo.load_all()
+
+        # Mesmo tamanho e conteúdo maior: ambos devem ser relidos do início
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("Anaí,ana1@example.com,gold\n", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+        assert [c.name for c in repo.load_all()] == ["Anaí"]
+        path.write_text(
+            "Bia,bia@example.com,gold\nCarla,carla@example.com,silver\n",
+            encoding="utf-8",
+        )
+        assert [c.name for c in repo.load_all()] == ["Bia", "Carla"]
+
+        assert repo.exists("joao@example.com") is False
+        assert repo.load_stats().full_reloads == 3
+
+    def test_own_writes_keep_cache_valid(self, tmp_path):
+        """Testa que gravações do próprio repositório não invalidam o cache."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(str(path))
+        repo.save(Client(name="João", email="joao@example.com", tier="gold"))
+        repo.save_many([Client(name="Maria", email="maria@example.com", tier="gold")])
+
+        assert [c.name for c in repo.load_all()] == ["João", "Maria"]
+        assert repo.load_stats() == LoadStats(hits=1, tail_parses=0, full_reloads=0)
+
+
+class TestFileClientRepositoryConcurrency:
+    """Casos de teste para gravações concorrentes no mesmo arquivo."""
+
+    def test_sees_lines_appended_by_other_instance(self, tmp_path):
+        """Testa que o índice lê apenas o que outra instância acrescentou."""
+        path = str(tmp_path / "clientes.txt")
+        first = FileClientRepository(path)
+        second = FileClientRepository(path)
+
+        first.save(Client(name="João", email="joao@example.com", tier="gold"))
+        assert second.exists("joao@example.com") is True
+
+        second.save(Client(name="Maria", email="maria@example.com", tier="silver"))
+        with pytest.raises(ValueError, match="já está cadastrado"):
+            first.save(Client(name="Outra", email="maria@example.com", tier="gold"))
+
+        assert [c.name for c in first.load_all()] == ["João", "Maria"]
+
+    def test_rebuilds_index_when_file_is_rewritten(self, tmp_path):
+        """Testa que o índice é reconstruído se o arquivo encolher."""
+        path = tmp_path / "clientes.txt"
+        repo = FileClientRepository(str(path))
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+        path.write_text("Ana,ana@example.com,gold\n", encoding="utf-8")
+
+        assert repo.exists("ana@example.com") is True
+        assert repo.exists("joao@example.com") is False
+
+    def test_completes_last_line_without_newline(self, tmp_path):
+        """Testa que a gravação não emenda na última linha sem quebra."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("João,joao@example.com,gold", encoding="utf-8")
+        repo = FileClientRepository(str(path))
+
+        assert repo.exists("joao@example.com") is True
+        repo.save(Client(name="Maria", email="maria@example.com", tier="silver"))
+
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "João,joao@example.com,gold",
+            "Maria,maria@example.com,silver",
+        ]
+
+    def test_buffered_flush_drops_conflicting_rows(self, tmp_path):
+        """Testa que a descarga descarta emails gravados por outro processo."""
+        path = tmp_path / "clientes.txt"
+        buffered = FileClientRepository(str(path), buffered=True, flush_interval=60)
+        other = FileClientRepository(str(path))
+
+        buffered.save(Client(name="João", email="joao@example.com", tier="gold"))
+        buffered.save(Client(name="Maria", email="maria@example.com", tier="gold"))
+        other.save(Client(name="Outro João", email="joao@example.com", tier="bronze"))
+
+        rejected = buffered.flush()
+        buffered.close()
+
+        assert [c.name for c in rejected] == ["João"]
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "Outro João,joao@example.com,bronze",
+            "Maria,maria@example.com,gold",
+        ]
+
+    @pytest.mark.skipif(fcntl is None, reason="requer fcntl")
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_processes_never_duplicate_emails(self, tmp_path, buffered):
+        """Testa a unicidade dos emails com vários processos gravando juntos."""
+        path = str(tmp_path / "clientes.txt")
+        emails = [f"cliente{i}@example.com" for i in range(200)]
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as executor:
+            futures = [
+                executor.submit(_register_concurrently, path, emails, seed, buffered)
+                for seed in range(4)
+            ]
+            registered = sum(future.result() for future in futures)
+
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        assert registered == len(emails)
+        assert sorted(line.split(",")[1] for line in lines) == sorted(emails)
+
+
+def _register_concurrently(path, emails, seed, buffered):
+    """Grava os emails em ordem aleatória e retorna quantos este processo gravou."""
+    emails = list(emails)
+    random.Random(seed).shuffle(emails)
+    registered = 0
+
+    with FileClientRepository(path, buffered=buffered, flush_size=256) as repo:
+        for start in range(0, len(emails), 10):
+            clients = [
+                Client(name="Cliente", email=email, tier="gold")
+                for email in emails[start : start + 10]
+            ]
+            if buffered:
+                registered += sum(repo.save_many(clients))
+            else:
+                for client in clients:
+                    try:
+                        repo.save(client)
+                        registered += 1
+                    except ValueError:
+                        pass
+        registered -= len(repo.flush())
+
+    return registered
+
+
+_SEGMENT_CLIENTS = (
+    "João Silva,joao@petrobahia.com,gold\n"
+    "Maria Santos,Maria@Email.com,silver\n"
+    "Pedro Costa,pedro@PetroBahia.com,gold\n"
+)
+
+
+class TestFileClientRepositoryIndexes:
+    """Casos de teste para as consultas por índices secundários."""
+
+    def test_queries(self, tmp_path):
+        """Testa as consultas por nível, domínio, email e a contagem."""
+        path = tmp_path / "clientes.txt"
+        path.write_text(_SEGMENT_CLIENTS, encoding="utf-8")
+        repo = FileClientRepository(str(path))
+
+        assert [c.name for c in repo.find_by_tier("gold")] == [
+            "João Silva",
+            "Pedro Costa",
+        ]
+        assert len(repo.find_by_domain("PETROBAHIA.com")) == 2
+        assert repo.find_by_email(" maria@email.COM ").name == "Maria Santos"
+        assert repo.find_by_email("ninguem@email.com") is None
+        assert repo.count_by_tier() == {"gold": 2, "silver": 1}
+
+    def test_unknown_tier_is_not_interned(self, tmp_path):
+        """Testa que consultar um nível desconhecido não o registra."""
+        path = tmp_path / "clientes.txt"
+        path.write_text(_SEGMENT_CLIENTS, encoding="utf-8")
+
+        assert FileClientRepository(str(path)).find_by_tier("nível-fantasma") == []
+        assert TIERS.code("nível-fantasma") is None
+
+    def test_save_updates_indexes_incrementally(self, tmp_path):
+        """Testa que save atualiza os índices sem remontá-los."""
+        path = tmp_path / "clientes.txt"
+        path.write_text(_SEGMENT_CLIENTS, encoding="utf-8")
+        repo = FileClientRepository(str(path))
+        repo.find_by_tier("gold")
+
+        with patch.object(ClientIndexes, "__init__", side_effect=AssertionError):
+            repo.save(Client(name="Ana Lima", email="ana@petrobahia.com", tier="gold"))
+            repo.save_many(
+                [Client(name="Caio Reis", email="caio@email.com", tier="bronze")]
+            )
+
+            assert len(repo.find_by_tier("gold")) == 3
+            assert len(repo.find_by_domain("email.com")) == 2
+            assert repo.count_by_tier() == {"gold": 3, "silver": 1, "bronze": 1}
+
+    def test_indexes_follow_other_writers(self, tmp_path):
+        """Testa linhas de outros processos, incompletas e arquivos reescritos."""
+        path = tmp_path / "clientes.txt"
+        path.write_text(_SEGMENT_CLIENTS, encoding="utf-8")
+        repo = FileClientRepository(str(path))
+        assert len(repo.find_by_tier("silver")) == 1
+
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("Ana Lima,ana@email.com,silver\nCaio Reis,caio@email.com,silver")
+        assert [c.name for c in repo.find_by_tier("silver")] == [
+            "Maria Santos",
+            "Ana Lima",
+            "Caio Reis",
+        ]
+        assert repo.find_by_email("CAIO@email.com").name == "Caio Reis"
+
+        path.write_text("Ana Lima,ana@email.com,bronze\n", encoding="utf-8")
+        assert repo.find_by_tier("silver") == []
+        assert repo.count_by_tier() == {"bronze": 1}
+
+
+def _write_numbered_clients(path, count):
+    """Grava count clientes numerados, com uma linha inválida a cada dez."""
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(count):
+            if i % 10 == 0:
+                file.write("linha inválida\n")
+            file.write(f"Cliente {i},cliente{i}@example.com,gold\n")
+
+
+class TestFileClientRepositoryPagination:
+    """Casos de teste para load_page e count com o índice de páginas."""
+
+    def test_pages_follow_load_all_order(self, tmp_path):
+        """Testa que as páginas, em sequência ou avulsas, seguem load_all."""
+        path = tmp_path / "clientes.txt"
+        _write_numbered_clients(path, 250)
+        repo = FileClientRepository(str(path))
+        clients = repo.load_all()
+
+        pages = []
+        cursor = 0
+        while cursor is not None:
+            page = repo.load_page(cursor, limit=30)
+            pages.extend(page.clients)
+            cursor = page.next_cursor
+
+        assert pages == clients
+        assert repo.load_page(195, limit=10).clients == clients[195:205]
+        assert repo.load_page(240, limit=10).next_cursor is None
+        assert repo.load_page(250).clients == []
+        assert repo.count() == 250
+
+    def test_index_is_persisted_and_reused(self, tmp_path):
+        """Testa que outra instância lê o índice gravado e só as linhas da página."""
+        path = tmp_path / "clientes.txt"
+        _write_numbered_clients(path, 1000)
+        with FileClientRepository(str(path)) as indexer:
+            indexer.count()
+        assert (tmp_path / "clientes.txt.idx").exists()
+
+        repo = FileClientRepository(str(path))
+        parse = FileClientRepository._parse_line
+        with patch.object(
+            FileClientRepository, "_parse_line", side_effect=parse
+        ) as spy:
+            page = repo.load_page(905, limit=10)
+
+        assert [c.name for c in page.clients] == [
+            f"Cliente {i}" for i in range(905, 915)
+        ]
+        # Do marco da posição 900 ao cursor, a página, uma linha inválida e
+        # um cliente a mais para saber se há próxima página
+        assert spy.call_count == 5 + 10 + 1 + 1
+
+    def test_index_follows_appends_and_rewrites(self, tmp_path):
+        """Testa linhas acrescentadas, a última incompleta e arquivos reescritos."""
+        path = tmp_path / "clientes.txt"
+        _write_numbered_clients(path, 150)
+        repo = FileClientRepository(str(path))
+        assert repo.count() == 150
+
+        repo.save(Client(name="Ana Lima", email="ana@example.com", tier="gold"))
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("Caio Reis,caio@example.com,silver")
+        assert repo.count() == 152
+        assert [c.name for c in repo.load_page(150).clients] == [
+            "Ana Lima",
+            "Caio Reis",
+        ]
+        assert FileClientRepository(str(path)).load_page(151).clients[0].name == (
+            "Caio Reis"
+        )
+
+        path.write_text("Ana Lima,ana@example.com,gold\n", encoding="utf-8")
+        assert repo.count() == 1
+        assert repo.load_page(0).clients[0].name == "Ana Lima"
+
+    def test_index_of_replaced_file_is_rebuilt(self, tmp_path):
+        """Testa que o índice não vale para outro arquivo de mesmo tamanho."""
+        path = tmp_path / "clientes.txt"
+        _write_numbered_clients(path, 250)
+        with FileClientRepository(str(path)) as indexer:
+            indexer.count()
+
+        # A linha inválida do início vira um cliente com o mesmo tamanho
+        data = path.read_bytes()
+        invalid = "linha inválida\n".encode("utf-8")
+        valid = b"Zoe,z@x.io,gold\n"
+        assert data.startswith(invalid) and len(valid) == len(invalid)
+        (tmp_path / "novo.txt").write_bytes(valid + data[len(invalid) :])
+        os.replace(tmp_path / "novo.txt", path)
+
+        repo = FileClientRepository(str(path))
+        clients = repo.load_all()
+        assert repo.count() == 251
+        assert repo.load_page(205, limit=10).clients == clients[205:215]
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        """Testa que um índice inválido é ignorado e regravado."""
+        path = tmp_path / "clientes.txt"
+        _write_numbered_clients(path, 120)
+        (tmp_path / "clientes.txt.idx").write_bytes(b"nada disso")
+
+        repo = FileClientRepository(str(path))
+
+        assert repo.load_page(110, limit=5).clients[0].name == "Cliente 110"
+        assert FileClientRepository(str(path)).count() == 120
+
+    def test_reads_do_not_write_the_index(self, tmp_path):
+        """Testa que consultas só estendem o índice em memória."""
+        path = tmp_path / "clientes.txt"
+        index_path = tmp_path / "clientes.txt.idx"
+        _write_numbered_clients(path, 150)
+        repo = FileClientRepository(str(path))
+
+        assert repo.count() == 150
+        assert repo.load_page(120, limit=5).clients[0].name == "Cliente 120"
+        assert not index_path.exists()
+
+        repo.save_page_index()
+        written = index_path.read_bytes()
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("Ana Lima,ana@example.com,gold\n")
+        assert repo.count() == 151
+        assert index_path.read_bytes() == written
+
+        repo.close()
+        assert index_path.read_bytes() != written
+        assert FileClientRepository(str(path)).count() == 151
+
+    def test_head_crc_is_reused_while_file_is_unchanged(self, tmp_path):
+        """Testa que o CRC do início só é recalculado quando o arquivo muda."""
+        path = tmp_path / "clientes.txt"
+        # Maior que o início coberto pelo CRC, que então não muda de tamanho
+        _write_numbered_clients(path, 3000)
+        assert path.stat().st_size > FileClientRepository._HEAD_SIZE
+        repo = FileClientRepository(str(path))
+        repo.count()
+
+        with patch("zlib.crc32", side_effect=zlib.crc32) as crc32:
+            repo.count()
+            repo.load_page(100)
+            assert crc32.call_count == 0
+
+            repo.save(Client(name="Ana Lima", email="ana@example.com", tier="gold"))
+            assert repo.count() == 3001
+            assert crc32.call_count == 1
+
+    def test_invalid_page(self, tmp_path):
+        """Testa que cursor negativo e limite não positivo são recusados."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("", encoding="utf-8")
+        repo = FileClientRepository(str(path))
+
+        with pytest.raises(ValueError, match="cursor"):
+            repo.load_page(-1)
+        with pytest.raises(ValueError, match="limite"):
+            repo.load_page(0, limit=0)
+        assert repo.load_page(0).clients == []
+        assert repo.count() == 0
+
+
+class _ListReader(ClientReader):
+    """Leitor mínimo, sem índices, para testar as consultas padrão."""
+
+    def __init__(self, clients):
+        self._clients = clients
+
+    def load_all(self):
+        return list(self._clients)
+
+    def iter_clients(self):
+        return iter(self._clients)
+
+    def exists(self, email):
+        return any(client.email == email for client in self._clients)
+
+
+class TestClientReaderDefaults:
+    """Casos de teste para as consultas padrão de ClientReader."""
+
+    def test_default_queries_scan_clients(self):
+        """Testa que leitores sem índices respondem com uma varredura."""
+        reader = _ListReader(
+            [
+                Client(name="João Silva", email="joao@PetroBahia.com", tier="gold"),
+                Client(name="Maria Santos", email="maria@email.com", tier="silver"),
+            ]
+        )
+
+        assert [c.name for c in reader.find_by_tier("gold")] == ["João Silva"]
+        assert [c.name for c in reader.find_by_domain("petrobahia.com")] == [
+            "João Silva"
+        ]
+        assert reader.find_by_email("MARIA@email.com").name == "Maria Santos"
+        assert reader.count_by_tier() == {"gold": 1, "silver": 1}
+
+    def test_default_pagination_scans_clients(self):
+        """Testa a paginação e a contagem padrão sobre a iteração."""
+        clients = [
+            Client(name=f"Cliente {i}", email=f"c{i}@email.com", tier="gold")
+            for i in range(5)
+        ]
+        reader = _ListReader(clients)
+
+        first = reader.load_page(limit=2)
+        assert (first.clients, first.next_cursor) == (clients[:2], 2)
+        last = reader.load_page(4, limit=2)
+        assert (last.clients, last.next_cursor) == (clients[4:], None)
+        assert reader.count() == 5
@@ -0,0 +1,229 @@
+"""Testes unitários para o remetente SMTP, contra o servidor SMTP local."""
+
+import smtplib
+import time
+
+import pytest
+
+from domain.entities import EmailMessage
+from infrastructure.local_smtp import LocalSmtpServer
+from infrastructure.smtp import SmtpEmailSender, TokenBucket
+from services.email import QueuedEmailSender
+
+FROM_ADDRESS = "naoresponda@petrobahia.com"
+
+
+def _messages(count, body="Obrigado por se registrar!"):
+    """Mensagens numeradas para cliente0@example.com, cliente1@...."""
+    return [
+        EmailMessage(to=f"cliente{i}@example.com", subject=f"Olá {i}", body=body)
+        for i in range(count)
+    ]
+
+
+def _recipients(server):
+    """Destinatário de cada mensagem recebida, na ordem de chegada."""
+    return [message.recipients[0] for message in server.messages]
+
+
+@pytest.fixture
+def server():
+    """Servidor SMTP local com pipelining."""
+    with LocalSmtpServer() as local_server:
+        yield local_server
+
+
+class TestTokenBucket:
+    """Casos de teste para TokenBucket."""
+
+    def test_burst_passes_then_rate_is_enforced(self):
+        """Testa que a rajada inicial não espera e as seguintes respeitam a taxa."""
+        bucket = TokenBucket(rate=50, capacity=3)
+
+        start = time.monotonic()
+        waits = [bucket.acquire() for _ in range(8)]
+        elapsed = time.monotonic() - start
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert all(wait > 0 for wait in waits[3:])
+        # Cinco fichas além da rajada, a 50 por segundo
+        assert elapsed >= 0.09
+
+    def test_invalid_arguments(self):
+        """Testa que taxa e capacidade inválidas são recusadas."""
+        with pytest.raises(ValueError, match="taxa"):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError, match="ficha"):
+            TokenBucket(rate=10, capacity=0.5)
+
+
+class TestSmtpEmailSender:
+    """Casos de teste para SmtpEmailSender."""
+
+    def test_send(self, server):
+        """Testa o envio de um email com assunto e corpo acentuados."""
+        with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+            sender.send("joao@example.com", "Bem-vindo à PetroBahia!", "Olá João")
+
+        (received,) = server.messages
+        message = received.parsed()
+        assert received.sender == FROM_ADDRESS
+        assert received.recipients == ("joao@example.com",)
+        assert message["Subject"] == "Bem-vindo à PetroBahia!"
+        assert message.get_content().strip() == "Olá João"
+
+    def test_send_many_reuses_one_pipelined_session(self, server):
+        """Testa que o lote usa uma conexão e uma ida e volta por mensagem."""
+        with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+            sender.send_many(_messages(10))
+            sender.send_many(_messages(5))
+
+        assert len(server.messages) == 15
+        assert _recipients(server)[:10] == [
+            f"cliente{i}@example.com" for i in range(10)
+        ]
+        assert server.connections == 1
+        # Sem pipelining seriam quatro idas e voltas por mensagem (MAIL, RCPT,
+        # DATA e conteúdo); com ele, uma por mensagem e mais poucas por sessão
+        assert server.round_trips < 2 * 15
+
+    def test_server_without_pipelining(self):
+        """Testa o envio um a um quando o servidor não anuncia PIPELINING."""
+        with LocalSmtpServer(pipelining=False) as server:
+            with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+                sender.send_many(_messages(3))
+
+            assert len(server.messages) == 3
+            assert server.connections == 1
+            assert server.round_trips > 2 + 3 * 3
+
+    def test_leading_dots_are_preserved(self, server):
+        """Testa que linhas iniciadas por ponto chegam intactas."""
+        body = "Linha 1\n.\n..oculta\nfim"
+        with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+            sender.send_many(_messages(2, body=body))
+
+        for received in server.messages:
+            assert received.parsed().get_content().splitlines() == body.splitlines()
+
+    def test_refused_recipients_do_not_stop_the_batch(self):
+        """Testa que um destinatário recusado é informado sem perder os demais."""
+        with LocalSmtpServer(reject={"cliente1@example.com"}) as server:
+            with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+                with pytest.raises(smtplib.SMTPRecipientsRefused) as error:
+                    sender.send_many(_messages(4))
+
+            assert list(error.value.recipients) == ["cliente1@example.com"]
+            assert error.value.recipients["cliente1@example.com"][0] == 550
+            assert _recipients(server) == [
+                "cliente0@example.com",
+                "cliente2@example.com",
+                "cliente3@example.com",
+            ]
+            assert server.connections == 1
+
+    def test_reconnects_and_resends_after_a_drop(self):
+        """Testa que quedas abrem outra conexão sem perder nem repetir emails."""
+        with LocalSmtpServer(drop_after=3) as server:
+            with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+                sender.send_many(_messages(10))
+
+            assert _recipients(server) == [f"cliente{i}@example.com" for i in range(10)]
+            assert server.connections == 4
+
+    def test_gives_up_without_progress(self, server):
+        """Testa que o erro sobe quando reconectar não resolve."""
+        host, port = server.host, server.port
+        server.close()
+
+        sender = SmtpEmailSender(host, port, FROM_ADDRESS, max_reconnects=1)
+        with pytest.raises(ConnectionRefusedError):
+            sender.send("joao@example.com", "Assunto", "Corpo")
+
+    def test_sessions_are_recycled(self, server):
+        """Testa que cada conexão envia no máximo o limite por sessão."""
+        with SmtpEmailSender(
+            server.host, server.port, FROM_ADDRESS, max_messages_per_session=4
+        ) as sender:
+            sender.send_many(_messages(10))
+
+        assert len(server.messages) == 10
+        assert server.connections == 3
+
+    def test_pool_serves_concurrent_workers(self, server):
+        """Testa vários workers de uma fila sobre um pool limitado."""
+        sender = SmtpEmailSender(server.host, server.port, FROM_ADDRESS, pool_size=2)
+        with QueuedEmailSender(sender, workers=4, batch_size=5) as queue:
+            queue.send_many(_messages(40))
+        sender.close()
+
+        assert queue.stats().failed == 0
+        assert sorted(_recipients(server)) == sorted(
+            f"cliente{i}@example.com" for i in range(40)
+        )
+        assert server.connections <= 2
+
+    def test_rate_limiter_is_applied_per_message(self, server):
+        """Testa que cada mensagem consome uma ficha do limitador."""
+        limiter = TokenBucket(rate=100, capacity=1)
+        with SmtpEmailSender(
+            server.host, server.port, FROM_ADDRESS, rate_limiter=limiter
+        ) as sender:
+            start = time.monotonic()
+            sender.send_many(_messages(6))
+            elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.045
+
+    def test_rejects_header_injection(self, server):
+        """Testa que endereços com quebras de linha são recusados."""
+        with pytest.raises(ValueError, match="Endereço de email inválido"):
+            SmtpEmailSender(server.host, server.port, "a@b.com\r\nRCPT TO:<x@y>")
+
+        with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+            with pytest.raises(smtplib.SMTPRecipientsRefused) as error:
+                sender.send("x@y.com>\r\nDATA", "Assunto", "Corpo")
+        assert error.value.recipients["x@y.com>\r\nDATA"][0] == 501
+        assert server.messages == []
+
+    @pytest.mark.parametrize("pipelining", [True, False])
+    @pytest.mark.parametrize(
+        ("address", "code"), [("a<b@x.com", 501), ("joão@example.com", 553)]
+    )
+    def test_invalid_address_is_refused_without_stopping_the_batch(
+        self, pipelining, address, code
+    ):
+        """Testa que um endereço inválido no meio do lote só recusa a si mesmo."""
+        messages = _messages(5)
+        messages[2] = EmailMessage(to=address, subject="Olá", body="Corpo")
+        with LocalSmtpServer(pipelining=pipelining) as server:
+            with SmtpEmailSender(server.host, server.port, FROM_ADDRESS) as sender:
+                results = sender.send_each(messages)
+
+            assert [result is None for result in results] == [
+                True,
+                True,
+                False,
+                True,
+                True,
+            ]
+            assert results[2].smtp_code == code
+            assert _recipients(server) == [
+                f"cliente{i}@example.com" for i in (0, 1, 3, 4)
+            ]
+            assert server.connections == 1
+
+    def test_send_each_keeps_progress_when_reconnects_run_out(self):
+        """Testa que só as mensagens sem resposta final recebem o erro da queda."""
+        with LocalSmtpServer(drop_after=3) as server:
+            with SmtpEmailSender(
+                server.host, server.port, FROM_ADDRESS, max_reconnects=0
+            ) as sender:
+                results = sender.send_each(_messages(5))
+
+            assert results[:3] == [None, None, None]
+            assert all(
+                isinstance(result, smtplib.SMTPServerDisconnected)
+                for result in results[3:]
+            )
+            assert len(server.messages) == 3
@@ -0,0 +1,257 @@
+"""Testes unitários para o snapshot binário do arquivo de clientes."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from domain.entities import Client
+from domain.repositories import ClientReader
+from infrastructure import snapshot
+from infrastructure.repositories import FileClientRepository
+from infrastructure.snapshot import SnapshotTable
+
+CSV = (
+    "João Silva,joao@example.com,gold\n"
+    "linha inválida\n"
+    "Maria Santos,maria@example.com,silver\n"
+    "Pedro Costa,pedro@example.com,bronze\n"
+)
+
+# Campos do cabeçalho, na ordem de snapshot._HEADER
+_HEADER_FIELDS = (
+    "magic",
+    "version",
+    "tier_count",
+    "rows",
+    "csv_offset",
+    "fingerprint_size",
+    "fingerprint",
+    "csv_device",
+    "csv_inode",
+    "csv_head_crc",
+    "file_size",
+    "tiers_start",
+)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repositório sobre um arquivo com três clientes válidos."""
+    path = tmp_path / "clientes.txt"
+    path.write_text(CSV, encoding="utf-8")
+    return FileClientRepository(str(path))
+
+
+class TestSnapshot:
+    """Casos de teste para snapshot() e load_table()."""
+
+    def test_round_trip(self, repository):
+        """Testa que a tabela do snapshot tem os mesmos clientes do arquivo."""
+        path = repository.snapshot()
+
+        with repository.load_table() as table:
+            assert path.endswith("clientes.txt.snap")
+            assert isinstance(table, ClientReader)
+            assert table.snapshot_rows == 3
+            assert table.load_all() == repository.load_all()
+
+    def test_random_access_by_row(self, repository):
+        """Testa o acesso direto a qualquer linha, inclusive negativa."""
+        repository.snapshot()
+
+        with repository.load_table() as table:
+            assert table[1].name == "Maria Santos"
+            assert table[-1].email == "pedro@example.com"
+            assert table[0].tier == "gold"
+            assert table[2].to_client() == Client(
+                name="Pedro Costa", email="pedro@example.com", tier="bronze"
+            )
+            with pytest.raises(IndexError):
+                table[3]
+
+    def test_exists_matches_whole_emails(self, repository):
+        """Testa que exists não aceita trechos de emails do snapshot."""
+        repository.snapshot()
+
+        with repository.load_table() as table:
+            assert table.exists("maria@example.com")
+            assert not table.exists("example.com")
+            assert not table.exists("joao@example.co")
+            assert not table.exists("")
+
+    def test_appends_are_replayed_on_top(self, repository, tmp_path):
+        """Testa que linhas gravadas depois do snapshot vêm do CSV."""
+        repository.snapshot()
+        repository.save(Client(name="Ana Lima", email="ana@example.com", tier="gold"))
+        with open(tmp_path / "clientes.txt", "a", encoding="utf-8") as file:
+            file.write("Caio Reis,caio@example.com,silver")  # sem quebra de linha
+
+        with repository.load_table() as table:
+            assert table.snapshot_rows == 3
+            assert len(table) == 5
+            assert table[3].email == "ana@example.com"
+            assert table.exists("caio@example.com")
+            assert table.load_all() == repository.load_all()
+
+    def test_pending_lines_are_written_before_snapshot(self, tmp_path):
+        """Testa que linhas no buffer entram no arquivo antes do snapshot."""
+        with FileClientRepository(str(tmp_path / "c.txt"), buffered=True) as repo:
+            repo.save(Client(name="Ana Lima", email="ana@example.com", tier="gold"))
+            repo.snapshot()
+
+            with repo.load_table() as table:
+                assert table.snapshot_rows == 1
+
+    def test_rewritten_file_ignores_snapshot(self, repository, tmp_path):
+        """Testa que um arquivo reescrito é lido por inteiro."""
+        repository.snapshot()
+        (tmp_path / "clientes.txt").write_text(
+            "Ana Lima,ana@example.com,gold\n", encoding="utf-8"
+        )
+
+        with repository.load_table() as table:
+            assert table.snapshot_rows == 0
+            assert [row.email for row in table] == ["ana@example.com"]
+
+    def test_replaced_file_of_same_length_ignores_snapshot(self, repository, tmp_path):
+        """Testa que outro arquivo, ou um editado no início, não usa o snapshot."""
+        repository.snapshot()
+        path = tmp_path / "clientes.txt"
+        edited = CSV.replace("João Silva,joao@", "José Silva,jose@").encode("utf-8")
+        assert len(edited) == len(CSV.encode("utf-8"))
+        assert edited[-64:] == CSV.encode("utf-8")[-64:]
+
+        # Outro arquivo (novo inode) posto no lugar, como faz um editor
+        (tmp_path / "novo.txt").write_bytes(edited)
+        os.replace(tmp_path / "novo.txt", path)
+        with repository.load_table() as table:
+            assert table.snapshot_rows == 0
+            assert table.client_at(0).name == "José Silva"
+            assert table.exists("jose@example.com")
+            assert not table.exists("joao@example.com")
+
+        # O mesmo arquivo (mesmo inode) editado no lugar
+        repository.snapshot()
+        with open(path, "r+b") as file:
+            file.write("Luiza".encode("utf-8"))
+        with repository.load_table() as table:
+            assert table.snapshot_rows == 0
+            assert table.client_at(0).name == "Luiza Silva"
+
+    def test_missing_or_corrupt_snapshot_reads_file(self, repository, tmp_path):
+        """Testa que sem snapshot válido o arquivo inteiro é lido."""
+        with repository.load_table() as table:
+            assert (table.snapshot_rows, len(table)) == (0, 3)
+
+        snapshot_path = tmp_path / "clientes.txt.snap"
+        snapshot_path.write_bytes(b"nada disso")
+        with repository.load_table() as table:
+            assert (table.snapshot_rows, len(table)) == (0, 3)
+
+    def test_open_validates_header(self, repository, tmp_path):
+        """Testa que assinaturas e tamanhos inválidos são recusados."""
+        path = Path(repository.snapshot())
+        data = path.read_bytes()
+
+        path.write_bytes(b"XXXXXX" + data[6:])
+        with pytest.raises(ValueError, match="assinatura"):
+            SnapshotTable.open(str(path))
+
+        path.write_bytes(data[:-1])
+        with pytest.raises(ValueError, match="tamanho"):
+            SnapshotTable.open(str(path))
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("tier_count", 60_000), ("tiers_start", 1 << 40), ("rows", 1 << 20)],
+    )
+    def test_corrupt_sections_read_file(self, repository, field, value):
+        """Testa que seções corrompidas, com o tamanho certo, refazem a tabela."""
+        path = Path(repository.snapshot())
+        data = path.read_bytes()
+        header = list(snapshot._HEADER.unpack_from(data))
+        header[_HEADER_FIELDS.index(field)] = value
+        path.write_bytes(snapshot._HEADER.pack(*header) + data[snapshot._HEADER.size :])
+
+        with pytest.raises(ValueError, match="seções corrompidas"):
+            SnapshotTable.open(str(path))
+        with repository.load_table() as table:
+            assert (table.snapshot_rows, len(table)) == (0, 3)
+
+    def test_write_rejects_more_tiers_than_codes_hold(self, repository, monkeypatch):
+        """Testa que o snapshot recusa níveis além do que os códigos comportam."""
+        monkeypatch.setattr(snapshot, "_MAX_TIERS", 2)
+
+        with pytest.raises(ValueError, match="no máximo 2 níveis"):
+            repository.snapshot()
+
+    def test_snapshot_is_replaced_atomically(self, repository, tmp_path):
+        """Testa que o snapshot é trocado sem deixar temporários."""
+        repository.snapshot()
+        repository.save(Client(name="Ana Lima", email="ana@example.com", tier="gold"))
+        repository.snapshot()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "clientes.txt",
+            "clientes.txt.snap",
+        ]
+        with repository.load_table() as table:
+            assert table.snapshot_rows == 4
+
+    def test_empty_file(self, tmp_path):
+        """Testa o snapshot de um arquivo vazio."""
+        path = tmp_path / "clientes.txt"
+        path.write_text("", encoding="utf-8")
+        repository = FileClientRepository(str(path))
+
+        repository.snapshot()
+
+        with repository.load_table() as table:
+            assert len(table) == 0
+            assert not table.exists("ana@example.com")
+
+    def test_tier_codes_are_translated_between_processes(self, tmp_path):
+        """Testa que os níveis são reinternados por outro processo."""
+        path = tmp_path / "clientes.txt"
+        path.write_text(
+            "Ana Lima,ana@example.com,platina\nCaio Reis,caio@example.com,diamante\n",
+            encoding="utf-8",
+        )
+        FileClientRepository(str(path)).snapshot()
+
+        # O outro processo registra os níveis em outra ordem
+        src_path = str(Path(__file__).resolve().parent.parent / "src")
+        code = (
+            "import json, sys\n"
+            f"sys.path.insert(0, {src_path!r})\n"
+            "from domain.tiers import TIERS\n"
+            "from infrastructure.snapshot import SnapshotTable\n"
+            "TIERS.intern('diamante')\n"
+            f"with SnapshotTable.open({str(path) + '.snap'!r}) as table:\n"
+            "    print(json.dumps([row.tier for row in table]))\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True
+        )
+
+        assert json.loads(completed.stdout) == ["platina", "diamante"]
+
+    def test_secondary_indexes_cover_snapshot_and_tail(self, repository):
+        """Testa as consultas sobre as linhas do snapshot e as acrescentadas."""
+        repository.snapshot()
+        repository.save(Client(name="Ana Lima", email="Ana@Example.com", tier="gold"))
+
+        with repository.load_table() as table:
+            assert [c.name for c in table.find_by_tier("gold")] == [
+                "João Silva",
+                "Ana Lima",
+            ]
+            assert len(table.find_by_domain("EXAMPLE.com")) == 4
+            assert table.find_by_email("ana@example.com").name == "Ana Lima"
+
+            table.append(Client(name="Caio", email="caio@example.com", tier="gold"))
+            assert table.count_by_tier() == {"gold": 3, "silver": 1, "bronze": 1}
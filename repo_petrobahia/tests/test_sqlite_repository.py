@@ -0,0 +1,139 @@
+"""Testes unitários para o repositório de clientes em SQLite."""
+
+import pytest
+
+from domain.entities import Client
+from infrastructure.sqlite_repository import (
+    _SELECT_BY_DOMAIN,
+    _SELECT_BY_EMAIL,
+    _SELECT_BY_TIER,
+    SqliteClientRepository,
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = SqliteClientRepository(str(tmp_path / "clientes.db"), batch_size=2)
+    yield repository
+    repository.close()
+
+
+class TestSqliteClientRepository:
+    """Casos de teste para SqliteClientRepository."""
+
+    def test_save_and_load_all(self, repo):
+        """Testa o salvamento e a leitura na ordem de inserção."""
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+        repo.save(Client(name="Maria Santos", email="maria@example.com", tier="silver"))
+
+        clients = repo.load_all()
+
+        assert [c.name for c in clients] == ["João Silva", "Maria Santos"]
+        assert clients[1].tier == "silver"
+
+    def test_save_duplicate_email_raises_error(self, repo):
+        """Testa que o índice único rejeita emails repetidos."""
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+        with pytest.raises(ValueError, match="já está cadastrado"):
+            repo.save(Client(name="Outro", email="joao@example.com", tier="bronze"))
+
+        assert len(repo.load_all()) == 1
+
+    def test_exists(self, repo):
+        """Testa a verificação de existência por email."""
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+        assert repo.exists("joao@example.com") is True
+        assert repo.exists("maria@example.com") is False
+
+    def test_save_many_reports_duplicates(self, repo):
+        """Testa o salvamento em lote em várias transações."""
+        repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+        clients = [
+            Client(name="Maria Santos", email="maria@example.com", tier="silver"),
+            Client(name="Outro João", email="joao@example.com", tier="bronze"),
+            Client(name="Pedro Costa", email="pedro@example.com", tier="bronze"),
+            Client(name="Maria Dois", email="maria@example.com", tier="gold"),
+        ]
+
+        assert repo.save_many(clients) == [True, False, True, False]
+        assert len(repo.load_all()) == 3
+
+    def test_data_persists_across_connections(self, tmp_path):
+        """Testa que os dados continuam disponíveis após reabrir o banco."""
+        path = str(tmp_path / "clientes.db")
+        with SqliteClientRepository(path) as repo:
+            repo.save(Client(name="João Silva", email="joao@example.com", tier="gold"))
+
+        with SqliteClientRepository(path) as repo:
+            assert repo.exists("joao@example.com") is True
+
+    def test_import_from_file(self, repo, tmp_path):
+        """Testa a importação do formato clientes.txt."""
+        source = tmp_path / "clientes.txt"
+        source.write_text(
+            "João Silva,joao@example.com,gold\n"
+            "LinhaInválida\n"
+            "Maria Santos,maria@example.com,silver\n"
+            "João Repetido,joao@example.com,bronze\n"
+            "Pedro Costa,pedro@example.com,bronze\n",
+            encoding="utf-8",
+        )
+
+        inserted = repo.import_from_file(str(source))
+
+        assert inserted == 3
+        assert [c.email for c in repo.load_all()] == [
+            "joao@example.com",
+            "maria@example.com",
+            "pedro@example.com",
+        ]
+
+    def test_invalid_batch_size_raises_error(self, tmp_path):
+        """Testa que o tamanho de lote deve ser positivo."""
+        with pytest.raises(ValueError, match="O tamanho do lote deve ser positivo"):
+            SqliteClientRepository(str(tmp_path / "clientes.db"), batch_size=0)
+
+    def test_secondary_index_queries(self, repo):
+        """Testa as consultas por nível, domínio e email sem diferenciar caixa."""
+        repo.save_many(
+            [
+                Client(name="João Silva", email="joao@PetroBahia.com", tier="gold"),
+                Client(name="Maria Santos", email="maria@email.com", tier="silver"),
+                Client(name="Pedro Costa", email="pedro@petrobahia.com", tier="gold"),
+            ]
+        )
+
+        assert [c.name for c in repo.find_by_tier("gold")] == [
+            "João Silva",
+            "Pedro Costa",
+        ]
+        assert len(repo.find_by_domain("petrobahia.COM")) == 2
+        assert repo.find_by_email("JOAO@petrobahia.com").name == "João Silva"
+        assert repo.find_by_email("ninguem@email.com") is None
+        assert repo.count_by_tier() == {"gold": 2, "silver": 1}
+
+    def test_queries_use_indexes(self, repo):
+        """Testa que as consultas não percorrem a tabela inteira."""
+        for query in (_SELECT_BY_TIER, _SELECT_BY_DOMAIN, _SELECT_BY_EMAIL):
+            plan = repo._connection.execute(
+                "EXPLAIN QUERY PLAN " + query, ("x",)
+            ).fetchall()
+            assert "USING INDEX" in plan[0][3]
+
+    def test_pagination(self, repo):
+        """Testa load_page e count na ordem de inserção."""
+        repo.save_many(
+            [
+                Client(name=f"Cliente {i}", email=f"c{i}@email.com", tier="gold")
+                for i in range(5)
+            ]
+        )
+
+        page = repo.load_page(2, limit=2)
+
+        assert [c.name for c in page.clients] == ["Cliente 2", "Cliente 3"]
+        assert page.next_cursor == 4
+        assert repo.load_page(4, limit=2).next_cursor is None
+        assert repo.count() == 5
@@ -1,7 +1,10 @@
 """Testes unitários para o serviço calculador de impostos."""
 
+from fractions import Fraction
+
 import pytest
 
+from domain.money import Money, RoundingMode
 from services.tax import TaxCalculator
 
 
@@ -63,3 +66,13 @@ class TestTaxCalculator:
         """Testa o calculador com taxa de imposto zero."""
         calculator = TaxCalculator(tax_rate=0.0)
         assert calculator.apply_tax(100.0) == 100.0
+
+    def test_apply_tax_exact(self):
+        """Testa o imposto exato sobre valores em centavos."""
+        calculator = TaxCalculator(tax_rate=0.0725)
+
+        assert calculator.exact_multiplier == Fraction(429, 400)
+        # 10,00 * 1,0725 = 10,725: o empate é decidido pelo modo
+        price = Money(1000)
+        assert calculator.apply_tax_exact(price) == Money(1072)
+        assert calculator.apply_tax_exact(price, RoundingMode.HALF_UP) == Money(1073)
@@ -0,0 +1,84 @@
+"""Testes unitários para o registro de níveis de cliente."""
+
+import pickle
+
+from domain.entities import Client
+from domain.tiers import TIERS, TierRegistry
+
+
+class VipClient(Client):
+    """Subclasse de Client para testar a serialização."""
+
+    __slots__ = ()
+
+
+class TestTierRegistry:
+    """Casos de teste para TierRegistry."""
+
+    def test_intern_returns_stable_codes(self):
+        """Testa que cada nível recebe um código único e estável."""
+        registry = TierRegistry(("gold", "silver"))
+
+        assert registry.intern("gold") == 0
+        assert registry.intern("silver") == 1
+        assert registry.intern("platinum") == 2
+        assert registry.intern("platinum") == 2
+        assert len(registry) == 3
+
+    def test_code_does_not_register(self):
+        """Testa que a consulta de código não registra níveis novos."""
+        registry = TierRegistry()
+
+        assert registry.code("gold") is None
+        assert len(registry) == 0
+
+    def test_name_returns_tier_text(self):
+        """Testa a conversão do código de volta para o texto do nível."""
+        registry = TierRegistry()
+        code = registry.intern("Gold")
+
+        assert registry.name(code) == "Gold"
+
+
+class TestClientTierCode:
+    """Casos de teste para o código de nível das entidades Client."""
+
+    def test_client_gets_tier_code(self):
+        """Testa que o cliente recebe o código do nível ao ser criado."""
+        client = Client(name="João", email="joao@example.com", tier="gold")
+
+        assert client.tier_code == TIERS.code("gold")
+        assert TIERS.name(client.tier_code) == "gold"
+
+    def test_clients_share_tier_text(self):
+        """Testa que clientes do mesmo nível compartilham o mesmo texto."""
+        tier = "".join(["gol", "d"])
+        first = Client(name="João", email="joao@example.com", tier=tier)
+        second = Client(name="Maria", email="maria@example.com", tier="gold")
+
+        assert first.tier is second.tier
+
+    def test_tier_code_ignored_in_equality_and_repr(self):
+        """Testa que o código não participa da comparação nem do repr."""
+        client = Client(name="João", email="joao@example.com", tier="gold")
+
+        assert "tier_code" not in repr(client)
+        assert client == Client(name="João", email="joao@example.com", tier="gold")
+
+    def test_pickle_reinterns_tier(self):
+        """Testa que a serialização leva o texto do nível, não o código."""
+        client = Client(name="João", email="joao@example.com", tier="diamante")
+
+        restored = pickle.loads(pickle.dumps(client))
+
+        assert restored == client
+        assert restored.tier_code == TIERS.code("diamante")
+
+    def test_pickle_keeps_subclass(self):
+        """Testa que uma subclasse volta como ela mesma, não como Client."""
+        client = VipClient(name="João", email="joao@example.com", tier="gold")
+
+        restored = pickle.loads(pickle.dumps(client))
+
+        assert type(restored) is VipClient
+        assert restored == client
@@ -1,5 +1,7 @@
 """Testes unitários para o serviço de validação."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from domain.entities import Client
@@ -91,3 +93,45 @@ class TestClientValidator:
         with pytest.raises(ValueError, match="O nível do cliente não pode estar vazio"):
             client = Client(name="João Silva", email="joao@example.com", tier=" ")
             validator.validate(client)
+
+    def test_errors_reports_every_problem(self):
+        """Testa que errors lista todos os problemas do cliente."""
+        validator = ClientValidator(EmailValidator())
+        client = SimpleNamespace(name=" ", email="email-invalido", tier="")
+
+        assert validator.errors(client) == [
+            "O nome do cliente não pode estar vazio",
+            "Formato de email inválido",
+            "O nível do cliente não pode estar vazio",
+        ]
+
+    def test_validate_many_returns_errors_per_client(self):
+        """Testa a validação em lote sem exceções."""
+        validator = ClientValidator(EmailValidator())
+        clients = [
+            Client(name="João Silva", email="joao@example.com", tier="gold"),
+            Client(name="Email Ruim", email="email-invalido", tier="gold"),
+        ]
+
+        assert validator.validate_many(clients) == [[], ["Formato de email inválido"]]
+
+    def test_validate_many_with_process_pool_keeps_order(self):
+        """Testa que a validação paralela preserva a ordem de entrada."""
+        validator = ClientValidator(EmailValidator())
+        clients = [
+            Client(name=f"Cliente {i}", email=f"cliente{i}@{domain}", tier="gold")
+            for i, domain in enumerate(
+                ["example.com", "invalido", "example.com", "x", "example.com"]
+            )
+        ]
+
+        errors = validator.validate_many(clients, workers=2, chunk_size=2)
+
+        assert [bool(e) for e in errors] == [False, True, False, True, False]
+
+    def test_validate_many_invalid_chunk_size_raises_error(self):
+        """Testa que o tamanho do bloco deve ser positivo."""
+        validator = ClientValidator(EmailValidator())
+
+        with pytest.raises(ValueError, match="O tamanho do bloco deve ser positivo"):
+            validator.validate_many([], chunk_size=0)